@@ -0,0 +1,7 @@
+"""
+Benchmarks for Vinculum.
+
+Run any benchmark as a module from the repository root. For example:
+
+    python -m benchmarks.int_to_buffer
+"""
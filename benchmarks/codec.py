@@ -0,0 +1,60 @@
+"""
+Compares encoding rational numbers with `Rational.pack` and `unpack` against
+`repr` text parsed by `Rational.from_string`.
+"""
+
+from random import Random
+from timeit import repeat
+
+from vinculum import Rational
+
+NUMBER = 5
+
+CASES = [
+    ("small", 10**6, 10_000),
+    ("64-bit", 2**64, 10_000),
+    ("1,000-digit", 10**1_000, 100),
+]
+
+
+def main() -> None:
+    random = Random(42)
+
+    print(
+        f"{'values':>12} {'text bytes':>11} {'text time':>10} "
+        f"{'binary bytes':>13} {'binary time':>12}"
+    )
+
+    for name, bound, count in CASES:
+        rationals = [
+            Rational(
+                random.randrange(-bound, bound), random.randrange(1, bound)
+            )
+            for _ in range(count)
+        ]
+
+        text = "\n".join(repr(r) for r in rationals)
+        binary = Rational.pack(rationals)
+
+        def text_round_trip() -> None:
+            encoded = "\n".join(repr(r) for r in rationals)
+            _ = [Rational.from_string(s) for s in encoded.split("\n")]
+
+        def binary_round_trip() -> None:
+            _ = list(Rational.unpack(Rational.pack(rationals)))
+
+        text_time, binary_time = (
+            min(repeat(round_trip, number=NUMBER, repeat=5))
+            * 1_000_000
+            / (NUMBER * count)
+            for round_trip in (text_round_trip, binary_round_trip)
+        )
+
+        print(
+            f"{name:>12} {len(text) / count:>11.1f} {text_time:>8.2f}us "
+            f"{len(binary) / count:>13.1f} {binary_time:>10.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
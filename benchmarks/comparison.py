@@ -0,0 +1,57 @@
+"""
+Compares sorting rational numbers with `Rational` comparisons against the
+original comparisons, which built two common-denominator `Rational`
+instances per comparison, and against `fractions.Fraction`.
+"""
+
+from fractions import Fraction
+from random import Random
+from sys import argv
+from time import perf_counter
+from typing import Any, Callable, List
+
+from vinculum import Rational
+
+
+class LegacyRational(Rational):
+    """
+    A `Rational` with the original less-than comparison.
+    """
+
+    __slots__ = ()
+
+    def __lt__(self, other: Any) -> bool:
+        a, b = self.comparable_with_self(other)
+        return a.numerator < b.numerator
+
+
+def seconds_to_sort(values: List[Any]) -> float:
+    start = perf_counter()
+    sorted(values)
+    return perf_counter() - start
+
+
+def main() -> None:
+    count = int(argv[1]) if len(argv) > 1 else 100_000
+    random = Random(42)
+
+    pairs = [
+        (random.randrange(-(10**9), 10**9), random.randrange(1, 10**9))
+        for _ in range(count)
+    ]
+
+    cases: List[tuple[str, Callable[[int, int], Any]]] = [
+        ("Fraction", Fraction),
+        ("original", LegacyRational),
+        ("Rational", Rational),
+    ]
+
+    print(f"Sorting {count:,} values:")
+
+    for name, create in cases:
+        values = [create(n, d) for n, d in pairs]
+        print(f"{name:>9}: {seconds_to_sort(values):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Compares rendering the same rational numbers to decimal strings repeatedly,
+with and without a `DecimalCache`.
+"""
+
+from random import Random
+from timeit import repeat
+
+from vinculum import DecimalCache, Rational, set_decimal_cache
+
+NUMBER = 5
+
+
+def main() -> None:
+    random = Random(42)
+
+    rationals = [
+        Rational(random.randrange(1, 10**6), random.randrange(1, 10**4))
+        for _ in range(50)
+    ]
+
+    # A report renders each value to a few precisions, many times over.
+    renders = [
+        (random.choice(rationals), random.choice([2, 10, 100]))
+        for _ in range(5_000)
+    ]
+
+    def render() -> None:
+        for rational, max_dp in renders:
+            rational.decimal(max_dp=max_dp)
+
+    uncached = min(repeat(render, number=NUMBER, repeat=3)) / NUMBER
+
+    cache = DecimalCache(max_entries=256)
+    set_decimal_cache(cache)
+    cached = min(repeat(render, number=NUMBER, repeat=3)) / NUMBER
+    set_decimal_cache(None)
+
+    print(f"{len(renders):,} renders of {len(rationals)} values")
+    print(f"uncached: {uncached * 1_000:.1f}ms")
+    print(f"  cached: {cached * 1_000:.1f}ms ({cache!r})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compares converting floats to rational numbers with the original
+digit-by-digit loop, the shortest round-trip `repr` and the exact binary
+value.
+"""
+
+from math import modf
+from random import Random
+from timeit import repeat
+
+from vinculum import Rational
+
+FLOATS = 100
+
+NUMBER = 10
+
+
+def legacy_from_float(f: float) -> Rational:
+    """
+    Converts a float as the original digit-by-digit loop did.
+    """
+
+    positive = f >= 0
+    f = abs(f)
+
+    fractional, i = modf(f)
+
+    result = Rational(int(i))
+    over = 10
+
+    while fractional != 0:
+        f *= 10
+        fractional, i = modf(f)
+        digit = int(i) % 10
+        result += Rational(digit, over)
+        over *= 10
+
+    if not positive:
+        result *= -1
+
+    return result
+
+
+def main() -> None:
+    random = Random(42)
+
+    cases = [
+        (
+            "sensor readings",
+            [round(random.uniform(-50, 50), 2) for _ in range(FLOATS)],
+        ),
+        ("random floats", [random.uniform(-50, 50) for _ in range(FLOATS)]),
+    ]
+
+    print(f"{'floats':>16} {'original':>10} {'repr':>10} {'exact':>10}")
+
+    for name, floats in cases:
+        converters = [
+            lambda: [legacy_from_float(f) for f in floats],
+            lambda: [Rational.from_float(f) for f in floats],
+            lambda: [Rational.from_float(f, exact=True) for f in floats],
+        ]
+
+        timings = [
+            min(repeat(converter, number=NUMBER, repeat=5))
+            * 1_000_000
+            / (NUMBER * FLOATS)
+            for converter in converters
+        ]
+
+        print(f"{name:>16} " + " ".join(f"{t:>8.2f}us" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Compares parsing decimal strings with the original parser, which added and
+multiplied intermediate rational numbers before reducing the result.
+"""
+
+from random import Random
+from re import compile  # pylint: disable=redefined-builtin
+from timeit import repeat
+
+from vinculum import Rational, string_to_int
+
+LEGACY_DECIMAL_PATTERN = compile(r"^(-?\d+)(?:\.(\d+))?$")
+
+NUMBER = 10
+
+STRINGS = 1_000
+
+
+def legacy_from_string(string: str) -> Rational:
+    """
+    Parses a decimal string as the original parser did.
+    """
+
+    match = LEGACY_DECIMAL_PATTERN.match(string)
+    assert match is not None
+
+    integral_str, decimal_group = match.groups("")
+
+    if negative := string.startswith("-"):
+        integral_str = integral_str[1:]
+
+    integral = Rational(string_to_int(integral_str))
+
+    if not decimal_group:
+        decimal = Rational.zero()
+    else:
+        decimal = Rational(
+            string_to_int(decimal_group),
+            10 ** len(decimal_group),
+        )
+
+    absolute = integral + decimal
+    multiplier = -1 if negative else 1
+
+    return (absolute * multiplier).reduced
+
+
+def main() -> None:
+    random = Random(42)
+
+    cases = [
+        (
+            "2 places",
+            [f"{random.uniform(-1_000, 1_000):.2f}" for _ in range(STRINGS)],
+        ),
+        (
+            "17 places",
+            [f"{random.uniform(-1_000, 1_000):.17f}" for _ in range(STRINGS)],
+        ),
+    ]
+
+    print(f"{'strings':>10} {'original':>10} {'current':>10}")
+
+    for name, strings in cases:
+        parsers = [
+            lambda: [legacy_from_string(s) for s in strings],
+            lambda: [Rational.from_string(s) for s in strings],
+        ]
+
+        timings = [
+            min(repeat(parser, number=NUMBER, repeat=5))
+            * 1_000_000
+            / (NUMBER * STRINGS)
+            for parser in parsers
+        ]
+
+        print(f"{name:>10} " + " ".join(f"{t:>8.2f}us" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Compares `greatest_common_divisor` with its original pure-Python Euclid loop,
+with no iteration limit, a generous limit and a tight limit, for small,
+64-bit and 10,000-digit operands.
+"""
+
+from logging import getLogger
+from random import Random
+from timeit import repeat
+from typing import Callable
+
+from vinculum import greatest_common_divisor
+
+CASES = [
+    ("small", 10**4, 10_000),
+    ("64-bit", 2**64, 10_000),
+    ("10k-digit", 10**10_000, 3),
+]
+
+PAIRS = 10
+
+log = getLogger("vinculum")
+
+
+def legacy_greatest_common_divisor(
+    a: int,
+    b: int,
+    max_iterations: int | None = None,
+) -> int:
+    """
+    Gets the greatest common divisor as the original Euclid loop did.
+    """
+
+    log.debug(
+        (
+            "Attempting to discover the greatest common divisor of %i and %i "
+            "within %s iterations"
+        ),
+        a,
+        b,
+        "unlimited" if max_iterations is None else max_iterations,
+    )
+
+    biggest = max(a, b)
+    smallest = min(a, b)
+
+    if smallest in (0, biggest):
+        return smallest
+
+    count = 0
+
+    while True:
+        remainder = biggest % smallest
+
+        if remainder == 0:
+            if max_iterations is not None:
+                log.debug(
+                    (
+                        "Found the greatest common divisor of %i and "
+                        "%i (%i) on iteration %i"
+                    ),
+                    a,
+                    b,
+                    smallest,
+                    count,
+                )
+
+            return smallest
+
+        if max_iterations is not None:
+            count += 1
+            if count > max_iterations:
+                log.debug(
+                    (
+                        "Did not find the greatest common divisor of %i and "
+                        "%i within %i iterations"
+                    ),
+                    a,
+                    b,
+                    max_iterations,
+                )
+                return 1
+
+        biggest = smallest
+        smallest = remainder
+
+
+def time_pairs(
+    gcd: Callable[[int, int, int | None], int],
+    pairs: list[tuple[int, int]],
+    max_iterations: int | None,
+    number: int,
+) -> float:
+    """
+    Gets the mean microseconds to find the divisor of one pair.
+    """
+
+    def run() -> None:
+        for a, b in pairs:
+            gcd(a, b, max_iterations)
+
+    seconds = min(repeat(run, number=number, repeat=5))
+    return seconds * 1_000_000 / (number * len(pairs))
+
+
+def main() -> None:
+    random = Random(42)
+
+    print(
+        f"{'operands':>10} {'limit':>9} {'original':>13} {'current':>13} "
+        f"{'speedup':>8}"
+    )
+
+    for name, bound, number in CASES:
+        pairs = []
+
+        for _ in range(PAIRS):
+            common = random.randrange(1, bound)
+            pairs.append(
+                (
+                    random.randrange(1, bound) * common,
+                    random.randrange(1, bound) * common,
+                )
+            )
+
+        # A limit of one iteration per bit is below the bound that lets
+        # `greatest_common_divisor` delegate to `math.gcd`.
+        for max_iterations in (None, 1_000_000, bound.bit_length()):
+            legacy = time_pairs(
+                legacy_greatest_common_divisor,
+                pairs,
+                max_iterations,
+                number,
+            )
+
+            current = time_pairs(
+                greatest_common_divisor,
+                pairs,
+                max_iterations,
+                number,
+            )
+
+            limit = "none" if max_iterations is None else f"{max_iterations:,}"
+
+            print(
+                f"{name:>10} {limit:>9} {legacy:>11.2f}us {current:>11.2f}us "
+                f"{legacy / current:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Compares adding, multiplying and rendering rational numbers with
+instrumentation enabled and disabled.
+"""
+
+from timeit import repeat
+
+from vinculum import Rational, instrument
+
+NUMBER = 20_000
+
+
+def main() -> None:
+    a = Rational(10**20 + 1, 3)
+    b = Rational(7, 10**20 + 3)
+    c = Rational(22, 7)
+
+    cases = [
+        ("a + b", lambda: a + b),
+        ("a + 1", lambda: a + 1),
+        ("a * b", lambda: a * b),
+        ("a < b", lambda: a < b),
+        ("c.decimal()", lambda: c.decimal(max_dp=12)),
+    ]
+
+    print(f"{'':>11} {'instrumented':>13} {'disabled':>9}")
+
+    for name, operation in cases:
+        with instrument():
+            on = min(repeat(operation, number=NUMBER, repeat=5)) / NUMBER
+
+        off = min(repeat(operation, number=NUMBER, repeat=5)) / NUMBER
+
+        print(f"{name:>11} {on * 1e6:>11.2f}us {off * 1e6:>7.2f}us")
+
+
+if __name__ == "__main__":
+    main()
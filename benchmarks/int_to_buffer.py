@@ -0,0 +1,91 @@
+"""
+Compares `int_to_buffer` with its original digit-by-digit implementation.
+
+The original implementation is roughly cubic, so it is only run to completion
+for the smallest number. For larger numbers, it is timed over its first few
+digits only. Each later digit costs more than the earlier ones, so the
+extrapolation is a lower bound of the true run time.
+"""
+
+from io import StringIO
+from sys import argv
+from time import perf_counter
+from typing import List
+
+from vinculum import int_to_buffer
+
+LEGACY_SAMPLE_DIGITS = 500
+
+
+def legacy_int_to_buffer(
+    number: int,
+    buffer: StringIO,
+    max_digits: int | None = None,
+) -> int:
+    """
+    Writes `number` to `buffer` in the original digit-by-digit way.
+
+    Stops after `max_digits` digits, if set. Returns the number of digits
+    written.
+    """
+
+    wip: List[str] = []
+
+    e = 0
+    while (10**e) <= number:
+        if max_digits is not None and e >= max_digits:
+            break
+
+        digit = int(number // 10**e) % 10
+        wip.append(str(digit))
+        e += 1
+
+    for c in reversed(wip):
+        buffer.write(c)
+
+    return e
+
+
+def time_legacy(number: int, digits: int) -> tuple[float, bool]:
+    """
+    Times the original implementation.
+
+    Returns the duration and whether or not it is an extrapolated lower bound.
+    """
+
+    if digits <= 10_000:
+        start = perf_counter()
+        legacy_int_to_buffer(number, StringIO())
+        return perf_counter() - start, False
+
+    start = perf_counter()
+    written = legacy_int_to_buffer(number, StringIO(), LEGACY_SAMPLE_DIGITS)
+    elapsed = perf_counter() - start
+
+    return elapsed * (digits / written), True
+
+
+def time_current(number: int) -> float:
+    start = perf_counter()
+    int_to_buffer(number, StringIO())
+    return perf_counter() - start
+
+
+def main() -> None:
+    sizes = [int(a) for a in argv[1:]] or [10_000, 100_000, 1_000_000]
+
+    print(f"{'digits':>10} {'original':>14} {'current':>10} {'speedup':>10}")
+
+    for digits in sizes:
+        number = pow(10, digits) - 12_345
+        legacy, estimated = time_legacy(number, digits)
+        current = time_current(number)
+
+        legacy_str = f"{'>=' if estimated else ''}{legacy:.3f}s"
+        speedup = f"{'>=' if estimated else ''}{legacy / current:.0f}x"
+
+        print(f"{digits:>10} {legacy_str:>14} {current:>9.3f}s {speedup:>10}")
+
+
+if __name__ == "__main__":
+    main()
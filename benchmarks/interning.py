@@ -0,0 +1,95 @@
+"""
+Compares the memory and time taken to create many small and repeated
+rational numbers with interning against uninterned instances, and with and
+without an intern cache for repeated large values.
+"""
+
+from gc import collect
+from random import Random
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from typing import Callable, List
+
+from vinculum import InternCache, Rational, set_intern_cache
+
+COUNT = 100_000
+
+
+class UninternedRational(Rational):
+    """
+    A `Rational` that is never interned.
+    """
+
+    __slots__ = ()
+
+
+def measure(
+    pairs: List[tuple[int, int]],
+    create: Callable[[int, int], Rational],
+) -> tuple[float, float]:
+    """
+    Gets the mean bytes allocated and microseconds taken to create each
+    instance.
+    """
+
+    collect()
+    start()
+
+    before, _ = get_traced_memory()
+    instances = [create(n, d) for n, d in pairs]
+    after, _ = get_traced_memory()
+
+    stop()
+
+    # The list of instances is excluded.
+    allocated = after - before - (len(instances) * 8)
+
+    # Time is measured without tracing, which slows allocations.
+    del instances
+    collect()
+
+    began = perf_counter()
+    _ = [create(n, d) for n, d in pairs]
+    seconds = perf_counter() - began
+
+    return allocated / COUNT, seconds * 1_000_000 / COUNT
+
+
+def main() -> None:
+    random = Random(42)
+
+    # Prices in cents, and a few thousand distinct large values that recur.
+    small = [(random.randrange(-100, 100), 100) for _ in range(COUNT)]
+    large_values = [
+        (random.randrange(10**20), random.randrange(1, 10**20))
+        for _ in range(1_000)
+    ]
+    large = [random.choice(large_values) for _ in range(COUNT)]
+
+    print(f"{'values':>6} {'interning':>16} {'bytes':>7} {'time':>8}")
+
+    for name, pairs in [("small", small), ("large", large)]:
+        cases = [
+            ("none", UninternedRational),
+            ("table", Rational),
+        ]
+
+        for interning, create in cases:
+            allocated, micros = measure(pairs, create)
+            print(
+                f"{name:>6} {interning:>16} {allocated:>7.1f} "
+                f"{micros:>6.2f}us"
+            )
+
+        set_intern_cache(InternCache(10_000))
+        allocated, micros = measure(pairs, Rational)
+        set_intern_cache(None)
+
+        print(
+            f"{name:>6} {'table and cache':>16} {allocated:>7.1f} "
+            f"{micros:>6.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compares parsing a file of decimals with `Rational.iter_parse` against
+decoding each line and parsing it with `Rational.from_string` and with the
+original parser.
+"""
+
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks.from_string import legacy_from_string
+from vinculum import Rational
+
+RECORDS = 200_000
+
+
+def main() -> None:
+    random = Random(42)
+
+    with TemporaryDirectory() as directory:
+        path = Path(directory) / "decimals.txt"
+
+        with open(path, "w", encoding="utf-8") as file:
+            for _ in range(RECORDS):
+                file.write(f"{random.uniform(-1_000, 1_000):.6f}\n")
+
+        start = perf_counter()
+
+        with open(path, "r", encoding="utf-8") as file:
+            legacy = [legacy_from_string(line.rstrip("\n")) for line in file]
+
+        legacy_seconds = perf_counter() - start
+
+        start = perf_counter()
+
+        with open(path, "r", encoding="utf-8") as file:
+            by_line = [
+                Rational.from_string(line.rstrip("\n")) for line in file
+            ]
+
+        line_seconds = perf_counter() - start
+
+        start = perf_counter()
+        bulk = list(Rational.iter_parse(path))
+        bulk_seconds = perf_counter() - start
+
+    assert bulk == by_line == legacy
+
+    print(f"{'original per line':>17}: {legacy_seconds:.2f}s")
+    print(f"{'per line':>17}: {line_seconds:.2f}s")
+    print(f"{'bulk':>17}: {bulk_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compares the memory allocated per `Rational` instance with the original
+`__dict__`-based class, before and after the cached properties are filled.
+"""
+
+from gc import collect
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any, Callable, List
+
+from vinculum import Rational
+
+COUNT = 100_000
+
+
+class LegacyRational:
+    """
+    A rational number as the original `__dict__`-based class recorded it.
+    """
+
+    def __init__(self, numerator: int, denominator: int = 1) -> None:
+        self._numerator = numerator
+        self._denominator = denominator
+
+        if self._denominator < 0:
+            self._denominator = abs(self._denominator)
+            self._numerator = self._numerator * -1
+
+
+def bytes_per_instance(create: Callable[[int], Any]) -> float:
+    """
+    Gets the mean number of bytes allocated to create each instance.
+    """
+
+    collect()
+    start()
+
+    before, _ = get_traced_memory()
+    instances: List[Any] = [create(i) for i in range(COUNT)]
+    after, _ = get_traced_memory()
+
+    stop()
+
+    # The list of instances is excluded.
+    return (after - before - (len(instances) * 8)) / COUNT
+
+
+def main() -> None:
+    # The same integers are shared by every instance so that only the
+    # instances themselves are measured.
+    numerators = list(range(COUNT))
+
+    def rational_with_cache(i: int) -> Rational:
+        rational = Rational(numerators[i], 7)
+        _ = rational.integral
+        return rational
+
+    results = [
+        ("original", lambda i: LegacyRational(numerators[i], 7)),
+        ("slots", lambda i: Rational(numerators[i], 7)),
+        ("slots with cached integral", rational_with_cache),
+    ]
+
+    for name, create in results:
+        print(f"{name:>26}: {bytes_per_instance(create):>6.1f} bytes")
+
+
+if __name__ == "__main__":
+    main()
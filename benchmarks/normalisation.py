@@ -0,0 +1,72 @@
+"""
+Compares summing 100,000 random fractions under each normalisation policy,
+and with the original addition that multiplied denominators together.
+"""
+
+from random import Random
+from time import perf_counter
+from typing import List, Tuple
+
+from vinculum import Normalisation, Rational, normalisation
+
+COUNT = 100_000
+
+POLICIES = [
+    ("lazy", Normalisation.lazy()),
+    ("eager", Normalisation.eager()),
+    ("over 64 bits", Normalisation(64)),
+    ("over 1,024 bits", Normalisation(1_024)),
+]
+
+
+def legacy_sum(fractions: List[Tuple[int, int]]) -> Tuple[int, int]:
+    """
+    Sums fractions as the original `Rational.__add__` did.
+    """
+
+    total_n, total_d = 0, 1
+
+    for n, d in fractions:
+        if total_d == d:
+            total_n += n
+        else:
+            total_n = (total_n * d) + (n * total_d)
+            total_d *= d
+
+    return total_n, total_d
+
+
+def main() -> None:
+    random = Random(42)
+
+    fractions = [
+        (random.randint(-1_000, 1_000), random.randint(1, 1_000))
+        for _ in range(COUNT)
+    ]
+
+    rationals = [Rational(n, d) for n, d in fractions]
+
+    print(f"{'policy':>16} {'seconds':>8} {'denominator bits':>17}")
+
+    start = perf_counter()
+    _, d = legacy_sum(fractions)
+    elapsed = perf_counter() - start
+
+    print(f"{'original':>16} {elapsed:>8.2f} {d.bit_length():>17,}")
+
+    for name, policy in POLICIES:
+        with normalisation(policy):
+            start = perf_counter()
+
+            total = Rational(0)
+            for rational in rationals:
+                total += rational
+
+            elapsed = perf_counter() - start
+
+        bits = total.denominator.bit_length()
+        print(f"{name:>16} {elapsed:>8.2f} {bits:>17,}")
+
+
+if __name__ == "__main__":
+    main()
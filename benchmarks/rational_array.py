@@ -0,0 +1,69 @@
+"""
+Compares adding, multiplying, comparing and summing columns of prices as
+lists of `Rational` and as `RationalArray`s.
+"""
+
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from vinculum import Rational
+from vinculum.rational_array import RationalArray
+
+
+def main() -> None:
+    count = int(argv[1]) if len(argv) > 1 else 100_000
+    random = Random(42)
+
+    prices = [
+        Rational(random.randrange(1, 10**6), 100) for _ in range(count)
+    ]
+
+    rates = [Rational(random.randrange(0, 100), 1_000) for _ in range(count)]
+
+    price_array = RationalArray.from_rationals(prices)
+    rate_array = RationalArray.from_rationals(rates)
+
+    cases = [
+        (
+            "a + b",
+            lambda: [a + b for a, b in zip(prices, rates)],
+            lambda: price_array + rate_array,
+        ),
+        (
+            "a * b",
+            lambda: [a * b for a, b in zip(prices, rates)],
+            lambda: price_array * rate_array,
+        ),
+        (
+            "a < b",
+            lambda: [a < b for a, b in zip(prices, rates)],
+            lambda: price_array < rate_array,
+        ),
+        (
+            "sum",
+            lambda: sum(prices, Rational(0)),
+            lambda: price_array.sum(),
+        ),
+    ]
+
+    print(f"{count:,} values")
+    print(f"{'':>6} {'Rational':>10} {'RationalArray':>14}")
+
+    for name, plain, vectorised in cases:
+        start = perf_counter()
+        plain()
+        plain_seconds = perf_counter() - start
+
+        start = perf_counter()
+        vectorised()
+        vectorised_seconds = perf_counter() - start
+
+        print(
+            f"{name:>6} {plain_seconds * 1e3:>8.1f}ms "
+            f"{vectorised_seconds * 1e3:>12.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Compares the time and memory taken to load a persisted column of rational
+numbers by unpacking `Rational.pack` bytes and by mapping a saved
+`RationalColumn`.
+"""
+
+from pathlib import Path
+from random import Random
+from sys import argv
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+
+from vinculum import Rational, RationalColumn
+
+
+def main() -> None:
+    count = int(argv[1]) if len(argv) > 1 else 1_000_000
+    random = Random(42)
+
+    rationals = [
+        Rational(
+            random.randrange(-(10**9), 10**9), random.randrange(1, 10**4)
+        )
+        for _ in range(count)
+    ]
+
+    with TemporaryDirectory() as directory:
+        packed_path = Path(directory) / "packed"
+        packed_path.write_bytes(Rational.pack(rationals))
+
+        column_path = Path(directory) / "column"
+        RationalColumn(rationals).save(column_path)
+
+        del rationals
+
+        start()
+        started = perf_counter()
+        unpacked = list(Rational.unpack(packed_path.read_bytes()))
+        unpack_seconds = perf_counter() - started
+        _, unpack_peak = get_traced_memory()
+        stop()
+
+        del unpacked
+
+        start()
+        started = perf_counter()
+        column = RationalColumn.open(column_path)
+        open_seconds = perf_counter() - started
+        _, open_peak = get_traced_memory()
+        stop()
+
+        started = perf_counter()
+
+        for index in range(0, count, max(count // 10_000, 1)):
+            column[index]
+
+        read_seconds = perf_counter() - started
+        column.close()
+
+    print(f"{count:,} values")
+    print(
+        f"unpack:  {unpack_seconds * 1e3:>9.1f}ms "
+        f"{unpack_peak / 2**20:>8.1f} MiB"
+    )
+    print(
+        f"open:    {open_seconds * 1e3:>9.3f}ms "
+        f"{open_peak / 2**20:>8.3f} MiB"
+    )
+    print(f"10,000 strided reads: {read_seconds * 1e3:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Compares sorting and binary-searching rational numbers with `sort_key` and
+`SortedRationals` against plain `sorted()`, `bisect` and `insort` on lists of
+`Rational` instances.
+"""
+
+from bisect import bisect_left, insort
+from random import Random
+from sys import argv
+from time import perf_counter
+
+from vinculum import Rational, SortedRationals, sort_key
+
+
+def main() -> None:
+    count = int(argv[1]) if len(argv) > 1 else 100_000
+    random = Random(42)
+
+    rationals = [
+        Rational(
+            random.randrange(-(10**9), 10**9), random.randrange(1, 10**9)
+        )
+        for _ in range(count)
+    ]
+
+    probes = random.sample(rationals, min(count, 10_000))
+
+    start = perf_counter()
+    plain = sorted(rationals)
+    plain_sort = perf_counter() - start
+
+    start = perf_counter()
+    keyed = sorted(rationals, key=sort_key)
+    keyed_sort = perf_counter() - start
+
+    assert keyed == plain
+
+    start = perf_counter()
+    plain_found = [bisect_left(plain, probe) for probe in probes]
+    plain_bisect = perf_counter() - start
+
+    collection = SortedRationals(rationals)
+
+    start = perf_counter()
+    keyed_found = [collection.bisect_left(probe) for probe in probes]
+    keyed_bisect = perf_counter() - start
+
+    assert keyed_found == plain_found
+
+    start = perf_counter()
+    plain_list: list[Rational] = []
+    for probe in probes:
+        insort(plain_list, probe)
+    plain_insert = perf_counter() - start
+
+    start = perf_counter()
+    keyed_collection = SortedRationals()
+    for probe in probes:
+        keyed_collection.add(probe)
+    keyed_insert = perf_counter() - start
+
+    assert list(keyed_collection) == plain_list
+
+    print(f"{count:,} values, {len(probes):,} probes")
+    print(f"{'':>8} {'plain':>8} {'keyed':>8}")
+    print(f"{'sort':>8} {plain_sort:>7.2f}s {keyed_sort:>7.2f}s")
+    print(f"{'bisect':>8} {plain_bisect:>7.2f}s {keyed_bisect:>7.2f}s")
+    print(f"{'insert':>8} {plain_insert:>7.2f}s {keyed_insert:>7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Compares rendering terminating decimals through the scaling fast path in
+`Rational.decimal` with the long division that `iter_digits` uses, and with
+the original digit-by-digit loop.
+"""
+
+from io import StringIO
+from timeit import repeat
+from typing import List
+
+from vinculum import Rational, int_to_buffer
+
+CASES = [
+    (12_345, 100, 10_000),
+    (12_345, 1_000, 10_000),
+    (-987_654_321, 100_000, 10_000),
+    (12_345, 2**10, 10_000),
+    (12_345, 2**64, 1_000),
+    (12_345, 2**500, 100),
+]
+
+
+def legacy_decimal(numerator: int, denominator: int) -> str:
+    """
+    Renders a decimal string as the original digit-by-digit loop did.
+    """
+
+    result = StringIO()
+
+    integral = abs(numerator) // denominator
+    if numerator < 0:
+        integral *= -1
+
+    int_to_buffer(integral, result)
+    result.write(".")
+
+    recursion_track: List[int] = []
+    remainder = (abs(numerator) % denominator) * 10
+
+    added_non_zero = False
+    decimal_places = 0
+    fractional = 0
+    leading_zeros = 0
+
+    while True:
+        i = remainder // denominator
+        remainder = (remainder % denominator) * 10
+
+        if remainder in recursion_track:
+            break
+
+        fractional = (fractional * 10) + i
+
+        if i > 0:
+            added_non_zero = True
+        elif not added_non_zero:
+            leading_zeros += 1
+
+        decimal_places += 1
+
+        if remainder == 0 or decimal_places >= 1_000:
+            break
+
+        recursion_track.append(remainder)
+
+    int_to_buffer(fractional, result, leading_zeros=leading_zeros)
+    return result.getvalue()
+
+
+def division_decimal(rational: Rational) -> str:
+    """
+    Renders a decimal string through long division.
+    """
+
+    return "".join(digits for _, digits in rational.iter_digits(1_000))
+
+
+def main() -> None:
+    print(f"{'value':>20} {'original':>10} {'division':>10} {'fast path':>10}")
+
+    for numerator, denominator, number in CASES:
+        rational = Rational(numerator, denominator)
+
+        renderers = [
+            lambda: legacy_decimal(numerator, denominator),
+            lambda: division_decimal(rational),
+            lambda: rational.decimal(max_dp=1_000),
+        ]
+
+        timings = [
+            min(repeat(renderer, number=number, repeat=5))
+            for renderer in renderers
+        ]
+
+        name = f"{numerator}/{denominator}"
+        if len(name) > 20:
+            name = f"{numerator}/2^{denominator.bit_length() - 1}"
+
+        print(
+            f"{name:>20} "
+            + " ".join(f"{t * 1_000_000 / number:>8.2f}us" for t in timings)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Compares adding and multiplying rational numbers with tracing enabled and
+disabled, while the "vinculum" logger is not logging debug messages.
+"""
+
+from timeit import repeat
+
+from vinculum import Rational, disable_tracing, enable_tracing
+
+NUMBER = 100_000
+
+
+def main() -> None:
+    a = Rational(10**20 + 1, 3)
+    b = Rational(7, 10**20 + 3)
+
+    cases = [
+        ("a + b", lambda: a + b),
+        ("a + 1", lambda: a + 1),
+        ("a * b", lambda: a * b),
+        ("a * 3", lambda: a * 3),
+    ]
+
+    print(f"{'':>6} {'tracing on':>11} {'tracing off':>12}")
+
+    for name, operation in cases:
+        enable_tracing()
+        on = min(repeat(operation, number=NUMBER, repeat=5)) / NUMBER
+
+        disable_tracing()
+        off = min(repeat(operation, number=NUMBER, repeat=5)) / NUMBER
+
+        print(f"{name:>6} {on * 1e6:>9.2f}us {off * 1e6:>10.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,9 @@ setup(
     author_email="cariad@cariad.earth",
     classifiers=classifiers,
     description="Large numbers with high precision",
+    extras_require={
+        "numpy": ["numpy>=1.24"],
+    },
     include_package_data=True,
     license="MIT",
     long_description=long_description,
@@ -1,3 +1,5 @@
+from vinculum import enable_tracing
 from vinculum.log import log
 
+enable_tracing()
 log.setLevel("DEBUG")
@@ -0,0 +1,58 @@
+from pytest import mark, raises
+
+from vinculum.codec import read_pair, write_pair
+
+
+@mark.parametrize(
+    "numerator, denominator, expect",
+    [
+        (0, 1, b"\x01\x00\x01\x01"),
+        (1, 0, b"\x01\x01\x00"),
+        (-1, 3, b"\x01\xff\x01\x03"),
+        (127, 1, b"\x01\x7f\x01\x01"),
+        (128, 1, b"\x02\x80\x00\x01\x01"),
+        (-128, 1, b"\x01\x80\x01\x01"),
+        (-129, 1, b"\x02\x7f\xff\x01\x01"),
+        (1, 256, b"\x01\x01\x02\x00\x01"),
+    ],
+)
+def test_pair(numerator: int, denominator: int, expect: bytes) -> None:
+    buffer = bytearray()
+    write_pair(buffer, numerator, denominator)
+    assert buffer == expect
+
+    assert read_pair(expect) == (numerator, denominator, len(expect))
+
+
+def test_pair__big() -> None:
+    numerator = -pow(3, 100_000)
+    denominator = pow(2, 1_000) + 1
+
+    buffer = bytearray(b"prefix")
+    write_pair(buffer, numerator, denominator)
+
+    # The numerator's length needs a multiple-byte varint.
+    assert buffer[6] & 0x80
+
+    assert read_pair(memoryview(buffer), 6) == (
+        numerator,
+        denominator,
+        len(buffer),
+    )
+
+
+@mark.parametrize(
+    "data, expect",
+    [
+        (b"", "Unexpected end of data at byte 0"),
+        (b"\x80", "Unexpected end of data at byte 1"),
+        (b"\x02\x00", "Unexpected end of data at byte 2"),
+        (b"\x01\x00", "Unexpected end of data at byte 2"),
+        (b"\x01\x00\x01", "Unexpected end of data at byte 3"),
+    ],
+)
+def test_read_pair__truncated(data: bytes, expect: str) -> None:
+    with raises(ValueError) as ex:
+        read_pair(data)
+
+    assert str(ex.value) == expect
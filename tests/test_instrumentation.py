@@ -0,0 +1,279 @@
+from io import StringIO
+from threading import Event, Thread
+from typing import Iterator
+
+from pytest import fixture, warns
+
+from vinculum import (
+    Instrumentation,
+    Rational,
+    SizeWarning,
+    get_instrumentation,
+    greatest_common_divisor,
+    instrument,
+    int_to_buffer,
+    set_instrumentation,
+    string_to_int,
+)
+
+
+@fixture(autouse=True)
+def restore_instrumentation() -> Iterator[None]:
+    instrumentation = get_instrumentation()
+    yield
+    set_instrumentation(instrumentation)
+
+
+def test_disabled() -> None:
+    instrumentation = Instrumentation()
+
+    with instrument(instrumentation):
+        pass
+
+    _ = Rational(1, 2) + Rational(1, 3)
+
+    assert get_instrumentation() is None
+    assert instrumentation.snapshot() == {
+        "calls": {},
+        "fallbacks": {},
+        "operand_bits": {},
+        "result_bits": {},
+        "seconds": {},
+        "shortcuts": {},
+    }
+
+
+def test_instrument__calls() -> None:
+    with instrument() as instrumentation:
+        _ = Rational(1, 2) + Rational(1, 3)
+        _ = Rational(1, 2) + 0
+        _ = Rational(1, 2) * 1
+        _ = Rational(1, 2) * "3"
+        _ = Rational(1, 2) / Rational(1, 3)
+        _ = Rational(1, 2) // Rational(1, 3)
+        _ = Rational(1, 2) < Rational(1, 3)
+
+    snapshot = instrumentation.snapshot()
+
+    assert snapshot["calls"] == {
+        "__add__": 2,
+        "__floordiv__": 1,
+        "__lt__": 1,
+        "__mul__": 2,
+        "__truediv__": 1,
+        "from_string": 1,
+        "reduce": 1,
+    }
+
+    assert snapshot["shortcuts"] == {
+        "__add__ 0": 1,
+        "__mul__ 1": 1,
+        "reduce known": 1,
+    }
+
+    assert snapshot["fallbacks"] == {"__mul__": 1}
+
+
+def test_instrument__calls_with_rational_operands() -> None:
+    with instrument() as instrumentation:
+        _ = Rational(1, 2) + Rational(0)
+        _ = Rational(1, 2) - Rational(0)
+        _ = Rational(1, 2) * Rational(1)
+        _ = Rational(1, 2) / Rational(1, 3)
+        _ = 2 // Rational(1, 3)
+
+    assert instrumentation.snapshot()["calls"] == {
+        "__add__": 1,
+        "__mul__": 1,
+        "__rfloordiv__": 1,
+        "__sub__": 1,
+        "__truediv__": 1,
+    }
+
+
+def test_instrument__nested() -> None:
+    with instrument() as outer:
+        with instrument() as inner:
+            assert get_instrumentation() is inner
+
+        assert get_instrumentation() is outer
+
+    assert get_instrumentation() is None
+
+
+def test_instrument__other_thread() -> None:
+    def work() -> None:
+        _ = Rational(1, 2) + Rational(1, 3)
+
+    with instrument() as instrumentation:
+        thread = Thread(target=work)
+        thread.start()
+        thread.join()
+
+        _ = Rational(1, 2) * Rational(1, 3)
+
+    assert instrumentation.snapshot()["calls"] == {"__mul__": 1}
+
+
+def test_instrument__concurrent() -> None:
+    entered = Event()
+    exit_thread = Event()
+    in_thread: list[Instrumentation] = []
+
+    def work() -> None:
+        with instrument() as instrumentation:
+            in_thread.append(instrumentation)
+            entered.set()
+            exit_thread.wait()
+
+            _ = Rational(1, 2) + Rational(1, 3)
+
+    thread = Thread(target=work)
+    thread.start()
+    entered.wait()
+
+    with instrument() as instrumentation:
+        exit_thread.set()
+        thread.join()
+
+        assert get_instrumentation() is instrumentation
+        _ = Rational(1, 2) * Rational(1, 3)
+
+    assert get_instrumentation() is None
+    assert instrumentation.snapshot()["calls"] == {"__mul__": 1}
+    assert in_thread[0].snapshot()["calls"] == {"__add__": 1}
+
+
+def test_instrument__timing() -> None:
+    with instrument() as instrumentation:
+        Rational(1, 7).decimal()
+        greatest_common_divisor(1806, 189, max_iterations=10)
+        int_to_buffer(12345, StringIO())
+        string_to_int("12345")
+
+    seconds = instrumentation.snapshot()["seconds"]
+
+    assert set(seconds) == {
+        "decimal",
+        "greatest_common_divisor",
+        "int_to_buffer",
+        "string_to_int",
+    }
+
+    assert all(value > 0 for value in seconds.values())
+
+
+def test_repr() -> None:
+    with instrument() as instrumentation:
+        _ = Rational(1, 2) + 0
+
+    assert repr(instrumentation).startswith(
+        "Instrumentation(calls=1, shortcuts=1, fallbacks=0, seconds="
+    )
+
+
+def test_set_instrumentation() -> None:
+    instrumentation = Instrumentation()
+    set_instrumentation(instrumentation)
+
+    with instrument() as inner:
+        _ = Rational(1, 2) + Rational(1, 3)
+
+    _ = Rational(1, 2) * Rational(1, 3)
+
+    assert get_instrumentation() is instrumentation
+    assert inner.snapshot()["calls"] == {"__add__": 1}
+    assert instrumentation.snapshot()["calls"] == {"__mul__": 1}
+
+
+def test_snapshot__reset() -> None:
+    with instrument() as instrumentation:
+        _ = Rational(1, 2) + 0
+
+    assert instrumentation.snapshot(reset=True)["calls"] == {"__add__": 1}
+    assert instrumentation.snapshot()["calls"] == {}
+
+
+def test_sizes() -> None:
+    with instrument() as instrumentation:
+        _ = Rational(1, 3) + Rational(1, 2**40)
+        _ = Rational(3, 5) * 7
+        _ = 2 * Rational(1, 2**100 + 1)
+        _ = Rational(1, 3) - "0.5"
+
+    snapshot = instrumentation.snapshot()
+
+    assert snapshot["operand_bits"] == {
+        "__add__ 2": 1,
+        "__add__ 64": 1,
+        "__mul__ 4": 2,
+        "__rmul__ 2": 1,
+        "__rmul__ 128": 1,
+        "__sub__ 2": 1,
+    }
+
+    assert snapshot["result_bits"] == {
+        "__add__ 64": 1,
+        "__mul__ 8": 1,
+        "__rmul__ 128": 1,
+        "__sub__ 4": 1,
+    }
+
+
+def test_sizes__callback() -> None:
+    exceeded: list[tuple[str, int, Rational]] = []
+
+    def on_size_exceeded(operation: str, bits: int, result: Rational) -> None:
+        exceeded.append((operation, bits, result))
+
+    instrumentation = Instrumentation(
+        size_threshold=64,
+        on_size_exceeded=on_size_exceeded,
+    )
+
+    with instrument(instrumentation):
+        a = Rational(1, 2**40 + 1)
+        b = a * a
+        _ = a + a
+
+    assert exceeded == [("__mul__", 81, b)]
+
+
+def test_sizes__warning() -> None:
+    a = Rational(1, 2**40 + 1)
+
+    with instrument(Instrumentation(size_threshold=64)):
+        with warns(SizeWarning, match="__mul__ produced a 81-bit result"):
+            _ = a * a
+
+
+def test_sizes__division() -> None:
+    with instrument() as instrumentation:
+        _ = Rational(1, 3) / Rational(2, 5)
+        _ = 7 / Rational(3, 5)
+
+    snapshot = instrumentation.snapshot()
+
+    assert snapshot["operand_bits"] == {
+        "__truediv__ 2": 1,
+        "__truediv__ 4": 1,
+        "__rtruediv__ 4": 2,
+    }
+
+    assert snapshot["result_bits"] == {
+        "__truediv__ 4": 1,
+        "__rtruediv__ 8": 1,
+    }
+
+
+def test_sizes__division_warning() -> None:
+    a = Rational(1, 2**40 + 1)
+
+    with instrument(Instrumentation(size_threshold=64)):
+        with warns(
+            SizeWarning,
+            match="__truediv__ produced a 81-bit result",
+        ) as record:
+            _ = a / Rational(2**40 + 1)
+
+    assert record[0].filename == __file__
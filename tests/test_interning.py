@@ -0,0 +1,107 @@
+from typing import Iterator
+
+from pytest import fixture, importorskip, mark, raises
+
+from vinculum import InternCache, Rational, get_intern_cache, set_intern_cache
+
+
+@fixture(autouse=True)
+def restore_cache() -> Iterator[None]:
+    cache = get_intern_cache()
+    yield
+    set_intern_cache(cache)
+
+
+def test_clear() -> None:
+    cache = InternCache(2)
+    cache.put((1, 1000), "a")
+    cache.get((1, 1000))
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_get__evicts_least_recently_used() -> None:
+    cache = InternCache(2)
+    cache.put((1, 1000), "a")
+    cache.put((2, 1000), "b")
+
+    assert cache.get((1, 1000)) == "a"
+
+    cache.put((3, 1000), "c")
+
+    assert cache.get((1, 1000)) == "a"
+    assert cache.get((2, 1000)) is None
+    assert cache.get((3, 1000)) == "c"
+    assert len(cache) == 2
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+
+def test_init__too_small() -> None:
+    with raises(ValueError) as ex:
+        InternCache(0)
+
+    assert str(ex.value) == "Maximum size 0 is less than 1"
+
+
+def test_intern__cache() -> None:
+    set_intern_cache(InternCache(10))
+
+    assert Rational(10**20, 3) is Rational(10**20, 3)
+    assert Rational.from_string("1234.5") is Rational(2469, 2)
+
+
+def test_intern__no_cache() -> None:
+    set_intern_cache(None)
+
+    assert Rational(10**20, 3) is not Rational(10**20, 3)
+
+
+@mark.parametrize("cache", [None, InternCache(10)])
+@mark.parametrize("numerator", [100, 1_000])
+def test_intern__integer_like(
+    cache: InternCache | None,
+    numerator: int,
+) -> None:
+    numpy = importorskip("numpy")
+    set_intern_cache(cache)
+
+    Rational(numpy.int64(numerator), numpy.int64(1))
+    rational = Rational(numerator)
+
+    assert type(rational.numerator) is int
+    assert rational * 2**62 == Rational(numerator * 2**62)
+
+
+def test_intern__not_integer() -> None:
+    with raises(TypeError):
+        Rational(1.0, 2)  # type: ignore[arg-type]
+
+
+def test_intern__small() -> None:
+    assert Rational(1, 2) is Rational(1, 2)
+    assert Rational(-1, -2) is Rational(1, 2)
+    assert Rational.from_string("0.5") is Rational(1, 2)
+    assert Rational.from_any(3) is Rational(3)
+    assert Rational(2, 4) is not Rational(1, 2)
+    assert Rational(2, 4).reduced is Rational(1, 2)
+
+
+def test_intern__subclass() -> None:
+    class SubRational(Rational):
+        __slots__ = ()
+
+    assert type(SubRational(1, 2)) is SubRational
+    assert SubRational(1, 2) is not SubRational(1, 2)
+
+
+def test_repr() -> None:
+    cache = InternCache(2)
+    cache.put((1, 1000), "a")
+    cache.get((1, 1000))
+
+    assert repr(cache) == "InternCache(maxsize=2, size=1, hits=1, misses=0)"
@@ -1,8 +1,72 @@
 from io import StringIO
 
-from pytest import mark
+from pytest import mark, raises
 
-from vinculum import greatest_common_divisor, int_to_buffer
+from vinculum import (
+    euclid_steps,
+    fractional_digits,
+    greatest_common_divisor,
+    int_to_buffer,
+    string_to_int,
+    terminating_digits,
+)
+from vinculum.math import _decimal_period, _multiplicative_order
+
+
+@mark.parametrize(
+    "numerator, denominator, max_period, expect",
+    [
+        (1, 2, None, (1, 0)),
+        (1, 3, None, (0, 1)),
+        (1, 6, None, (1, 1)),
+        (3, 6, None, (1, 0)),
+        (1, 7, None, (0, 6)),
+        (1, 7, 5, (0, None)),
+        (1, 7, 0, (0, None)),
+        (1, 2**10 * 5**3 * 7, None, (10, 6)),
+        (1, 5**40, None, (40, 0)),
+    ],
+)
+def test_decimal_period(
+    numerator: int,
+    denominator: int,
+    max_period: int | None,
+    expect: tuple[int, int | None],
+) -> None:
+    assert _decimal_period(numerator, denominator, max_period) == expect
+
+
+def test_decimal_period__unbounded() -> None:
+    with raises(ValueError):
+        _decimal_period(1, 1_000_000_000_039)
+
+    assert _decimal_period(1, 1_000_000_000_039, 10) == (0, None)
+
+
+def test_decimal_period__zero() -> None:
+    with raises(ValueError) as ex:
+        _decimal_period(1, 0)
+
+    assert str(ex.value) == "Denominator 0 is not positive"
+
+
+@mark.parametrize(
+    "numerator, denominator, count, expect",
+    [
+        (1, 3, 0, []),
+        (1, 3, 3, ["333"]),
+        (1, 8, 5, ["12500"]),
+        (7, 3, 2, ["33"]),
+        (1, 7, 2_000, ["142857" * 170 + "1428", "5714" + "285714" * 162]),
+    ],
+)
+def test_fractional_digits(
+    numerator: int,
+    denominator: int,
+    count: int,
+    expect: list[str],
+) -> None:
+    assert list(fractional_digits(numerator, denominator, count)) == expect
 
 
 @mark.parametrize(
@@ -17,7 +81,248 @@ def test_greatest_common_divisor(a: int, b: int, expect: int) -> None:
     assert greatest_common_divisor(a, b) == expect
 
 
+@mark.parametrize(
+    "a, b, max_iterations, expect",
+    [
+        (1806, 189, 2, 1),
+        (1806, 189, 3, 21),
+        (189, 1806, 3, 21),
+        (-1806, 189, 3, 21),
+        (45, 300, 0, 1),
+        (45, 90, 0, 45),
+        (
+            pow(2, 200) * 3 * pow(7, 40),
+            pow(2, 190) * 5 * pow(7, 41),
+            None,
+            pow(2, 190) * pow(7, 40),
+        ),
+        (
+            pow(2, 200) * 3 * pow(7, 40),
+            pow(2, 190) * 5 * pow(7, 41),
+            1_000,
+            pow(2, 190) * pow(7, 40),
+        ),
+        (
+            pow(2, 200) * 3 * pow(7, 40),
+            pow(2, 190) * 5 * pow(7, 41),
+            3,
+            1,
+        ),
+    ],
+)
+def test_greatest_common_divisor__max_iterations(
+    a: int,
+    b: int,
+    max_iterations: int | None,
+    expect: int,
+) -> None:
+    assert greatest_common_divisor(a, b, max_iterations) == expect
+
+
+@mark.parametrize(
+    "a, b, max_steps",
+    [
+        (1806, 189, 1),
+        (1806, 189, 100),
+        (pow(3, 5_000), pow(2, 7_000), 1),
+        (pow(3, 5_000), pow(2, 7_000), 7),
+        (pow(3, 5_000), pow(2, 7_000), 100),
+        (pow(3, 5_000), pow(2, 7_000), 10_000),
+    ],
+)
+def test_euclid_steps(a: int, b: int, max_steps: int) -> None:
+    result_a, result_b, steps = euclid_steps(a, b, max_steps)
+
+    expect_a, expect_b = a, b
+    for _ in range(steps):
+        expect_a, expect_b = expect_b, expect_a % expect_b
+
+    assert steps <= max_steps
+    assert (result_a, result_b) == (expect_a, expect_b)
+    assert steps == max_steps or result_b == 0
+
+
+@mark.parametrize(
+    "base, modulus, max_order, expect",
+    [
+        (10, 1, None, 1),
+        (10, 3, None, 1),
+        (10, 7, None, 6),
+        (10, 7, 6, 6),
+        (10, 7, 5, None),
+        (10, 81, None, 9),
+        (3, 2**10, None, 256),
+        (10, 999_983, None, 999_982),
+        # Too large to factorise by trial division:
+        (10, 1_000_003, 200_000, 166_667),
+        (10, 1_000_003, 166_666, None),
+        (10, 1_000_003 * 1_000_033, 100, None),
+        (10, 1_000_003 * 1_000_033, 1_000, None),
+        # Searched directly:
+        (10, 999_983, 128, None),
+        (10, 41, 5, 5),
+    ],
+)
+def test_multiplicative_order(
+    base: int,
+    modulus: int,
+    max_order: int | None,
+    expect: int | None,
+) -> None:
+    assert _multiplicative_order(base, modulus, max_order) == expect
+
+
+def test_multiplicative_order__unbounded() -> None:
+    with raises(ValueError) as ex:
+        _multiplicative_order(10, 1_000_000_000_039)
+
+    assert str(ex.value) == (
+        "1000000000039 cannot be factorised by trial division; set max_order "
+        "to bound the search"
+    )
+
+
+def test_multiplicative_order__not_coprime() -> None:
+    with raises(ValueError) as ex:
+        _multiplicative_order(10, 6)
+
+    assert str(ex.value) == "10 and 6 are not coprime"
+
+
 def test_int_to_buffer__leading() -> None:
     buffer = StringIO()
     int_to_buffer(300, buffer, leading_zeros=3)
     assert buffer.getvalue() == "000300"
+
+
+@mark.parametrize(
+    "number, leading_zeros, recurring_count, expect",
+    [
+        (0, 0, 0, "0"),
+        (0, 3, 0, "000"),
+        (7, 0, 0, "7"),
+        (-7, 2, 0, "-007"),
+        (81, 0, 2, "̇8̇1"),
+        (142857, 0, 6, "".join(f"̇{c}" for c in "142857")),
+        (16, 0, 1, "1̇6"),
+        (99, 2, 4, "̇0̇0̇9̇9"),
+    ],
+)
+def test_int_to_buffer(
+    number: int,
+    leading_zeros: int,
+    recurring_count: int,
+    expect: str,
+) -> None:
+    buffer = StringIO()
+
+    int_to_buffer(
+        number,
+        buffer,
+        leading_zeros=leading_zeros,
+        recurring_count=recurring_count,
+    )
+
+    assert buffer.getvalue() == expect
+
+
+@mark.parametrize(
+    "digits",
+    [1_023, 1_024, 1_025, 4_300, 4_301, 20_000],
+)
+def test_int_to_buffer__large(digits: int) -> None:
+    # Includes runs of zeros that must survive splitting.
+    number = -(pow(10, digits - 1) * 7 + pow(10, digits // 2) + 3)
+
+    buffer = StringIO()
+    int_to_buffer(number, buffer)
+
+    expect = "-7" + ("0" * (digits - digits // 2 - 2)) + "1"
+    expect += ("0" * (digits // 2 - 1)) + "3"
+
+    assert buffer.getvalue() == expect
+
+
+def test_int_to_buffer__no_recurring_prefix() -> None:
+    buffer = StringIO()
+    int_to_buffer(81, buffer, recurring_count=2, recurring_prefix=None)
+    assert buffer.getvalue() == "81"
+
+
+@mark.parametrize(
+    "string, expect",
+    [
+        ("", 0),
+        ("0", 0),
+        ("007", 7),
+        ("123", 123),
+        (b"123", 123),
+        (memoryview(b"123"), 123),
+        (memoryview(b"x123x")[1:4], 123),
+    ],
+)
+def test_string_to_int(string: str | bytes | memoryview, expect: int) -> None:
+    assert string_to_int(string) == expect
+
+
+@mark.parametrize(
+    "digits",
+    [1_023, 1_024, 1_025, 4_300, 4_301, 20_000],
+)
+def test_string_to_int__large(digits: int) -> None:
+    string = "7" + ("0" * (digits - digits // 2 - 2)) + "1"
+    string += ("0" * (digits // 2 - 1)) + "3"
+
+    expect = pow(10, digits - 1) * 7 + pow(10, digits // 2) + 3
+
+    assert string_to_int(string) == expect
+    assert string_to_int(string.encode()) == expect
+
+
+@mark.parametrize(
+    "string, index",
+    [
+        ("-1", 0),
+        ("1.5", 1),
+        ("1_000", 1),
+        (" 1", 0),
+        (b"12a", 2),
+    ],
+)
+def test_string_to_int__invalid(string: str | bytes, index: int) -> None:
+    with raises(ValueError) as ex:
+        string_to_int(string)
+
+    assert str(ex.value) == f"Non-digit character at index {index}"
+
+
+@mark.parametrize(
+    "numerator, denominator, expect",
+    [
+        (0, 1, ""),
+        (3, 1, ""),
+        (1, 2, "5"),
+        (50, 100, "5"),
+        (12_345, 100, "45"),
+        (3, 1_000, "003"),
+        (1, 1_024, "0009765625"),
+        (1, 3, None),
+        (1, 6, None),
+        (1, pow(2, 600), str(pow(5, 600)).zfill(600)),
+        (1, pow(2, 601), None),
+        (1, pow(5, 601), None),
+    ],
+)
+def test_terminating_digits(
+    numerator: int,
+    denominator: int,
+    expect: str | None,
+) -> None:
+    assert terminating_digits(numerator, denominator) == expect
+
+
+def test_terminating_digits__zero() -> None:
+    with raises(ValueError) as ex:
+        terminating_digits(1, 0)
+
+    assert str(ex.value) == "Denominator 0 is not positive"
@@ -0,0 +1,96 @@
+from typing import Iterator
+
+from pytest import fixture, mark, raises
+
+from vinculum import (
+    Normalisation,
+    Rational,
+    get_normalisation,
+    normalisation,
+    set_normalisation,
+)
+
+
+@fixture(autouse=True)
+def restore_default() -> Iterator[None]:
+    default = get_normalisation()
+    yield
+    set_normalisation(default)
+
+
+@mark.parametrize(
+    "policy, expect",
+    [
+        (Normalisation.lazy(), (25, 24)),
+        (Normalisation.eager(), (25, 24)),
+        (Normalisation(4), (25, 24)),
+    ],
+)
+def test_add__coprime(policy: Normalisation, expect: tuple[int, int]) -> None:
+    # 3/8 + 2/3 over their least common multiple, 24.
+    with normalisation(policy):
+        result = Rational(3, 8) + Rational(2, 3)
+
+    assert (result.numerator, result.denominator) == expect
+
+
+@mark.parametrize(
+    "policy, expect",
+    [
+        (Normalisation.lazy(), (10, 12)),
+        (Normalisation.eager(), (5, 6)),
+        (Normalisation(3), (5, 6)),
+        (Normalisation(4), (10, 12)),
+    ],
+)
+def test_add__unreduced(
+    policy: Normalisation,
+    expect: tuple[int, int],
+) -> None:
+    with normalisation(policy):
+        result = Rational(2, 4) + Rational(2, 6)
+
+    assert (result.numerator, result.denominator) == expect
+
+
+def test_add__reduced() -> None:
+    # Both terms are reduced so the sum is reduced, whatever the policy.
+    with normalisation(Normalisation.lazy()):
+        result = Rational(1, 6).reduced + Rational(1, 3).reduced
+
+    assert (result.numerator, result.denominator) == (1, 2)
+    assert result.known_reduced
+
+
+def test_init__negative() -> None:
+    with raises(ValueError) as ex:
+        Normalisation(-1)
+
+    assert str(ex.value) == "Maximum bit length -1 is negative"
+
+
+def test_normalisation__nested() -> None:
+    with normalisation(Normalisation.eager()) as outer:
+        assert get_normalisation() is outer
+
+        with normalisation(Normalisation(64)):
+            assert get_normalisation() == Normalisation(64)
+
+        assert get_normalisation() is outer
+
+    assert get_normalisation() is Normalisation.lazy()
+
+
+def test_repr() -> None:
+    assert repr(Normalisation(64)) == "Normalisation(max_bits=64)"
+
+
+def test_set_normalisation() -> None:
+    set_normalisation(Normalisation.eager())
+    assert get_normalisation() is Normalisation.eager()
+
+    with normalisation(Normalisation.lazy()):
+        assert get_normalisation() is Normalisation.lazy()
+
+    result = Rational(2, 4) - Rational(1, 6)
+    assert (result.numerator, result.denominator) == (1, 3)
@@ -1,8 +1,21 @@
+from copy import copy, deepcopy
+from fractions import Fraction
+from io import BytesIO
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from pickle import dumps, loads
+from subprocess import PIPE, Popen
+from sys import (
+    executable,
+    get_int_max_str_digits,
+    hash_info,
+    set_int_max_str_digits,
+)
 from typing import Any
 
-from pytest import mark, raises
+from pytest import importorskip, mark, raises
 
-from vinculum import Rational
+from vinculum import DecimalPart, Rational
 
 
 @mark.parametrize(
@@ -59,6 +72,14 @@ def test_comparable_with_self(
     assert f.comparable_with_self(other) == expect
 
 
+def test_copy() -> None:
+    f = Rational(2, 3)
+
+    assert copy(f) is f
+    assert deepcopy(f) is f
+    assert deepcopy([f])[0] is f
+
+
 @mark.parametrize(
     "f, expect",
     [
@@ -75,12 +96,49 @@ def test_comparable_with_self(
         (Rational(3, 100), "0.03"),
         (Rational(3, 1000), "0.003"),
         (Rational(303, 10000), "0.0303"),
+        (Rational(-1, 2), "-0.5"),
+        (Rational(1, 6), "0.1̇6"),
+        (Rational(1, 12), "0.08̇3"),
+        (Rational(1, 101), "0.̇0̇0̇9̇9"),
+        (Rational(22, 7), "3.̇1̇4̇2̇8̇5̇7"),
     ],
 )
 def test_decimal(f: Rational, expect: str) -> None:
     assert f.decimal() == expect
 
 
+@mark.parametrize(
+    "f, max_dp, recursion, expect",
+    [
+        (Rational(1, 3), 0, True, "0.3"),
+        (Rational(1, 3), 1, True, "0.3"),
+        (Rational(1, 3), 2, True, "0.̇3"),
+        (Rational(1, 7), 6, True, "0.142857"),
+        (Rational(1, 7), 7, True, "0.̇1̇4̇2̇8̇5̇7"),
+        (Rational(1, 7), 8, False, "0.14285714"),
+        (Rational(1, 12), 3, True, "0.083"),
+        (Rational(1, 1024), 5, True, "0.00097"),
+        (Rational(1, 1024), 100, True, "0.0009765625"),
+        (Rational(-5, 40), 100, True, "-0.125"),
+        (Rational(1, pow(2, 2_000)), 5, True, "0.00000"),
+    ],
+)
+def test_decimal__options(
+    f: Rational,
+    max_dp: int,
+    recursion: bool,
+    expect: str,
+) -> None:
+    assert f.decimal(max_dp=max_dp, recursion=recursion) == expect
+
+
+def test_decimal__long_period() -> None:
+    # 999,983 is prime and 10 has order 999,982 modulo it.
+    result = Rational(1, 999_983).decimal(max_dp=1_000_000)
+    assert result.startswith("0.̇0̇0̇0̇0̇0̇1̇0̇0̇0̇0̇1̇7")
+    assert len(result) == 2 + (999_982 * 2)
+
+
 def test_decimal__pi() -> None:
     assert Rational(355, 113).decimal(max_dp=6, recursion=False) == "3.141592"
 
@@ -92,15 +150,50 @@ def test_decimal__pi() -> None:
         (Rational(8, 4), 2, True),
         (Rational(5, 4), 1.5, False),
         (Rational(6, 4), 1.5, True),
-        (Rational(67, 99), 0.67676767676, True),
+        (Rational(67, 99), 0.67676767676, False),
+        (Rational(1, 10), 0.1, False),
+        (Rational(3602879701896397, 36028797018963968), 0.1, True),
+        (Rational(10**400), float("inf"), False),
+        (Rational(1), float("nan"), False),
+        (Rational(10**30, 3), Rational(10**30 + 1, 3), False),
         (Rational(7, 4), Rational(8, 4), False),
         (Rational(8, 4), Rational(8, 4), True),
+        (Rational(2, 4), Rational(3, 6), True),
+        (Rational(2, 4), Rational(-2, 4), False),
+        (Rational(0, 4), Rational(0, 7), True),
+        (Rational(2**500, 2**400), Rational(2**100), True),
+        (Rational(2**500, 2**400), Rational(2**100 + 1), False),
+        (Rational(2, 4), Fraction(1, 2), True),
+        (Rational(2, 4), Fraction(1, 3), False),
+        (Rational(2, 4), "0.5", False),
+        (Rational(2, 4), "1/2", False),
+        (Rational(0), None, False),
+        (Rational(0), object(), False),
     ],
 )
 def test_eq(a: Rational, b: Any, expect: bool) -> None:
     assert (a == b) is expect
 
 
+def test_immutable() -> None:
+    f = Rational(2, 3)
+
+    with raises(AttributeError) as ex:
+        f._numerator = 3
+
+    assert str(ex.value) == "Rational is immutable"
+
+    with raises(AttributeError) as ex:
+        del f._denominator
+
+    assert str(ex.value) == "Rational is immutable"
+
+    with raises(AttributeError):
+        f.extra = 1
+
+    assert (f.numerator, f.denominator) == (2, 3)
+
+
 @mark.parametrize(
     "f, expect",
     [
@@ -141,6 +234,7 @@ def test_fractional(f: Rational, expect: Rational) -> None:
         (2, Rational(2, 1)),
         (2.5, Rational(5, 2)),
         (Rational(3, 2), Rational(3, 2)),
+        (Fraction(-3, 4), Rational(-3, 4)),
     ],
 )
 def test_from_any(value: Any, expect: tuple[Rational, Rational]) -> None:
@@ -154,6 +248,38 @@ def test_from_any__unhandled_type() -> None:
     assert str(ex.value) == "Cannot create a Rational from ['zero'] (list)"
 
 
+@mark.parametrize(
+    "f, expect",
+    [
+        (Rational(1, 2), b"\x01\x01\x01\x02"),
+        (Rational(-1, 3), b"\x01\xff\x01\x03"),
+        (Rational(0), b"\x01\x00\x01\x01"),
+    ],
+)
+def test_from_bytes(f: Rational, expect: bytes) -> None:
+    assert f.to_bytes() == expect
+
+    result = Rational.from_bytes(memoryview(expect))
+    assert (result.numerator, result.denominator) == (
+        f.numerator,
+        f.denominator,
+    )
+
+
+@mark.parametrize(
+    "data, expect",
+    [
+        (b"\x01\x01\x01", "Unexpected end of data at byte 3"),
+        (b"\x01\x01\x01\x02\x00", "Expected 4 bytes but found 5"),
+    ],
+)
+def test_from_bytes__invalid(data: bytes, expect: str) -> None:
+    with raises(ValueError) as ex:
+        Rational.from_bytes(data)
+
+    assert str(ex.value) == expect
+
+
 @mark.parametrize(
     "f, expect",
     [
@@ -162,10 +288,43 @@ def test_from_any__unhandled_type() -> None:
         (1.5, Rational(3, 2)),
         (1.25, Rational(5, 4)),
         (-1.25, Rational(-5, 4)),
+        (0.1, Rational(1, 10)),
+        (-0.0, Rational(0)),
+        (1e-05, Rational(1, 100_000)),
+        (1.5e300, Rational(15 * pow(10, 299))),
+        (5e-324, Rational(5, pow(10, 324))),
     ],
 )
 def test_from_float(f: float, expect: Rational) -> None:
-    assert Rational.from_float(f) == expect
+    result = Rational.from_float(f)
+
+    assert result == expect
+    assert result.known_reduced
+
+
+@mark.parametrize(
+    "f, expect_n, expect_d",
+    [
+        (1.5, 3, 2),
+        (-1.25, -5, 4),
+        (0.1, 3602879701896397, 36028797018963968),
+        (1e300, int(1e300), 1),
+    ],
+)
+def test_from_float__exact(f: float, expect_n: int, expect_d: int) -> None:
+    result = Rational.from_float(f, exact=True)
+
+    assert result.numerator == expect_n
+    assert result.denominator == expect_d
+    assert result.known_reduced
+
+
+@mark.parametrize("f", [float("inf"), float("-inf"), float("nan")])
+def test_from_float__not_finite(f: float) -> None:
+    with raises(ValueError) as ex:
+        Rational.from_float(f)
+
+    assert str(ex.value) == f"Cannot create a Rational from {f}"
 
 
 @mark.parametrize(
@@ -186,19 +345,68 @@ def test_from_float(f: float, expect: Rational) -> None:
         ("2/3", Rational(2, 3)),
         ("123/456", Rational(123, 456)),
         ("-7", -7),
-        ("-7.3", -7.3),
+        ("-7.3", Rational(-73, 10)),
+        ("+7.3", Rational(73, 10)),
+        ("-0.0", Rational.zero()),
+        ("1_000.000_5", Rational(10_000_005, 10_000)),
+        ("1.5e-7", Rational(15, 100_000_000)),
+        ("1.5E+7", Rational(15_000_000)),
+        ("25e2", Rational(2_500)),
+        ("25e-0_2", Rational(1, 4)),
+        ("-2/3", Rational(-2, 3)),
+        ("+2/3", Rational(2, 3)),
+        ("1_000/3", Rational(1_000, 3)),
     ],
 )
-def test_from_string(s: str, expect: Rational | float) -> None:
+def test_from_string(s: str, expect: Rational) -> None:
     rational = Rational.from_string(s)
     assert rational == expect
 
 
-def test_from_string__unrecognised() -> None:
+@mark.parametrize("s", ["1e5000", "1e-5000", "-2.5e99999999"])
+def test_from_string__exponent_too_large(s: str) -> None:
     with raises(ValueError) as ex:
-        _ = Rational.from_string("foo")
+        Rational.from_string(s)
+
+    limit = get_int_max_str_digits()
+    assert f"exceeds the limit ({limit})" in str(ex.value)
+
 
-    assert str(ex.value) == 'Cannot parse "foo" as decimal or fraction'
+def test_from_string__exponent_unlimited() -> None:
+    limit = get_int_max_str_digits()
+    set_int_max_str_digits(0)
+
+    try:
+        assert Rational.from_string("1e-5000") == Rational(1, 10**5000)
+    finally:
+        set_int_max_str_digits(limit)
+
+
+@mark.parametrize(
+    "s, expect_n, expect_d",
+    [
+        ("1.250", 5, 4),
+        ("-0.0008", -1, 1_250),
+        ("12.5e1", 125, 1),
+        ("6/8", 6, 8),
+    ],
+)
+def test_from_string__terms(s: str, expect_n: int, expect_d: int) -> None:
+    rational = Rational.from_string(s)
+
+    assert rational.numerator == expect_n
+    assert rational.denominator == expect_d
+
+
+@mark.parametrize(
+    "s",
+    ["foo", "1__0", "_1", "1_", "1.", ".5", "1e", "1e_5", "--1", "1/-2"],
+)
+def test_from_string__unrecognised(s: str) -> None:
+    with raises(ValueError) as ex:
+        _ = Rational.from_string(s)
+
+    assert str(ex.value) == f'Cannot parse "{s}" as decimal or fraction'
 
 
 @mark.parametrize(
@@ -213,6 +421,7 @@ def test_from_string__unrecognised() -> None:
         (Rational(7, 4), Rational(8, 4), False),
         (Rational(8, 4), Rational(8, 4), True),
         (Rational(9, 4), Rational(8, 4), True),
+        (Rational(1), float("nan"), False),
     ],
 )
 def test_ge(a: Rational, b: Any, expect: bool) -> None:
@@ -231,12 +440,64 @@ def test_ge(a: Rational, b: Any, expect: bool) -> None:
         (Rational(7, 4), Rational(8, 4), False),
         (Rational(8, 4), Rational(8, 4), False),
         (Rational(9, 4), Rational(8, 4), True),
+        (Rational(10**400), Rational(10**400 - 1), True),
+        (Rational(-(10**400)), float("-inf"), True),
+        (Rational(1, 10), 0.1, False),
+        (Rational(1), float("nan"), False),
     ],
 )
 def test_gt(a: Rational, b: Any, expect: bool) -> None:
     assert (a > b) is expect
 
 
+@mark.parametrize(
+    "f, expect",
+    [
+        (Rational(1, 2), hash(0.5)),
+        (Rational(2, 4), hash(0.5)),
+        (Rational(-3, 4), hash(-0.75)),
+        (Rational(7), hash(7)),
+        (Rational(-1), hash(-1)),
+        (Rational(0, 5), hash(0)),
+        (Rational(1, 3), hash(Fraction(1, 3))),
+        (Rational(-22, 7), hash(Fraction(-22, 7))),
+        (Rational(3**200, 2**150), hash(Fraction(3**200, 2**150))),
+        (Rational(1, hash_info.modulus), hash(Fraction(1, hash_info.modulus))),
+        (
+            Rational(-1, hash_info.modulus),
+            hash(Fraction(-1, hash_info.modulus)),
+        ),
+        (Rational(hash_info.modulus, hash_info.modulus), hash(1)),
+        (
+            Rational(2 * hash_info.modulus, 3 * hash_info.modulus),
+            hash(Fraction(2, 3)),
+        ),
+        (
+            Rational(-2 * hash_info.modulus, 6 * hash_info.modulus**2),
+            hash(Fraction(-1, 3 * hash_info.modulus)),
+        ),
+    ],
+)
+def test_hash(f: Rational, expect: int) -> None:
+    assert hash(f) == expect
+
+
+def test_hash__cached() -> None:
+    f = Rational(22, 7)
+    assert hash(f) == hash(f)
+    assert f._hash == hash(f)  # pylint: disable=protected-access
+
+
+def test_hash__set() -> None:
+    values = {Rational(1, 2), Rational(2, 4), 0.5, Fraction(1, 2), Rational(3)}
+    assert values == {Rational(1, 2), 3}
+
+
+def test_hash__set_modulus_multiple() -> None:
+    modulus = hash_info.modulus
+    assert len({Rational(modulus, modulus), Rational(1)}) == 1
+
+
 @mark.parametrize(
     "n, d, expect_n, expect_d",
     [
@@ -253,6 +514,30 @@ def test_init(n: int, d: int, expect_n: int, expect_d: int) -> None:
     assert f.numerator == expect_n
 
 
+@mark.parametrize("numerator", [100, 1000, 2**62])
+def test_init__integer_like(numerator: int) -> None:
+    numpy = importorskip("numpy")
+    f = Rational(numpy.int64(numerator), numpy.int64(3))
+
+    assert type(f.numerator) is int
+    assert type(f.denominator) is int
+    assert f * 2**62 == Rational(numerator * 2**62, 3)
+
+
+@mark.parametrize(
+    "n, d",
+    [
+        (100.5, 1),
+        (1000.5, 1),
+        (1, 2.0),
+        (1, 1000.0),
+    ],
+)
+def test_init__not_integer(n: Any, d: Any) -> None:
+    with raises(TypeError):
+        Rational(n, d)
+
+
 @mark.parametrize(
     "f, expect",
     [
@@ -268,6 +553,234 @@ def test_int(f: Rational, expect: int) -> None:
     assert int(f) == expect
 
 
+@mark.parametrize(
+    "f, max_dp, expect",
+    [
+        (
+            Rational(7),
+            100,
+            [(DecimalPart.INTEGRAL, "7")],
+        ),
+        (
+            Rational(-1, 4),
+            100,
+            [
+                (DecimalPart.SIGN, "-"),
+                (DecimalPart.INTEGRAL, "0"),
+                (DecimalPart.FRACTIONAL, "25"),
+            ],
+        ),
+        (
+            Rational(7, 6),
+            100,
+            [
+                (DecimalPart.INTEGRAL, "1"),
+                (DecimalPart.FRACTIONAL, "1"),
+                (DecimalPart.RECURRING, "6"),
+            ],
+        ),
+        (
+            Rational(1, 7),
+            100,
+            [
+                (DecimalPart.INTEGRAL, "0"),
+                (DecimalPart.RECURRING, "142857"),
+            ],
+        ),
+        (
+            Rational(1, 7),
+            4,
+            [
+                (DecimalPart.INTEGRAL, "0"),
+                (DecimalPart.FRACTIONAL, "1428"),
+            ],
+        ),
+    ],
+)
+def test_iter_digits(
+    f: Rational,
+    max_dp: int,
+    expect: list[tuple[DecimalPart, str]],
+) -> None:
+    assert list(f.iter_digits(max_dp=max_dp)) == expect
+
+
+def test_iter_digits__chunks() -> None:
+    parts = Rational(1, 3).iter_digits(
+        max_dp=10,
+        recursion=False,
+        chunk_digits=4,
+    )
+
+    assert list(parts) == [
+        (DecimalPart.INTEGRAL, "0"),
+        (DecimalPart.FRACTIONAL, "3333"),
+        (DecimalPart.FRACTIONAL, "3333"),
+        (DecimalPart.FRACTIONAL, "33"),
+    ]
+
+
+def test_iter_digits__stop_early() -> None:
+    parts = Rational(1, 999_983).iter_digits(max_dp=pow(10, 12))
+
+    assert next(parts) == (DecimalPart.INTEGRAL, "0")
+    assert next(parts)[1].startswith("000001000017000289")
+
+
+def test_iter_digits__invalid_chunk() -> None:
+    with raises(ValueError) as ex:
+        list(Rational(1, 3).iter_digits(chunk_digits=0))
+
+    assert str(ex.value) == "Chunk size 0 is not positive"
+
+
+@mark.parametrize(
+    "buffer, delimiter, expect",
+    [
+        (b"", b"\n", []),
+        (b"1", b"\n", [(1, 1)]),
+        (b"1\n", b"\n", [(1, 1)]),
+        (b"1\n\n-2.5\n", b"\n", [(1, 1), (-5, 2)]),
+        (b"+1_000.5e-1,2/4,-3/9", b",", [(2_001, 20), (2, 4), (-3, 9)]),
+        (b"1.5E3||7", b"||", [(1_500, 1), (7, 1)]),
+    ],
+)
+def test_iter_parse(
+    buffer: bytes,
+    delimiter: bytes,
+    expect: list[tuple[int, int]],
+) -> None:
+    result = Rational.iter_parse(buffer, delimiter)
+    assert [(r.numerator, r.denominator) for r in result] == expect
+
+
+def test_iter_parse__delimiter_empty() -> None:
+    with raises(ValueError) as ex:
+        list(Rational.iter_parse(b"1", b""))
+
+    assert str(ex.value) == "Delimiter is empty"
+
+
+def test_iter_parse__file(tmp_path: Path) -> None:
+    path = tmp_path / "numbers.txt"
+    path.write_bytes(b"0.25\n1/3\n-7\n")
+
+    expect = [Rational(1, 4), Rational(1, 3), Rational(-7)]
+
+    assert list(Rational.iter_parse(path)) == expect
+    assert list(Rational.iter_parse(str(path))) == expect
+
+    with open(path, "rb") as file:
+        assert list(Rational.iter_parse(file)) == expect
+
+    with open(path, "rb") as file:
+        with mmap(file.fileno(), 0, access=ACCESS_READ) as mapped:
+            assert list(Rational.iter_parse(mapped)) == expect
+
+    assert list(Rational.iter_parse(BytesIO(b"0.25\n1/3\n-7"))) == expect
+
+
+def test_iter_parse__file_empty(tmp_path: Path) -> None:
+    path = tmp_path / "numbers.txt"
+    path.write_bytes(b"")
+
+    assert list(Rational.iter_parse(path)) == []
+
+
+def test_iter_parse__pipe() -> None:
+    script = "print('1.5'); print('2')"
+
+    with Popen([executable, "-c", script], stdout=PIPE) as process:
+        assert process.stdout is not None
+        result = list(Rational.iter_parse(process.stdout))
+
+    assert result == [Rational(3, 2), Rational(2)]
+
+
+def test_iter_parse__exponent_too_large() -> None:
+    with raises(ValueError) as ex:
+        list(Rational.iter_parse(b"1\n1e-99999999\n"))
+
+    assert "Exponent -99999999 exceeds the limit" in str(ex.value)
+
+
+@mark.parametrize(
+    "buffer, position",
+    [
+        (b"foo", 0),
+        (b"1\n2.\n3", 2),
+        (b"1\n2 \n", 2),
+    ],
+)
+def test_iter_parse__unrecognised(buffer: bytes, position: int) -> None:
+    with raises(ValueError) as ex:
+        list(Rational.iter_parse(buffer))
+
+    assert str(ex.value) == f"Cannot parse the record at byte {position}"
+
+
+@mark.parametrize(
+    "f, expect",
+    [
+        (Rational(3), True),
+        (Rational(-6, 1), True),
+        (Rational(3, 2), True),
+        (Rational(301, 200), False),
+        (Rational(3, 2).reduced, True),
+        (Rational(6, 4).reduced, True),
+        (Rational(6, 4), False),
+        (-Rational(6, 4).reduced, True),
+        (Rational(6, 4).reduced.reciprocal, True),
+        (Rational(6, 4).reciprocal, False),
+        (Rational(3, 2).reduced + 1, True),
+        (1 + Rational(3, 2).reduced, True),
+        (Rational(3, 2).reduced * 5, True),
+        (5 * Rational(3, 2).reduced, True),
+        (Rational(3, 2).reduced * 4, True),
+        (Rational(3, 2).reduced * Rational(5, 7).reduced, True),
+        (Rational(3, 2).reduced * Rational(2, 7).reduced, True),
+        (Rational(3, 2).reduced / Rational(9, 4).reduced, True),
+        (9 / Rational(3, 2).reduced, True),
+        (Rational(3, 2).reduced * Rational(500, 701), False),
+        (Rational(6, 4).reduce(max_iterations=100), True),
+        (Rational(1806, 189).reduce(max_iterations=2), False),
+    ],
+)
+def test_known_reduced(f: Rational, expect: bool) -> None:
+    assert f.known_reduced is expect
+
+    if expect:
+        assert f.reduced is f
+
+
+@mark.parametrize(
+    "f, expect_n, expect_d",
+    [
+        (Rational(3, 2).reduced * 4, 6, 1),
+        (Rational(3, 2).reduced * Rational(2, 7).reduced, 3, 7),
+        (Rational(-3, 2).reduced * Rational(10, 9).reduced, -5, 3),
+        (Rational(3, 2).reduced / Rational(9, 4).reduced, 2, 3),
+        (Rational(3, 2).reduced / -6, -1, 4),
+        (9 / Rational(-3, 2).reduced, -6, 1),
+        (Rational(6, 4) * Rational(2, 3), 12, 12),
+    ],
+)
+def test_known_reduced__cross_factors(
+    f: Rational,
+    expect_n: int,
+    expect_d: int,
+) -> None:
+    assert (f.numerator, f.denominator) == (expect_n, expect_d)
+
+
+def test_known_reduced__after_reduction() -> None:
+    f = Rational(301, 200)
+    assert not f.known_reduced
+
+    assert f.reduced is f
+    assert f.known_reduced
+
+
 @mark.parametrize(
     "a, b, expect",
     [
@@ -280,6 +793,7 @@ def test_int(f: Rational, expect: int) -> None:
         (Rational(7, 4), Rational(8, 4), True),
         (Rational(8, 4), Rational(8, 4), True),
         (Rational(9, 4), Rational(8, 4), False),
+        (Rational(1), float("nan"), False),
     ],
 )
 def test_le(a: Rational, b: Any, expect: bool) -> None:
@@ -298,6 +812,25 @@ def test_le(a: Rational, b: Any, expect: bool) -> None:
         (Rational(7, 4), Rational(8, 4), True),
         (Rational(8, 4), Rational(8, 4), False),
         (Rational(9, 4), Rational(8, 4), False),
+        (Rational(-1, 3), Rational(1, 5), True),
+        (Rational(1, 3), Rational(-1, 5), False),
+        (Rational(0, 3), Rational(-1, 5), False),
+        (Rational(0, 3), Rational(1, 5), True),
+        (Rational(-1, 3), Rational(-1, 5), True),
+        (Rational(2, 3), Rational(3, 5), False),
+        (Rational(2**500, 3), Rational(2**200, 7), False),
+        (Rational(-(2**500), 3), Rational(-(2**200), 7), True),
+        (
+            Rational(3**300 - 1, 3**300),
+            Rational(3**300, 3**300 + 1),
+            True,
+        ),
+        (Rational(-7, 4), -1, True),
+        (Rational(7, 4), "9/4", True),
+        (Rational(10**30, 3), Rational(10**30 + 1, 3), True),
+        (Rational(1, 10), 0.1, True),
+        (Rational(10**400), float("inf"), True),
+        (Rational(1), float("nan"), False),
     ],
 )
 def test_lt(a: Rational, b: Any, expect: bool) -> None:
@@ -339,6 +872,20 @@ def test_mul(a: Rational, b: Any, expect: Rational) -> None:
     assert result == expect
 
 
+@mark.parametrize(
+    "f, expect_n, expect_d",
+    [
+        (Rational(3, 2), -3, 2),
+        (Rational(-3, 2), 3, 2),
+        (Rational(0), 0, 1),
+    ],
+)
+def test_neg(f: Rational, expect_n: int, expect_d: int) -> None:
+    result = -f
+    assert result.numerator == expect_n
+    assert result.denominator == expect_d
+
+
 @mark.parametrize(
     "a, b, expect",
     [
@@ -351,14 +898,51 @@ def test_radd(a: Any, b: Rational, expect: Rational) -> None:
     assert a + b == expect
 
 
+def test_pack() -> None:
+    rationals = [Rational(-1806, 189), Rational(0), Rational(pow(7, 9_000))]
+    packed = Rational.pack(rationals)
+
+    assert packed == b"".join(r.to_bytes() for r in rationals)
+
+    result = list(Rational.unpack(memoryview(packed)))
+    assert [(r.numerator, r.denominator) for r in result] == [
+        (-1806, 189),
+        (0, 1),
+        (pow(7, 9_000), 1),
+    ]
+
+
+def test_pack__empty() -> None:
+    assert Rational.pack([]) == b""
+    assert list(Rational.unpack(b"")) == []
+
+
+@mark.parametrize("protocol", [0, 2, 5])
+def test_pickle(protocol: int) -> None:
+    # The numerator is too long to convert to a decimal string natively.
+    f = Rational(-pow(3, 10_000), 189)
+    result = loads(dumps(f, protocol=protocol))
+
+    assert result.numerator == -pow(3, 10_000)
+    assert result.denominator == 189
+
+
 def test_reciprocal() -> None:
     assert Rational(2, 3).reciprocal == Rational(3, 2)
 
 
+def test_reciprocal__cached() -> None:
+    f = Rational(2, 3)
+    reciprocal = f.reciprocal
+
+    assert f.reciprocal is reciprocal
+
+
 @mark.parametrize(
     "f, max_iterations, expect",
     [
         (Rational.zero(), None, Rational.zero()),
+        (Rational(0, 5), None, Rational.zero()),
         (Rational(1), None, Rational(1)),
         (Rational(1, 2), None, Rational(1, 2)),
         (Rational(15, 30), None, Rational(1, 2)),
@@ -404,6 +988,14 @@ def test_reduced(f: Rational, expect: Rational) -> None:
     assert f.reduced == expect
 
 
+def test_reduced__cached() -> None:
+    f = Rational(1806, 189)
+    reduced = f.reduced
+
+    assert f.reduced is reduced
+    assert reduced.reduced is reduced
+
+
 def test_repr() -> None:
     assert repr(Rational(2, 3)) == "2/3"
 
@@ -470,6 +1062,19 @@ def test_rtruediv(a: Any, b: Rational, expect: Rational) -> None:
     assert a / b == expect
 
 
+@mark.parametrize(
+    "f, expect",
+    [
+        (Rational(-3, 4), -1),
+        (Rational(0, 4), 0),
+        (Rational(3, 4), 1),
+        (Rational(10**400), 1),
+    ],
+)
+def test_sign(f: Rational, expect: int) -> None:
+    assert f.sign == expect
+
+
 @mark.parametrize(
     "rational, expect",
     [
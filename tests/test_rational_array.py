@@ -0,0 +1,221 @@
+from random import Random
+from typing import Any, Callable
+
+from numpy import array, int64, uint8
+from pytest import mark, raises
+
+from vinculum import Rational
+from vinculum.rational_array import RationalArray
+
+Operation = Callable[[Any, Any], Any]
+
+
+def random_rationals(random: Random, limit: int) -> list[Rational]:
+    return [
+        Rational(
+            random.randint(-limit, limit),
+            random.choice((-1, 1)) * random.randint(1, limit),
+        )
+        for _ in range(50)
+    ]
+
+
+@mark.parametrize(
+    "operation",
+    [
+        lambda a, b: a + b,
+        lambda a, b: a - b,
+        lambda a, b: a * b,
+        lambda a, b: a / b,
+    ],
+)
+@mark.parametrize("limit", [1_000, 2**80])
+def test_arithmetic(operation: Operation, limit: int) -> None:
+    random = Random(42)
+    a = random_rationals(random, limit)
+    b = random_rationals(random, limit)
+
+    actual = operation(
+        RationalArray.from_rationals(a),
+        RationalArray.from_rationals(b),
+    )
+
+    assert actual.to_list() == [operation(x, y) for x, y in zip(a, b)]
+    assert all(value.denominator > 0 for value in actual)
+
+
+@mark.parametrize(
+    "operation",
+    [
+        lambda a, b: a + b,
+        lambda a, b: a - b,
+        lambda a, b: a * b,
+        lambda a, b: a / b,
+    ],
+)
+@mark.parametrize("scalar", [3, -2, Rational(2, -3), Rational(2**70, 3)])
+def test_arithmetic__scalar(operation: Operation, scalar: Any) -> None:
+    rationals = [Rational(1, 2), Rational(-3, 4), Rational(5)]
+    actual = operation(RationalArray.from_rationals(rationals), scalar)
+    assert actual.to_list() == [operation(r, scalar) for r in rationals]
+
+
+@mark.parametrize(
+    "operation",
+    [
+        lambda a, b: b + a,
+        lambda a, b: b - a,
+        lambda a, b: b * a,
+        lambda a, b: b / a,
+    ],
+)
+@mark.parametrize("scalar", [3, -2, 2**70])
+def test_arithmetic__scalar_left(operation: Operation, scalar: int) -> None:
+    rationals = [Rational(1, 2), Rational(-3, 4), Rational(5)]
+    actual = operation(RationalArray.from_rationals(rationals), scalar)
+    assert actual.to_list() == [operation(r, scalar) for r in rationals]
+
+
+@mark.parametrize(
+    "operation",
+    [
+        lambda a, b: a == b,
+        lambda a, b: a != b,
+        lambda a, b: a < b,
+        lambda a, b: a <= b,
+        lambda a, b: a > b,
+        lambda a, b: a >= b,
+    ],
+)
+@mark.parametrize("limit", [3, 2**80])
+def test_compare(operation: Operation, limit: int) -> None:
+    random = Random(42)
+    a = random_rationals(random, limit)
+    b = random_rationals(random, limit)
+
+    actual = operation(
+        RationalArray.from_rationals(a),
+        RationalArray.from_rationals(b),
+    )
+
+    assert actual.tolist() == [operation(x, y) for x, y in zip(a, b)]
+
+
+def test_compare__unsupported() -> None:
+    result: Any = RationalArray([1]) == "1"
+    assert result is False
+
+
+def test_getitem() -> None:
+    rationals = RationalArray([1, 2, 3], [4, 5, 6])
+
+    assert rationals[1] == Rational(2, 5)
+    assert rationals[-1] == Rational(1, 2)
+    assert rationals[1:].to_list() == [Rational(2, 5), Rational(1, 2)]
+
+
+@mark.parametrize(
+    "numerators, expect",
+    [
+        ([1, 2], "int64"),
+        (array([1, 2], dtype=uint8), "int64"),
+        ([2**63 - 1], "int64"),
+        ([-(2**63)], "object"),
+        ([2**63], "object"),
+        ([2**100], "object"),
+        ([], "int64"),
+    ],
+)
+def test_init__dtype(numerators: Any, expect: str) -> None:
+    assert RationalArray(numerators).dtype == expect
+
+
+def test_init__mismatched() -> None:
+    with raises(ValueError) as ex:
+        RationalArray([1, 2], [3])
+
+    expect = (
+        "Numerators (2,) and denominators (1,) are not one-dimensional arrays "
+        "of the same length"
+    )
+
+    assert str(ex.value) == expect
+
+
+def test_init__normalised() -> None:
+    rationals = RationalArray([1, -2, 3], [-2, -3, 4])
+    assert rationals.numerators.tolist() == [-1, 2, 3]
+    assert rationals.denominators.tolist() == [2, 3, 4]
+
+
+@mark.parametrize("numerators", [[1.5], ["1"], array([1, "1"], dtype=object)])
+def test_init__not_integers(numerators: Any) -> None:
+    with raises(TypeError):
+        RationalArray(numerators)
+
+
+def test_neg() -> None:
+    assert (-RationalArray([1, -2], [3, 5])).to_list() == [
+        Rational(-1, 3),
+        Rational(2, 5),
+    ]
+
+
+def test_numpy_scalar() -> None:
+    actual = int64(2) + RationalArray([1], [2])
+    assert actual.to_list() == [Rational(5, 2)]
+
+
+def test_overflow() -> None:
+    rationals = RationalArray([2**62, 3], [1, 2**62 - 1])
+    assert rationals.dtype == "int64"
+
+    product = rationals * rationals
+    assert product.dtype == "object"
+    assert product.to_list() == [
+        Rational(2**124),
+        Rational(9, (2**62 - 1) ** 2),
+    ]
+
+
+@mark.parametrize("count", [0, 1, 2, 7, 64])
+def test_prod(count: int) -> None:
+    rationals = [Rational(i + 2, i + 1) for i in range(count)]
+    assert RationalArray.from_rationals(rationals).prod() == count + 1
+
+
+def test_reciprocal() -> None:
+    assert RationalArray([1, -2], [3, 5]).reciprocal.to_list() == [
+        Rational(3),
+        Rational(-5, 2),
+    ]
+
+
+def test_reduce() -> None:
+    rationals = RationalArray([2, 0, 2**70, 6], [4, 5, 2**71, -9])
+    assert rationals.dtype == "object"
+
+    reduced = rationals.reduce()
+    assert reduced.dtype == "int64"
+    assert reduced.numerators.tolist() == [1, 0, 1, -2]
+    assert reduced.denominators.tolist() == [2, 1, 2, 3]
+
+
+def test_repr() -> None:
+    assert repr(RationalArray([1, 2], [3, 4])) == "RationalArray([1/3, 2/4])"
+
+
+@mark.parametrize("count", [0, 1, 2, 7, 64])
+@mark.parametrize("limit", [1_000, 2**80])
+def test_sum(count: int, limit: int) -> None:
+    rationals = random_rationals(Random(42), limit)[:count]
+    expect = sum(rationals, Rational(0))
+    assert RationalArray.from_rationals(rationals).sum() == expect
+
+
+def test_sum__overflow() -> None:
+    rationals = RationalArray(
+        [1, 1, 1], [2**62 - 1, 2**62 - 3, 2**61 - 1]
+    )
+    expect = sum(rationals, Rational(0))
+    assert rationals.sum() == expect
@@ -0,0 +1,124 @@
+from pathlib import Path
+
+from pytest import mark, raises
+
+from vinculum import Rational, RationalColumn
+
+RATIONALS = [
+    Rational(1, 2),
+    Rational(-3),
+    Rational(2**70, 3),
+    Rational(2**63 - 1, 2**63 - 3),
+    Rational(-5, 2**64 + 1),
+    Rational(-(2**63)),
+    Rational(0),
+]
+
+
+def test_append__integers() -> None:
+    column = RationalColumn()
+    column.append(3)
+    column.extend([2**64, Rational(1, 3)])
+
+    assert list(column) == [3, 2**64, Rational(1, 3)]
+    assert column.overflows == 1
+
+
+@mark.parametrize("index", range(-len(RATIONALS), len(RATIONALS)))
+def test_getitem(index: int) -> None:
+    assert RationalColumn(RATIONALS)[index] == RATIONALS[index]
+
+
+def test_getitem__out_of_range() -> None:
+    with raises(IndexError):
+        RationalColumn(RATIONALS)[len(RATIONALS)]
+
+
+def test_iter() -> None:
+    assert list(RationalColumn(RATIONALS)) == RATIONALS
+
+
+def test_nbytes() -> None:
+    column = RationalColumn([Rational(1, 2), Rational(3, 4)])
+    assert column.nbytes == 32
+
+
+def test_open(tmp_path: Path) -> None:
+    path = tmp_path / "column"
+    RationalColumn(RATIONALS).save(path)
+
+    with RationalColumn.open(path) as column:
+        assert column.mapped
+        assert len(column) == len(RATIONALS)
+        assert column.overflows == 3
+        assert list(column) == RATIONALS
+        assert column[4] == Rational(-5, 2**64 + 1)
+        assert column.nbytes == RationalColumn(RATIONALS).nbytes
+
+    assert not column.mapped
+    assert len(column) == 0
+
+
+def test_open__empty(tmp_path: Path) -> None:
+    path = tmp_path / "column"
+    RationalColumn().save(path)
+
+    with RationalColumn.open(path) as column:
+        assert list(column) == []
+
+
+def test_open__not_column(tmp_path: Path) -> None:
+    path = tmp_path / "column"
+    path.write_bytes(bytes(32))
+
+    with raises(ValueError) as ex:
+        RationalColumn.open(path)
+
+    assert str(ex.value) == "Data is not a Vinculum column"
+
+
+def test_open__read_only(tmp_path: Path) -> None:
+    path = tmp_path / "column"
+    RationalColumn(RATIONALS).save(path)
+
+    with RationalColumn.open(path) as column:
+        with raises(ValueError) as ex:
+            column.append(1)
+
+    assert str(ex.value) == "A mapped column is read-only"
+
+
+def test_open__short(tmp_path: Path) -> None:
+    path = tmp_path / "column"
+    path.write_bytes(b"VNCL")
+
+    with raises(ValueError) as ex:
+        RationalColumn.open(path)
+
+    assert str(ex.value) == "Unexpected end of data at byte 4"
+
+
+def test_open__truncated(tmp_path: Path) -> None:
+    path = tmp_path / "column"
+    RationalColumn(RATIONALS).save(path)
+    path.write_bytes(path.read_bytes()[:-1])
+
+    with raises(ValueError) as ex:
+        RationalColumn.open(path)
+
+    assert str(ex.value) == ("Expected 227 bytes of column data but found 226")
+
+
+def test_repr() -> None:
+    assert repr(RationalColumn(RATIONALS)) == (
+        "RationalColumn(rows=7, overflows=3, mapped=False)"
+    )
+
+
+def test_save__mapped(tmp_path: Path) -> None:
+    RationalColumn(RATIONALS).save(tmp_path / "a")
+
+    with RationalColumn.open(tmp_path / "a") as column:
+        column.save(tmp_path / "b")
+
+    assert (tmp_path / "a").read_bytes() == (tmp_path / "b").read_bytes()
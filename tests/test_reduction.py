@@ -0,0 +1,77 @@
+from pytest import mark
+
+from vinculum import Rational, Reduction
+
+
+@mark.parametrize(
+    "rational, expect",
+    [
+        (Rational(1806, 189), (86, 9)),
+        (Rational(189, 1806), (9, 86)),
+        (Rational(-1806, 189), (-86, 9)),
+        (Rational(2, 3), (2, 3)),
+        (Rational(0, 5), (0, 1)),
+        (Rational(5), (5, 1)),
+        (
+            Rational(pow(2, 200) * pow(3, 5_000), pow(2, 190) * pow(7, 3_000)),
+            (pow(2, 10) * pow(3, 5_000), pow(7, 3_000)),
+        ),
+    ],
+)
+def test_advance(rational: Rational, expect: tuple[int, int]) -> None:
+    reduction = Reduction(rational)
+
+    while not reduction.advance(100):
+        pass
+
+    assert reduction.complete
+    assert reduction.rational is rational
+
+    result = reduction.result()
+    assert (result.numerator, result.denominator) == expect
+
+
+def test_advance__complete() -> None:
+    reduction = Reduction(Rational(1806, 189))
+
+    assert not reduction.advance(2)
+    assert reduction.steps == 2
+
+    assert reduction.advance(100)
+    assert reduction.steps == 4
+
+    assert reduction.advance(100)
+    assert reduction.steps == 4
+
+
+def test_repr() -> None:
+    reduction = Reduction(Rational(1806, 189))
+    assert repr(reduction) == "Reduction(1806/189, 0 steps, incomplete)"
+
+    reduction.advance(100)
+    assert repr(reduction) == "Reduction(1806/189, 4 steps, complete)"
+
+
+def test_result__incomplete() -> None:
+    reduction = Reduction(Rational(1806, 189))
+    reduction.advance(1)
+
+    result = reduction.result()
+
+    assert reduction.complete
+    assert (result.numerator, result.denominator) == (86, 9)
+
+
+def test_result__irreducible() -> None:
+    rational = Rational(2, 3)
+    assert Reduction(rational).result() is rational
+    assert rational.known_reduced
+
+
+def test_result__known_reduced() -> None:
+    rational = Rational(1806, 189)
+    result = Reduction(rational).result()
+
+    assert result.known_reduced
+    assert not rational.known_reduced
+    assert rational.reduce() is result
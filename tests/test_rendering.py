@@ -0,0 +1,157 @@
+from random import Random
+from typing import Iterator
+
+from pytest import fixture, mark, raises
+
+from vinculum import (
+    DecimalCache,
+    Rational,
+    get_decimal_cache,
+    set_decimal_cache,
+)
+
+
+@fixture(autouse=True)
+def restore_cache() -> Iterator[None]:
+    cache = get_decimal_cache()
+    yield
+    set_decimal_cache(cache)
+
+
+def test_clear() -> None:
+    cache = DecimalCache()
+    set_decimal_cache(cache)
+
+    Rational(1, 7).decimal()
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.bytes == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_decimal__hit() -> None:
+    cache = DecimalCache()
+    set_decimal_cache(cache)
+
+    assert Rational(2, 14).decimal() == "0.̇1̇4̇2̇8̇5̇7"
+    assert Rational(1, 7).decimal() == "0.̇1̇4̇2̇8̇5̇7"
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+
+@mark.parametrize(
+    "f, max_dp, expect",
+    [
+        (Rational(1, 7), 5, "0.14285"),
+        (Rational(1, 7), 6, "0.142857"),
+        (Rational(1, 7), 7, "0.̇1̇4̇2̇8̇5̇7"),
+        (Rational(1, 7), 200, "0.̇1̇4̇2̇8̇5̇7"),
+        (Rational(1, 6), 2, "0.16"),
+        (Rational(1, 6), 3, "0.1̇6"),
+        (Rational(-33, 8), 2, "-4.12"),
+        (Rational(-33, 8), 200, "-4.125"),
+        (Rational(5), 200, "5.0"),
+        (Rational(355, 113), 6, "3.141592"),
+    ],
+)
+def test_decimal__prefix(f: Rational, max_dp: int, expect: str) -> None:
+    cache = DecimalCache()
+    set_decimal_cache(cache)
+
+    f.decimal(max_dp=100)
+
+    assert f.decimal(max_dp=max_dp) == expect
+    assert cache.hits == 1
+
+
+def test_decimal__not_complete() -> None:
+    cache = DecimalCache()
+    set_decimal_cache(cache)
+
+    Rational(355, 113).decimal(max_dp=6)
+
+    assert Rational(355, 113).decimal(max_dp=7) == "3.1415929"
+    assert cache.misses == 2
+
+
+@mark.parametrize("recurring_prefix", ["̇", "̅", "", "1", None])
+@mark.parametrize("recursion", [True, False])
+def test_decimal__random(
+    recursion: bool,
+    recurring_prefix: str | None,
+) -> None:
+    random = Random(42)
+    cache = DecimalCache(max_entries=16)
+
+    for _ in range(500):
+        f = Rational(random.randrange(-100, 100), random.randrange(1, 30))
+        max_dp = random.randrange(0, 40)
+
+        set_decimal_cache(None)
+        expect = f.decimal(max_dp, recursion, recurring_prefix)
+
+        set_decimal_cache(cache)
+        assert f.decimal(max_dp, recursion, recurring_prefix) == expect
+
+    assert cache.hits > 0
+
+
+def test_init__max_bytes() -> None:
+    with raises(ValueError) as ex:
+        DecimalCache(max_bytes=0)
+
+    assert str(ex.value) == "Maximum bytes 0 is less than 1"
+
+
+def test_init__max_entries() -> None:
+    with raises(ValueError) as ex:
+        DecimalCache(max_entries=0)
+
+    assert str(ex.value) == "Maximum entries 0 is less than 1"
+
+
+def test_put__max_bytes() -> None:
+    cache = DecimalCache(max_bytes=200)
+    set_decimal_cache(cache)
+
+    Rational(1, 3).decimal(recursion=False)
+    assert len(cache) == 1
+
+    # Too big to cache at all.
+    Rational(1, 7).decimal(max_dp=1_000, recursion=False)
+    assert len(cache) == 1
+
+    Rational(1, 9).decimal(recursion=False)
+    assert len(cache) == 1
+    assert cache.bytes <= 200
+
+
+def test_put__max_entries() -> None:
+    cache = DecimalCache(max_entries=2)
+    set_decimal_cache(cache)
+
+    Rational(1, 3).decimal()
+    Rational(1, 7).decimal()
+    Rational(1, 3).decimal()
+    Rational(1, 9).decimal()
+
+    assert len(cache) == 2
+
+    Rational(1, 3).decimal()
+    Rational(1, 7).decimal()
+
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_repr() -> None:
+    cache = DecimalCache(max_entries=2, max_bytes=1_000)
+    set_decimal_cache(cache)
+
+    Rational(1, 2).decimal()
+    Rational(1, 2).decimal()
+
+    assert repr(cache) == (
+        "DecimalCache(max_entries=2, max_bytes=1000, size=1, "
+        f"bytes={cache.bytes}, hits=1, misses=1)"
+    )
@@ -0,0 +1,107 @@
+from random import Random
+
+from pytest import mark, raises
+
+from vinculum import Rational, SortedRationals, sort_key
+
+
+def test_add__bisect() -> None:
+    rationals = SortedRationals()
+
+    for rational in [Rational(2, 3), Rational(1, 3), Rational(2, 6)]:
+        rationals.add(rational)
+
+    assert list(rationals) == [Rational(1, 3), Rational(1, 3), Rational(2, 3)]
+    assert len(rationals) == 3
+    assert rationals.bisect_left(Rational(1, 3)) == 0
+    assert rationals.bisect_right(Rational(1, 3)) == 2
+
+
+def test_contains() -> None:
+    rationals = SortedRationals([Rational(1, 3), Rational(1, 2)])
+
+    assert Rational(2, 4) in rationals
+    assert Rational(2, 3) not in rationals
+
+
+def test_getitem() -> None:
+    rationals = SortedRationals([Rational(1, 2), Rational(1, 3)])
+    assert rationals[0] == Rational(1, 3)
+    assert rationals[-1] == Rational(1, 2)
+
+
+@mark.parametrize(
+    "minimum, maximum, expect",
+    [
+        (Rational(1, 4), Rational(3, 4), [Rational(1, 4), Rational(1, 2)]),
+        (None, Rational(1, 4), [Rational(-1), Rational(1, 4)]),
+        (Rational(3, 5), None, [Rational(3)]),
+        (None, None, [Rational(-1), Rational(1, 4), Rational(1, 2), 3]),
+        (Rational(2), Rational(1), []),
+    ],
+)
+def test_irange(
+    minimum: Rational | None,
+    maximum: Rational | None,
+    expect: list[Rational],
+) -> None:
+    rationals = SortedRationals(
+        [Rational(3), Rational(1, 2), Rational(-1), Rational(1, 4)]
+    )
+
+    assert list(rationals.irange(minimum, maximum)) == expect
+
+
+def test_remove() -> None:
+    rationals = SortedRationals([Rational(1, 3), Rational(2, 3)])
+    rationals.remove(Rational(2, 6))
+
+    assert list(rationals) == [Rational(2, 3)]
+
+
+def test_remove__missing() -> None:
+    rationals = SortedRationals([Rational(1, 3)])
+
+    with raises(ValueError) as ex:
+        rationals.remove(Rational(1, 2))
+
+    assert str(ex.value) == "1/2 is not in the collection"
+
+
+def test_repr() -> None:
+    rationals = SortedRationals([Rational(1, 2), Rational(1, 3)])
+    assert repr(rationals) == "SortedRationals([1/3, 1/2])"
+
+
+def test_sort_key__collisions() -> None:
+    # These values round to the same float so must be compared exactly.
+    a = Rational(10**30, 3)
+    b = Rational(10**30 + 1, 3)
+
+    assert float(a) == float(b)
+    assert sorted([b, a], key=sort_key) == [a, b]
+
+
+def test_sort_key__not_finite() -> None:
+    huge = Rational(10**400)
+    huger = Rational(10**400 + 1)
+
+    assert sort_key(huge)[0] == float("inf")
+    assert sort_key(-huge)[0] == float("-inf")
+    assert sorted([huger, -huge, huge, -huger], key=sort_key) == [
+        -huger,
+        -huge,
+        huge,
+        huger,
+    ]
+
+
+def test_sort_key__random() -> None:
+    random = Random(42)
+
+    rationals = [
+        Rational(random.randrange(-100, 100), random.randrange(1, 100))
+        for _ in range(1_000)
+    ]
+
+    assert sorted(rationals, key=sort_key) == sorted(rationals)
@@ -0,0 +1,39 @@
+from typing import Iterator
+
+from pytest import LogCaptureFixture, fixture
+
+from vinculum import Rational, disable_tracing, enable_tracing, tracing_enabled
+
+
+@fixture(autouse=True)
+def restore_tracing() -> Iterator[None]:
+    enabled = tracing_enabled()
+    yield
+
+    if enabled:
+        enable_tracing()
+    else:
+        disable_tracing()
+
+
+def test_disable_tracing(caplog: LogCaptureFixture) -> None:
+    disable_tracing()
+    assert not tracing_enabled()
+
+    _ = Rational(1, 2) + Rational(1, 3)
+    _ = Rational(1, 2) * 3
+
+    assert caplog.records == []
+
+
+def test_enable_tracing(caplog: LogCaptureFixture) -> None:
+    enable_tracing()
+    assert tracing_enabled()
+
+    _ = Rational(1, 2) + Rational(1, 3)
+    _ = Rational(1, 2) * 3
+
+    assert caplog.messages == [
+        "__add__ adding Rational 1/3",
+        "__mul__ multiplying by integer 3",
+    ]
@@ -6,8 +6,39 @@ For usage and support, see https://github.com/cariad/vinculum.
 
 from importlib.resources import files
 
-from vinculum.math import greatest_common_divisor, int_to_buffer, string_to_int
+from vinculum.decimal_part import DecimalPart
+from vinculum.instrumentation import (
+    Instrumentation,
+    SizeWarning,
+    get_instrumentation,
+    instrument,
+    set_instrumentation,
+)
+from vinculum.interning import InternCache, get_intern_cache, set_intern_cache
+from vinculum.math import (
+    euclid_steps,
+    fractional_digits,
+    greatest_common_divisor,
+    int_to_buffer,
+    string_to_int,
+    terminating_digits,
+)
+from vinculum.normalisation import (
+    Normalisation,
+    get_normalisation,
+    normalisation,
+    set_normalisation,
+)
 from vinculum.rational import Rational
+from vinculum.rational_column import RationalColumn
+from vinculum.reduction import Reduction
+from vinculum.rendering import (
+    DecimalCache,
+    get_decimal_cache,
+    set_decimal_cache,
+)
+from vinculum.sorting import SortedRationals, sort_key
+from vinculum.tracing import disable_tracing, enable_tracing, tracing_enabled
 
 
 def version() -> str:
@@ -20,9 +51,35 @@ def version() -> str:
 
 
 __all__ = [
+    "DecimalCache",
+    "DecimalPart",
+    "Instrumentation",
+    "InternCache",
+    "Normalisation",
     "Rational",
+    "RationalColumn",
+    "Reduction",
+    "SizeWarning",
+    "SortedRationals",
+    "disable_tracing",
+    "enable_tracing",
+    "euclid_steps",
+    "fractional_digits",
+    "get_decimal_cache",
+    "get_instrumentation",
+    "get_intern_cache",
+    "get_normalisation",
     "greatest_common_divisor",
+    "instrument",
     "int_to_buffer",
+    "normalisation",
+    "set_decimal_cache",
+    "set_instrumentation",
+    "set_intern_cache",
+    "set_normalisation",
+    "sort_key",
     "string_to_int",
+    "terminating_digits",
+    "tracing_enabled",
     "version",
 ]
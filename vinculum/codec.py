@@ -0,0 +1,116 @@
+def read_pair(
+    data: bytes | bytearray | memoryview,
+    offset: int = 0,
+) -> tuple[int, int, int]:
+    """
+    Reads a numerator and denominator that were written by `write_pair`,
+    starting at byte `offset` of `data`.
+
+    Returns the numerator, the denominator and the offset of the first byte
+    after the pair. `memoryview` data is read without being copied.
+
+    Raises `ValueError` if `data` ends before the pair does.
+    """
+
+    if isinstance(data, memoryview) and data.format == "B":
+        view = data
+    else:
+        view = memoryview(data).cast("B")
+
+    length, offset = _read_length(view, offset)
+    end = offset + length
+    _check_length(view, end)
+    numerator = int.from_bytes(view[offset:end], "little", signed=True)
+
+    length, offset = _read_length(view, end)
+    end = offset + length
+    _check_length(view, end)
+    denominator = int.from_bytes(view[offset:end], "little")
+
+    return numerator, denominator, end
+
+
+def write_pair(buffer: bytearray, numerator: int, denominator: int) -> None:
+    """
+    Appends a numerator and non-negative denominator to `buffer`.
+
+    Each integer is written as a varint byte length then its little-endian
+    bytes: two's complement for the numerator and unsigned for the
+    denominator.
+    """
+
+    magnitude = ~numerator if numerator < 0 else numerator
+    length = magnitude.bit_length() // 8 + 1
+
+    _write_varint(buffer, length)
+    buffer += numerator.to_bytes(length, "little", signed=True)
+
+    length = (denominator.bit_length() + 7) // 8
+
+    _write_varint(buffer, length)
+    buffer += denominator.to_bytes(length, "little")
+
+
+def _check_length(view: memoryview, end: int) -> None:
+    """
+    Raises `ValueError` if `view` ends before `end`.
+    """
+
+    if end > len(view):
+        raise ValueError(f"Unexpected end of data at byte {len(view)}")
+
+
+def _read_length(view: memoryview, offset: int) -> tuple[int, int]:
+    """
+    Reads a length that was written as a varint, starting at byte `offset` of
+    `view`.
+
+    Returns the length and the offset of the first byte after it.
+    """
+
+    try:
+        length: int = view[offset]
+    except IndexError:
+        raise ValueError(f"Unexpected end of data at byte {len(view)}")
+
+    # Most lengths are shorter than 128 bytes, so fit in one byte.
+    if length < 0x80:
+        return length, offset + 1
+
+    return _read_varint(view, offset)
+
+
+def _read_varint(view: memoryview, offset: int) -> tuple[int, int]:
+    """
+    Reads an unsigned LEB128 varint starting at byte `offset` of `view`.
+
+    Returns the integer and the offset of the first byte after it.
+    """
+
+    value = 0
+    shift = 0
+
+    while True:
+        _check_length(view, offset + 1)
+
+        byte = view[offset]
+        offset += 1
+
+        value |= (byte & 0x7F) << shift
+
+        if byte < 0x80:
+            return value, offset
+
+        shift += 7
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    """
+    Appends a non-negative integer to `buffer` as an unsigned LEB128 varint.
+    """
+
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    buffer.append(value)
@@ -0,0 +1,27 @@
+from enum import Enum
+
+
+class DecimalPart(Enum):
+    """
+    A part of a decimal string.
+    """
+
+    SIGN = "sign"
+    """
+    The negative sign.
+    """
+
+    INTEGRAL = "integral"
+    """
+    Digits before the decimal point.
+    """
+
+    FRACTIONAL = "fractional"
+    """
+    Non-recurring digits after the decimal point.
+    """
+
+    RECURRING = "recurring"
+    """
+    Recurring digits after the decimal point.
+    """
@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Iterator
+from warnings import warn
+
+Snapshot = dict[str, dict[str, float]]
+"""
+A copy of the measurements recorded by an `Instrumentation`, keyed on the
+kind of measurement then the operation.
+"""
+
+SizeCallback = Callable[[str, int, Any], None]
+"""
+A function called with the name of an operation, the bit length of its result
+and the result itself when the result is larger than the size threshold.
+"""
+
+
+class SizeWarning(UserWarning):
+    """
+    Warns that an operation produced a rational number larger than the size
+    threshold of an `Instrumentation`.
+    """
+
+
+class Instrumentation:
+    """
+    Records what Vinculum does while it is enabled by `instrument` or
+    `set_instrumentation`:
+
+    - `calls` counts calls per operation, like "__add__" and "decimal".
+    - `shortcuts` counts shortcuts taken, like "__mul__ by 1".
+    - `fallbacks` counts operations that fell back to converting an operand
+      with `Rational.from_any`.
+    - `seconds` records the cumulative time spent in
+      `greatest_common_divisor`, `decimal`, `int_to_buffer` and
+      `string_to_int`.
+    - `operand_bits` and `result_bits` are histograms of the bit lengths of
+      the operands and results of addition, subtraction, multiplication and
+      division.
+
+    The bit length of a rational number is the bit length of the larger of
+    its numerator and denominator. Histograms are keyed on the operation and
+    the next power of two, so 48-bit results of `__mul__` are counted in
+    ("__mul__", 64).
+
+    If `size_threshold` is set then `on_size_exceeded` is called whenever a
+    result has more bits. If `on_size_exceeded` is not set then a
+    `SizeWarning` is issued instead.
+    """
+
+    __slots__ = (
+        "calls",
+        "fallbacks",
+        "on_size_exceeded",
+        "operand_bits",
+        "result_bits",
+        "seconds",
+        "shortcuts",
+        "size_threshold",
+    )
+
+    def __init__(
+        self,
+        size_threshold: int | None = None,
+        on_size_exceeded: SizeCallback | None = None,
+    ) -> None:
+        self.calls: Counter[str] = Counter()
+        self.fallbacks: Counter[str] = Counter()
+        self.on_size_exceeded = on_size_exceeded
+        self.operand_bits: Counter[tuple[str, int]] = Counter()
+        self.result_bits: Counter[tuple[str, int]] = Counter()
+        self.seconds: defaultdict[str, float] = defaultdict(float)
+        self.shortcuts: Counter[str] = Counter()
+        self.size_threshold = size_threshold
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"calls={sum(self.calls.values())}, "
+            f"shortcuts={sum(self.shortcuts.values())}, "
+            f"fallbacks={sum(self.fallbacks.values())}, "
+            f"seconds={sum(self.seconds.values()):.6f})"
+        )
+
+    def reset(self) -> None:
+        """
+        Clears every measurement.
+        """
+
+        self.calls.clear()
+        self.fallbacks.clear()
+        self.operand_bits.clear()
+        self.result_bits.clear()
+        self.seconds.clear()
+        self.shortcuts.clear()
+
+    def snapshot(self, reset: bool = False) -> Snapshot:
+        """
+        Gets a copy of the measurements, suitable for exporting as JSON or to
+        a metrics pipeline. If `reset` is `True` then the measurements are
+        cleared after being copied.
+
+        Histogram buckets are keyed on the operation and bit length, like
+        "__add__ 64".
+
+        For example:
+
+            {
+                "calls": {"__add__": 2, "decimal": 1},
+                "fallbacks": {},
+                "operand_bits": {"__add__ 8": 2, "__add__ 64": 2},
+                "result_bits": {"__add__ 64": 2},
+                "seconds": {"decimal": 0.000012},
+                "shortcuts": {"__add__ 0": 1},
+            }
+        """
+
+        snapshot: Snapshot = {
+            "calls": dict(self.calls),
+            "fallbacks": dict(self.fallbacks),
+            "operand_bits": _histogram(self.operand_bits),
+            "result_bits": _histogram(self.result_bits),
+            "seconds": dict(self.seconds),
+            "shortcuts": dict(self.shortcuts),
+        }
+
+        if reset:
+            self.reset()
+
+        return snapshot
+
+
+enabled = False
+"""
+Whether or not any `Instrumentation` might be recording, in any context.
+Instrumented code checks this before doing anything else, so costs nothing
+more while disabled.
+"""
+
+_active = 0
+"""
+Number of `instrument` contexts that have not yet exited, in every thread and
+task.
+"""
+
+_active_lock = Lock()
+
+_default: Instrumentation | None = None
+
+_override: ContextVar[Instrumentation | None] = ContextVar(
+    "instrumentation",
+    default=None,
+)
+
+
+def count_call(operation: str) -> None:
+    """
+    Counts a call to `operation`.
+    """
+
+    instrumentation = get_instrumentation()
+
+    if instrumentation is not None:
+        instrumentation.calls[operation] += 1
+
+
+def count_fallback(operation: str) -> None:
+    """
+    Counts a fallback to `Rational.from_any` by `operation`.
+    """
+
+    instrumentation = get_instrumentation()
+
+    if instrumentation is not None:
+        instrumentation.fallbacks[operation] += 1
+
+
+def count_shortcut(shortcut: str) -> None:
+    """
+    Counts a shortcut.
+    """
+
+    instrumentation = get_instrumentation()
+
+    if instrumentation is not None:
+        instrumentation.shortcuts[shortcut] += 1
+
+
+def get_instrumentation() -> Instrumentation | None:
+    """
+    Gets the `Instrumentation` recording in this context, or `None` if
+    instrumentation is disabled.
+    """
+
+    override = _override.get()
+    return _default if override is None else override
+
+
+@contextmanager
+def instrument(
+    instrumentation: Instrumentation | None = None,
+) -> Iterator[Instrumentation]:
+    """
+    Records measurements within a context, into `instrumentation` or a new
+    `Instrumentation`.
+
+    Only operations in this context are recorded: other threads and tasks are
+    not, and an `instrument` context in one doesn't affect any other.
+
+    For example:
+
+        with instrument() as instrumentation:
+            ...
+
+        export(instrumentation.snapshot())
+    """
+
+    if instrumentation is None:
+        instrumentation = Instrumentation()
+
+    _add_active(1)
+    token = _override.set(instrumentation)
+
+    try:
+        yield instrumentation
+    finally:
+        _override.reset(token)
+        _add_active(-1)
+
+
+def measure_sizes(operation: str, left: Any, right: Any, result: Any) -> None:
+    """
+    Records the bit lengths of the operands and result of `operation`, and
+    reports the result if it is larger than the size threshold.
+    """
+
+    instrumentation = get_instrumentation()
+
+    if instrumentation is None:
+        return
+
+    for operand in (left, right):
+        bits = _bit_length(operand)
+        if bits is not None:
+            instrumentation.operand_bits[operation, _bucket(bits)] += 1
+
+    bits = _bit_length(result)
+
+    if bits is None:
+        return
+
+    instrumentation.result_bits[operation, _bucket(bits)] += 1
+
+    threshold = instrumentation.size_threshold
+
+    if threshold is None or bits <= threshold:
+        return
+
+    if instrumentation.on_size_exceeded is not None:
+        instrumentation.on_size_exceeded(operation, bits, result)
+        return
+
+    warn(
+        f"{operation} produced a {bits}-bit result, exceeding the "
+        f"{threshold}-bit threshold",
+        SizeWarning,
+        stacklevel=3,
+    )
+
+
+def set_instrumentation(instrumentation: Instrumentation | None) -> None:
+    """
+    Sets the `Instrumentation` that records measurements in every context
+    that has not overridden it with `instrument`. Set `None` to disable
+    instrumentation.
+    """
+
+    global _default  # pylint: disable=global-statement
+    _default = instrumentation
+    _add_active(0)
+
+
+@contextmanager
+def timing(operation: str) -> Iterator[None]:
+    """
+    Adds the time spent within a context to the cumulative time of
+    `operation`.
+    """
+
+    started = perf_counter()
+
+    try:
+        yield
+    finally:
+        instrumentation = get_instrumentation()
+
+        if instrumentation is not None:
+            instrumentation.seconds[operation] += perf_counter() - started
+
+
+def _add_active(change: int) -> None:
+    """
+    Adds `change` to the number of open `instrument` contexts and updates
+    `enabled`.
+    """
+
+    global _active, enabled  # pylint: disable=global-statement
+
+    with _active_lock:
+        _active += change
+        enabled = _default is not None or _active > 0
+
+
+def _bit_length(value: Any) -> int | None:
+    """
+    Gets the bit length of an integer or the larger of the numerator and
+    denominator of a rational number, or `None` if `value` is neither.
+    """
+
+    if isinstance(value, int):
+        return value.bit_length()
+
+    try:
+        numerator: int = value.numerator
+        denominator: int = value.denominator
+    except AttributeError:
+        return None
+
+    return max(numerator.bit_length(), denominator.bit_length())
+
+
+def _bucket(bits: int) -> int:
+    """
+    Gets the histogram bucket of a bit length: the next power of two.
+    """
+
+    return 1 << (bits - 1).bit_length() if bits > 1 else bits
+
+
+def _histogram(counter: Counter[tuple[str, int]]) -> dict[str, float]:
+    """
+    Flattens a histogram into a dictionary keyed on "<operation> <bits>".
+    """
+
+    return {
+        f"{operation} {bits}": count
+        for (operation, bits), count in sorted(counter.items())
+    }
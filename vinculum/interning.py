@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+
+SMALL_NUMERATOR = 128
+"""
+Largest magnitude of a numerator that is always interned.
+"""
+
+SMALL_DENOMINATOR = 128
+"""
+Largest denominator that is always interned.
+"""
+
+
+class InternCache:
+    """
+    A bounded cache of interned rational numbers, keyed on their numerators
+    and denominators.
+
+    Rational numbers outside the always-interned small range are shared while
+    they remain in the cache. When the cache is full, the least recently used
+    value is evicted.
+    """
+
+    __slots__ = ("_entries", "_hits", "_maxsize", "_misses")
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError(f"Maximum size {maxsize} is less than 1")
+
+        self._entries: OrderedDict[tuple[int, int], Any] = OrderedDict()
+        self._hits = 0
+        self._maxsize = maxsize
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(maxsize={self._maxsize}, "
+            f"size={len(self._entries)}, hits={self._hits}, "
+            f"misses={self._misses})"
+        )
+
+    def clear(self) -> None:
+        """
+        Evicts every value and resets the statistics.
+        """
+
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: tuple[int, int]) -> Any:
+        """
+        Gets the value interned for `key`, or `None` if there is no such
+        value.
+        """
+
+        entries = self._entries
+
+        try:
+            value = entries[key]
+        except KeyError:
+            self._misses += 1
+            return None
+
+        entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    @property
+    def hits(self) -> int:
+        """
+        Number of lookups that found an interned value.
+        """
+
+        return self._hits
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Maximum number of interned values.
+        """
+
+        return self._maxsize
+
+    @property
+    def misses(self) -> int:
+        """
+        Number of lookups that did not find an interned value.
+        """
+
+        return self._misses
+
+    def put(self, key: tuple[int, int], value: Any) -> None:
+        """
+        Interns `value` for `key`, evicting the least recently used value if
+        the cache is full.
+        """
+
+        entries = self._entries
+        entries[key] = value
+
+        if len(entries) > self._maxsize:
+            entries.popitem(last=False)
+
+
+_cache: InternCache | None = None
+
+
+def get_intern_cache() -> InternCache | None:
+    """
+    Gets the intern cache in effect, or `None` if only small rational numbers
+    are interned.
+    """
+
+    return _cache
+
+
+def set_intern_cache(cache: InternCache | None) -> None:
+    """
+    Sets the intern cache for rational numbers outside the always-interned
+    small range. Set `None` to intern only small rational numbers.
+
+    For example:
+
+        set_intern_cache(InternCache(10_000))
+    """
+
+    global _cache  # pylint: disable=global-statement
+    _cache = cache
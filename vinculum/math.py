@@ -1,8 +1,191 @@
+from functools import lru_cache
 from io import StringIO
-from typing import List, Optional
+from math import gcd
+from re import Match, compile  # pylint: disable=redefined-builtin
+from sys import get_int_max_str_digits
+from typing import Dict, Iterator, List, Optional, cast
 
+from vinculum import instrumentation, tracing
+from vinculum.instrumentation import timing
 from vinculum.log import log
 
+_ALWAYS_NATIVE_BITS = 1_990
+"""
+Integers of up to this many bits have no more than 600 digits, which is fewer
+than the lowest possible integer string conversion length limit, so can always
+be converted natively.
+"""
+
+_ALWAYS_NATIVE_DIGITS = 600
+"""
+Integers with up to this many digits are shorter than the lowest possible
+integer string conversion length limit, so can always be converted natively.
+"""
+
+_BITS_PER_HUNDRED_DIGITS = 332
+"""
+A lower bound of the number of bits needed to describe 100 decimal digits.
+"""
+
+_LEHMER_BITS = 60
+"""
+The number of leading bits that Lehmer's algorithm steps through at a time.
+"""
+
+_LEHMER_MIN_BITS = 4_000
+"""
+The smallest operand, in bits, that Lehmer's algorithm is faster for than
+plain Euclidean steps.
+"""
+
+_MAX_NATIVE_DIGITS = 1_024
+"""
+The maximum number of digits to convert with native `str()` and `int()`.
+"""
+
+_MAX_DIRECT_ORDER = 128
+"""
+Orders up to this bound are found by multiplying powers of the base rather
+than by factorising the modulus.
+"""
+
+_MAX_TRIAL_DIVISOR = 1_000
+"""
+The largest divisor to try when factorising. Every integer below one million
+can be factorised completely.
+"""
+
+_NON_BYTE_DIGIT = compile(rb"[^0-9]")
+
+_NON_DIGIT = compile(r"\D")
+
+
+def _decimal_period(
+    numerator: int,
+    denominator: int,
+    max_period: int | None = None,
+) -> tuple[int, int | None]:
+    """
+    Gets the lengths of the non-recurring and recurring parts of the decimal
+    expansion of the positive fraction `numerator`/`denominator`.
+
+    For example, 1/6 is 0.16666... so has one non-recurring digit (1) and a
+    recurring period of one digit (6).
+
+    The period of a terminating expansion is 0. If `max_period` is set and the
+    period is longer than `max_period` then the period is `None`.
+
+    Raises `ValueError` if `max_period` is not set and the reduced denominator
+    has a prime factor larger than one million; see `_multiplicative_order`.
+    """
+
+    if denominator < 1:
+        raise ValueError(f"Denominator {denominator} is not positive")
+
+    divisor = gcd(numerator, denominator)
+    remaining = denominator // divisor
+
+    twos = (remaining & -remaining).bit_length() - 1
+    remaining >>= twos
+
+    remaining, fives = _strip_factor(remaining, 5)
+
+    pre_period = max(twos, fives)
+
+    if remaining == 1:
+        return pre_period, 0
+
+    if max_period is not None and max_period < 1:
+        return pre_period, None
+
+    return pre_period, _multiplicative_order(10, remaining, max_period)
+
+
+def fractional_digits(
+    numerator: int,
+    denominator: int,
+    count: int,
+    chunk_digits: int | None = None,
+) -> Iterator[str]:
+    """
+    Yields the first `count` digits after the decimal point of the positive
+    fraction `numerator`/`denominator`.
+
+    Digits are yielded in strings of up to `chunk_digits` digits each, which is
+    capped at (and by default) 1,024. Only the current remainder is held
+    between strings.
+    """
+
+    chunk_digits = _chunk_digits(chunk_digits)
+
+    remainder = numerator % denominator
+
+    while count > 0:
+        digits = min(chunk_digits, count)
+        scaled = remainder * power_of_ten(digits)
+        quotient, remainder = divmod(scaled, denominator)
+        yield str(quotient).zfill(digits)
+        count -= digits
+
+
+def euclid_steps(a: int, b: int, max_steps: int) -> tuple[int, int, int]:
+    """
+    Performs up to `max_steps` steps of Euclid's algorithm, where each step
+    replaces `a` and `b` with `b` and `a % b`. `a` must be greater than or
+    equal to `b`, and `b` must not be negative.
+
+    Returns the new `a`, the new `b` and the number of steps performed. `b` is
+    zero once `a` is the greatest common divisor.
+
+    Large operands are stepped through with Lehmer's algorithm: the quotients
+    of several consecutive steps are found from the leading bits of `a` and
+    `b`, then applied to the full operands at once.
+    """
+
+    steps = 0
+
+    # The operands only shrink, so Lehmer's algorithm is used until they are
+    # too small to benefit.
+    while b and steps < max_steps and a.bit_length() >= _LEHMER_MIN_BITS:
+        shift = a.bit_length() - _LEHMER_BITS
+        x = a >> shift
+        y = b >> shift
+
+        # Cofactors alternate in sign, so only their magnitudes are tracked.
+        p, q, r, s = 1, 0, 0, 1
+        lead_steps = 0
+        limit = max_steps - steps
+
+        while lead_steps < limit and y != r:
+            quotient = (x + p - 1) // (y - r)
+            next_r = q + quotient * s
+            remainder = x - quotient * y
+
+            if next_r > remainder:
+                break
+
+            x, y = y, remainder
+            p, q, r, s = s, r, next_r, p + quotient * r
+            lead_steps += 1
+
+        if lead_steps == 0:
+            a, b = b, a % b
+            steps += 1
+            continue
+
+        if lead_steps & 1:
+            a, b = p * b - q * a, s * a - r * b
+        else:
+            a, b = p * a - q * b, s * b - r * a
+
+        steps += lead_steps
+
+    while b and steps < max_steps:
+        a, b = b, a % b
+        steps += 1
+
+    return a, b, steps
+
 
 def greatest_common_divisor(
     a: int,
@@ -11,17 +194,26 @@ def greatest_common_divisor(
 ) -> int:
     """
     Gets the greatest common divisor of `a` and `b`.
+
+    If `max_iterations` is set and Euclid's algorithm needs more than
+    `max_iterations` iterations to find the divisor then returns 1.
     """
 
-    log.debug(
-        (
-            "Attempting to discover the greatest common divisor of %i and %i "
-            "within %s iterations"
-        ),
-        a,
-        b,
-        "unlimited" if max_iterations is None else max_iterations,
-    )
+    if instrumentation.enabled:
+        with timing("greatest_common_divisor"):
+            return _greatest_common_divisor(a, b, max_iterations)
+
+    return _greatest_common_divisor(a, b, max_iterations)
+
+
+def _greatest_common_divisor(
+    a: int,
+    b: int,
+    max_iterations: int | None,
+) -> int:
+    """
+    Implements `greatest_common_divisor`.
+    """
 
     biggest = max(a, b)
     smallest = min(a, b)
@@ -29,43 +221,66 @@ def greatest_common_divisor(
     if smallest in (0, biggest):
         return smallest
 
-    count = 0
+    if max_iterations is None:
+        return gcd(a, b)
+
+    biggest = abs(a)
+    smallest = abs(b)
+
+    if smallest > biggest:
+        biggest, smallest = smallest, biggest
+
+    # Lamé's theorem bounds the number of iterations by the size of the
+    # smallest operand, so a budget beyond that bound can never run out.
+    if max_iterations > smallest.bit_length() * 3 // 2 + 2:
+        return gcd(a, b)
+
+    if tracing.enabled:
+        log.debug(
+            (
+                "Attempting to discover the greatest common divisor of %i and "
+                "%i within %i iterations"
+            ),
+            a,
+            b,
+            max_iterations,
+        )
+
+    # Every iteration finds a non-zero remainder, so one more step is needed
+    # to find the zero remainder that proves the divisor.
+    divisor, remainder, steps = euclid_steps(
+        biggest,
+        smallest,
+        max_iterations + 1,
+    )
 
-    while True:
-        remainder = biggest % smallest
-
-        if remainder == 0:
-            if max_iterations is not None:
-                log.debug(
-                    (
-                        "Found the greatest common divisor of %i and "
-                        "%i (%i) on iteration %i"
-                    ),
-                    a,
-                    b,
-                    smallest,
-                    count,
-                )
-
-            return smallest
-
-        if max_iterations is not None:
-            count += 1
-            if count > max_iterations:
-                log.debug(
-                    (
-                        "Did not find the greatest common divisor of %i and "
-                        "%i within %i iterations"
-                    ),
-                    a,
-                    b,
-                    max_iterations,
-                )
-
-                return 1
-
-        biggest = smallest
-        smallest = remainder
+    if remainder == 0:
+        if tracing.enabled:
+            log.debug(
+                (
+                    "Found the greatest common divisor of %i and %i (%i) on "
+                    "iteration %i"
+                ),
+                a,
+                b,
+                divisor,
+                max(steps - 1, 0),
+            )
+
+        return divisor
+
+    if tracing.enabled:
+        log.debug(
+            (
+                "Did not find the greatest common divisor of %i and %i within "
+                "%i iterations"
+            ),
+            a,
+            b,
+            max_iterations,
+        )
+
+    return 1
 
 
 def int_to_buffer(
@@ -91,47 +306,449 @@ def int_to_buffer(
     you might prefer \u0305 ("Combining Overline").
     """
 
-    positive = number >= 0
-    number = abs(number)
+    if instrumentation.enabled:
+        with timing("int_to_buffer"):
+            _int_to_buffer(
+                number,
+                buffer,
+                leading_zeros,
+                recurring_count,
+                recurring_prefix,
+            )
+
+        return
+
+    _int_to_buffer(
+        number,
+        buffer,
+        leading_zeros,
+        recurring_count,
+        recurring_prefix,
+    )
 
-    wip: List[str] = []
 
-    min_leading_zeros = 1 if number == 0 else leading_zeros
-    leading_zeros = max(leading_zeros, min_leading_zeros)
+def _int_to_buffer(
+    number: int,
+    buffer: StringIO,
+    leading_zeros: int,
+    recurring_count: int,
+    recurring_prefix: Optional[str],
+) -> None:
+    """
+    Implements `int_to_buffer`.
+    """
 
-    e = 0
-    while (10**e) <= number:
-        digit = int(number // 10**e) % 10
-        wip.append(str(digit))
-        e += 1
+    positive = number >= 0
+    number = abs(number)
+
+    if number == 0:
+        digits = ""
+        leading_zeros = max(leading_zeros, 1)
+    elif number.bit_length() <= _ALWAYS_NATIVE_BITS:
+        digits = str(number)
+    else:
+        pieces: List[str] = []
+        _int_to_pieces(number, pieces)
+        digits = "".join(pieces)
 
     if not positive:
         buffer.write("-")
 
-    for _ in range(leading_zeros):
-        buffer.write("0")
+    if leading_zeros > 0:
+        digits = ("0" * leading_zeros) + digits
+
+    if recurring_prefix is None or recurring_count <= 0:
+        buffer.write(digits)
+        return
+
+    recur_from = max(len(digits) - recurring_count, 0)
+
+    buffer.write(digits[:recur_from])
 
-    recur_from = len(wip) - recurring_count
+    if recur_from < len(digits):
+        buffer.write(recurring_prefix)
+        buffer.write(recurring_prefix.join(digits[recur_from:]))
 
-    for index, c in enumerate(reversed(wip)):
-        if recurring_prefix is not None and index >= recur_from:
-            buffer.write(recurring_prefix)
 
-        buffer.write(c)
+def _int_to_pieces(number: int, pieces: List[str]) -> None:
+    """
+    Appends the decimal digits of the positive integer `number` to `pieces`.
+
+    The number is split in half by cached powers of ten until each part is
+    small enough to convert with the native `str()`.
+    """
+
+    leaf_digits = _native_digits()
 
+    powers = [power_of_ten(leaf_digits)]
+    max_bits = (leaf_digits * 2 * _BITS_PER_HUNDRED_DIGITS) // 100
+
+    while number.bit_length() > max_bits:
+        powers.append(power_of_ten(leaf_digits * (2 ** len(powers))))
+        max_bits *= 2
+
+    _split_to_pieces(
+        number,
+        pieces,
+        powers,
+        len(powers) - 1,
+        leaf_digits,
+        False,
+    )
 
-def string_to_int(string: str) -> int:
+
+def _split_to_pieces(
+    number: int,
+    pieces: List[str],
+    powers: List[int],
+    level: int,
+    leaf_digits: int,
+    pad: bool,
+) -> None:
+    """
+    Appends the decimal digits of `number` to `pieces`.
+
+    `number` must be less than the square of `powers[level]`. When `pad` is
+    true, the digits are zero-padded to the full width of that square.
+    """
+
+    if level < 0:
+        piece = str(number)
+        pieces.append(piece.zfill(leaf_digits) if pad else piece)
+        return
+
+    high, low = divmod(number, powers[level])
+
+    if pad or high:
+        _split_to_pieces(high, pieces, powers, level - 1, leaf_digits, pad)
+        _split_to_pieces(low, pieces, powers, level - 1, leaf_digits, True)
+    else:
+        _split_to_pieces(low, pieces, powers, level - 1, leaf_digits, False)
+
+
+def _native_digits() -> int:
+    """
+    Gets the maximum number of digits to convert natively in one step.
+
+    This respects the interpreter's integer string conversion length limit.
+    """
+
+    limit = get_int_max_str_digits()
+
+    if limit == 0:
+        return _MAX_NATIVE_DIGITS
+
+    return min(limit, _MAX_NATIVE_DIGITS)
+
+
+def _multiplicative_order(
+    base: int,
+    modulus: int,
+    max_order: int | None = None,
+) -> int | None:
+    """
+    Gets the multiplicative order of `base` modulo `modulus`; the smallest
+    positive `k` for which `base**k % modulus == 1`.
+
+    Raises `ValueError` if `base` and `modulus` are not coprime.
+
+    If `max_order` is set and the order is greater than `max_order` then
+    returns `None`. Small bounds are searched one power at a time, which is
+    cheaper than factorising the modulus.
+
+    A modulus that cannot be factorised by trial division can only be searched
+    one power at a time, so raises `ValueError` if `max_order` is not set.
+    """
+
+    if modulus == 1:
+        return 1
+
+    if gcd(base, modulus) != 1:
+        raise ValueError(f"{base} and {modulus} are not coprime")
+
+    if max_order is not None and max_order <= _MAX_DIRECT_ORDER:
+        return _search_order(base, modulus, max_order)
+
+    factors = _factorise(modulus)
+
+    if factors is None:
+        if max_order is None:
+            raise ValueError(
+                f"{modulus} cannot be factorised by trial division; set "
+                "max_order to bound the search"
+            )
+
+        return _search_order(base, modulus, max_order)
+
+    # Start with the Carmichael function of the modulus, which every order
+    # divides, then remove each prime factor while the result still holds.
+
+    order = 1
+    order_primes: set[int] = set()
+
+    for prime, exponent in factors.items():
+        prime_order = (prime - 1) * (prime ** (exponent - 1))
+
+        if prime == 2 and exponent > 2:
+            prime_order //= 2
+
+        order = order * prime_order // gcd(order, prime_order)
+
+        if exponent > 1:
+            order_primes.add(prime)
+
+        order_primes.update(cast(Dict[int, int], _factorise(prime - 1)))
+
+    for prime in order_primes:
+        while order % prime == 0 and pow(base, order // prime, modulus) == 1:
+            order //= prime
+
+    if max_order is not None and order > max_order:
+        return None
+
+    return order
+
+
+@lru_cache(maxsize=128)
+def power_of_ten(exponent: int) -> int:
+    """
+    Gets 10 raised to the power of `exponent`.
+
+    The most recently used powers are cached, so repeated requests for the
+    same exponent are free.
+    """
+
+    power: int = 10**exponent
+    return power
+
+
+def string_to_int(string: str | bytes | memoryview) -> int:
     """
     Converts `string` to an integer.
 
+    `string` can be a `str`, `bytes` or `memoryview` of decimal digits. A
+    `memoryview` is parsed in place without being copied or decoded.
+
+    Raises `ValueError` if `string` contains anything other than digits.
+
     Avoids CVE-2020-10735: https://github.com/python/cpython/issues/95778
     """
 
-    result = 0
+    if instrumentation.enabled:
+        with timing("string_to_int"):
+            return _string_to_int(string)
+
+    return _string_to_int(string)
+
+
+def _string_to_int(
+    string: str | bytes | memoryview,
+) -> int:
+    """
+    Implements `string_to_int`.
+    """
+
+    non_digit: Match[str] | Match[bytes] | None
+
+    if isinstance(string, str):
+        non_digit = _NON_DIGIT.search(string)
+    else:
+        non_digit = _NON_BYTE_DIGIT.search(string)
+
+    if non_digit is not None:
+        raise ValueError(f"Non-digit character at index {non_digit.start()}")
+
     string_len = len(string)
 
-    for index, digit in enumerate(string):
-        e = string_len - (index + 1)
-        result += int(digit) * (10**e)
+    if string_len == 0:
+        return 0
+
+    if string_len <= _ALWAYS_NATIVE_DIGITS:
+        return int(string)
+
+    return _parse_digits(string, 0, string_len, _native_digits())
+
+
+def _parse_digits(
+    string: str | bytes | memoryview,
+    start: int,
+    end: int,
+    leaf_digits: int,
+) -> int:
+    """
+    Converts the digits in `string` from index `start` to `end` to an integer.
+
+    The digits are split by powers of ten until each part is small enough to
+    convert with the native `int()`.
+    """
+
+    length = end - start
+
+    if length <= leaf_digits:
+        return int(string[start:end])
+
+    low_digits = leaf_digits
+    while low_digits * 2 < length:
+        low_digits *= 2
+
+    split = end - low_digits
+
+    high = _parse_digits(string, start, split, leaf_digits)
+    low = _parse_digits(string, split, end, leaf_digits)
+
+    return high * power_of_ten(low_digits) + low
+
+
+def terminating_digits(numerator: int, denominator: int) -> str | None:
+    """
+    Gets every digit after the decimal point of the fraction
+    `numerator`/`denominator`, if its decimal expansion terminates within 600
+    digits. Otherwise returns `None`.
+
+    An expansion terminates if the denominator has no prime factors other than
+    2 and 5. Rather than dividing digit by digit, the numerator is scaled by
+    the powers of 2 and 5 that complete the denominator to a power of ten,
+    then converted to a string once.
+    """
+
+    if denominator < 1:
+        raise ValueError(f"Denominator {denominator} is not positive")
+
+    scaling = _terminating_scale(denominator)
+
+    if scaling is None:
+        return None
+
+    count, scale = scaling
+    digits = str((numerator % denominator) * scale).zfill(count)
+
+    # The denominator might not have been reduced, so might describe more
+    # digits than the expansion really has.
+    return digits.rstrip("0")
+
+
+def _chunk_digits(chunk_digits: int | None) -> int:
+    """
+    Gets the number of digits to yield at a time, given the number requested.
+    """
+
+    native_digits = _native_digits()
+
+    if chunk_digits is None or chunk_digits > native_digits:
+        return native_digits
+
+    if chunk_digits < 1:
+        raise ValueError(f"Chunk size {chunk_digits} is not positive")
+
+    return chunk_digits
+
+
+@lru_cache(maxsize=256)
+def _factorise(number: int) -> Dict[int, int] | None:
+    """
+    Gets the prime factors of the positive integer `number` and their
+    exponents by trial division.
+
+    Returns `None` if `number` has a factor that is too large to find by trial
+    division.
+
+    Denominators repeat, so the results are cached and must not be changed.
+    """
+
+    factors: Dict[int, int] = {}
+
+    divisor = 2
+    while divisor <= _MAX_TRIAL_DIVISOR and divisor * divisor <= number:
+        while number % divisor == 0:
+            factors[divisor] = factors.get(divisor, 0) + 1
+            number //= divisor
+
+        divisor += 1 if divisor == 2 else 2
+
+    if number == 1:
+        return factors
+
+    if number > _MAX_TRIAL_DIVISOR * _MAX_TRIAL_DIVISOR:
+        return None
+
+    # Anything left without a factor no greater than its square root is prime.
+    factors[number] = factors.get(number, 0) + 1
+    return factors
+
+
+@lru_cache(maxsize=256)
+def _terminating_scale(denominator: int) -> tuple[int, int] | None:
+    """
+    Gets the number of digits after the decimal point of any fraction with the
+    positive `denominator`, and the power of 2 or 5 that scales the
+    denominator up to 10 to the power of that number of digits.
+
+    Returns `None` if fractions with this denominator don't terminate within
+    600 digits.
+
+    Money-like denominators repeat so often that the results are cached.
+    """
+
+    twos = (denominator & -denominator).bit_length() - 1
+
+    if twos > _ALWAYS_NATIVE_DIGITS:
+        return None
+
+    odd = denominator >> twos
+    fives = 0
+
+    while odd % 5 == 0 and fives <= _ALWAYS_NATIVE_DIGITS:
+        odd //= 5
+        fives += 1
+
+    if odd != 1 or fives > _ALWAYS_NATIVE_DIGITS:
+        return None
+
+    count = max(twos, fives)
+    return count, (5 ** (count - fives)) << (count - twos)
+
+
+def _search_order(base: int, modulus: int, max_order: int) -> int | None:
+    """
+    Gets the multiplicative order of `base` modulo `modulus` by multiplying
+    up to `max_order` powers of `base`, or `None` if the order is greater.
+    """
+
+    power = base % modulus
+
+    for order in range(1, max_order + 1):
+        if power == 1:
+            return order
+
+        power = (power * base) % modulus
+
+    return None
+
+
+def _strip_factor(number: int, factor: int) -> tuple[int, int]:
+    """
+    Divides the nonzero integer `number` by `factor` as many times as it
+    cleanly divides.
+
+    Returns the quotient and the number of divisions.
+    """
+
+    count = 0
+    powers: List[tuple[int, int]] = []
+
+    power = factor
+    exponent = 1
+
+    while number % power == 0:
+        number //= power
+        count += exponent
+        powers.append((power, exponent))
+        power *= power
+        exponent *= 2
+
+    for power, exponent in reversed(powers):
+        if number % power == 0:
+            number //= power
+            count += exponent
 
-    return result
+    return number, count
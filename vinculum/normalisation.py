@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+
+class Normalisation:
+    """
+    A policy that describes when the results of adding and subtracting
+    rational numbers are reduced.
+
+    Results whose denominators are longer than `max_bits` bits are reduced.
+    If `max_bits` is `None` then results are never reduced.
+    """
+
+    __slots__ = ("_max_bits",)
+
+    def __init__(self, max_bits: int | None) -> None:
+        if max_bits is not None and max_bits < 0:
+            raise ValueError(f"Maximum bit length {max_bits} is negative")
+
+        self._max_bits = max_bits
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Normalisation):
+            return self._max_bits == other._max_bits
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._max_bits)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(max_bits={self._max_bits})"
+
+    @staticmethod
+    def eager() -> Normalisation:
+        """
+        Reduce every result.
+        """
+
+        return EAGER
+
+    @staticmethod
+    def lazy() -> Normalisation:
+        """
+        Never reduce results.
+        """
+
+        return LAZY
+
+    @property
+    def max_bits(self) -> int | None:
+        """
+        Maximum bit length of an unreduced denominator, or `None` if there is
+        no maximum.
+        """
+
+        return self._max_bits
+
+
+EAGER = Normalisation(0)
+"""
+Reduce every result.
+"""
+
+LAZY = Normalisation(None)
+"""
+Never reduce results.
+"""
+
+_default = LAZY
+
+_override: ContextVar[Normalisation | None] = ContextVar(
+    "normalisation",
+    default=None,
+)
+
+
+def get_normalisation() -> Normalisation:
+    """
+    Gets the normalisation policy in effect.
+    """
+
+    override = _override.get()
+    return _default if override is None else override
+
+
+@contextmanager
+def normalisation(policy: Normalisation) -> Iterator[Normalisation]:
+    """
+    Applies a normalisation policy within a context.
+
+    For example:
+
+        with normalisation(EAGER):
+            ...
+    """
+
+    token = _override.set(policy)
+
+    try:
+        yield policy
+    finally:
+        _override.reset(token)
+
+
+def set_normalisation(policy: Normalisation) -> None:
+    """
+    Sets the normalisation policy for every context that has not overridden
+    it with `normalisation`.
+    """
+
+    global _default  # pylint: disable=global-statement
+    _default = policy
@@ -1,18 +1,85 @@
 from __future__ import annotations
 
-from io import StringIO
+import numbers
+from functools import lru_cache
+from io import StringIO, UnsupportedOperation
 from locale import localeconv
-from math import isclose, modf
-from re import compile  # pylint: disable=redefined-builtin
-from typing import Any, List, Optional, cast
-
+from math import gcd, inf, isfinite, isinf, isnan, nan
+from mmap import ACCESS_READ, mmap
+from operator import index
+from os import PathLike, fstat
+from re import Pattern, compile, escape  # pylint: disable=redefined-builtin
+from stat import S_ISREG
+from sys import get_int_max_str_digits, hash_info
+from typing import IO, Any, Iterable, Iterator, Optional
+
+from vinculum import instrumentation, interning, rendering, tracing
+from vinculum.codec import read_pair, write_pair
+from vinculum.decimal_part import DecimalPart
+from vinculum.instrumentation import (
+    count_call,
+    count_fallback,
+    count_shortcut,
+    measure_sizes,
+    timing,
+)
+from vinculum.interning import SMALL_DENOMINATOR, SMALL_NUMERATOR, InternCache
 from vinculum.log import log
-from vinculum.math import greatest_common_divisor, int_to_buffer, string_to_int
+from vinculum.math import (
+    _decimal_period,
+    fractional_digits,
+    greatest_common_divisor,
+    int_to_buffer,
+    string_to_int,
+    terminating_digits,
+)
+from vinculum.normalisation import get_normalisation
+from vinculum.rendering import DecimalEntry
 
 DECIMAL_POINT = str(localeconv()["decimal_point"])
 
-DECIMAL_PATTERN = compile(rf"^(-?\d+)(?:\{DECIMAL_POINT}(\d+))?$")
-FRACTION_PATTERN = compile(r"^(\d+)/(\d+)$")
+DIGITS = r"\d+(?:_\d+)*"
+"""
+Digits, optionally separated by underscores.
+"""
+
+DECIMAL_PATTERN = compile(
+    rf"^([+-]?)({DIGITS})(?:\{DECIMAL_POINT}({DIGITS}))?"
+    rf"(?:[eE]([+-]?{DIGITS}))?$"
+)
+
+FRACTION_PATTERN = compile(rf"^([+-]?)({DIGITS})/({DIGITS})$")
+
+BYTES_DIGITS = rb"\d+(?:_\d+)*"
+"""
+ASCII digits, optionally separated by underscores.
+"""
+
+_HASH_MODULUS = hash_info.modulus
+"""
+Prime modulus of Python's numeric hashes.
+"""
+
+_interned: dict[tuple[int, int], Rational] = {}
+"""
+Interned small rational numbers, keyed on their numerators and
+denominators.
+"""
+
+_new = object.__new__
+"""
+Creates an uninitialised `Rational`.
+"""
+
+_set = object.__setattr__
+"""
+Sets an attribute of an otherwise-immutable `Rational`.
+"""
+
+_UNKNOWN: Any = object()
+"""
+The `_reduced` value of a `Rational` that is not known to be reduced or not.
+"""
 
 
 class Rational:
@@ -21,140 +88,348 @@ class Rational:
 
     For example, to describe the rational number 3/2 (decimal 1.5), the
     `numerator` is 3 and `denominator` is 2.
+
+    Rational numbers are immutable and hashable. Small rational numbers, and
+    any held in the intern cache, are shared rather than duplicated.
+
+    The hash and the `integral`, `reciprocal` and `reduced` properties are
+    calculated once per instance then cached.
+    """
+
+    __slots__ = (
+        "_denominator",
+        "_hash",
+        "_integral",
+        "_numerator",
+        "_reciprocal",
+        "_reduced",
+    )
+
+    _denominator: int
+    _hash: int
+    _integral: int
+    _numerator: int
+    _reciprocal: Rational
+
+    _reduced: Rational | None
+    """
+    The reduced form of this rational number, or `None` if this rational
+    number is known to be reduced. `_UNKNOWN` if unknown.
     """
 
-    def __init__(self, numerator: int, denominator: int = 1) -> None:
-        self._numerator = numerator
-        self._denominator = denominator
+    def __new__(cls, numerator: int, denominator: int = 1) -> Rational:
+        if type(numerator) is not int or type(denominator) is not int:
+            # Integer-like values (like NumPy integers) are converted to plain
+            # integers so that arithmetic can't overflow and interned
+            # instances shared by every caller hold the same types. Anything
+            # that isn't integer-like, like a float, raises TypeError.
+            numerator = index(numerator)
+            denominator = index(denominator)
+
+        if denominator < 0:
+            denominator = -denominator
+            numerator = -numerator
+
+        if cls is Rational:
+            if (
+                -SMALL_NUMERATOR <= numerator <= SMALL_NUMERATOR
+                and 0 < denominator <= SMALL_DENOMINATOR
+            ):
+                return _intern_small(numerator, denominator)
+
+            cache = interning._cache  # pylint: disable=protected-access
+
+            if cache is not None:
+                return _intern_cached(cache, numerator, denominator)
 
-        if self._denominator < 0:
-            self._denominator = abs(self._denominator)
-            self._numerator = self._numerator * -1
+        self = _new(cls)
+
+        _set_numerator(self, numerator)
+        _set_denominator(self, denominator)
+        _set_reduced(self, None if denominator == 1 else _UNKNOWN)
+
+        return self
 
     def __add__(self, right: Any) -> Rational:
-        if right == 0:
-            log.debug("__add__ taking a shortcut to self")
+        if instrumentation.enabled:
+            count_call("__add__")
+
+        if isinstance(right, int) and right == 0:
+            if tracing.enabled:
+                log.debug("__add__ taking a shortcut to self")
+
+            if instrumentation.enabled:
+                count_shortcut("__add__ 0")
+
             return self
 
         if isinstance(right, int):
-            log.debug("__add__ adding integer %i", right)
-            return Rational(
+            if tracing.enabled:
+                log.debug("__add__ adding integer %i", right)
+
+            result = Rational(
                 self._numerator + (right * self._denominator),
                 self._denominator,
             )
 
-        if isinstance(right, Rational):
-            log.debug("__add__ adding Rational %s", right)
+            # Adding an integer never introduces a common divisor.
+            if self.known_reduced:
+                _set(result, "_reduced", None)
 
-            if self._denominator == right._denominator:
-                return Rational(
-                    self._numerator + right._numerator,
-                    self._denominator,
-                )
+            if instrumentation.enabled:
+                measure_sizes("__add__", self, right, result)
 
-            new_self_numerator = self._numerator * right._denominator
-            new_right_numerator = right._numerator * self._denominator
+            return result
 
-            return Rational(
-                new_self_numerator + new_right_numerator,
-                self._denominator * right._denominator,
+        if isinstance(right, Rational):
+            if tracing.enabled:
+                log.debug("__add__ adding Rational %s", right)
+
+            result = self._add(
+                right._numerator,
+                right._denominator,
+                right.known_reduced,
             )
 
+            if instrumentation.enabled:
+                measure_sizes("__add__", self, right, result)
+
+            return result
+
+        if instrumentation.enabled:
+            count_fallback("__add__")
+
         a, b = self.comparable_with_self(right)
         f = Rational(a.numerator + b.numerator, a.denominator)
-        return f.reduced
+        result = f.reduced
+
+        if instrumentation.enabled:
+            measure_sizes("__add__", self, right, result)
+
+        return result
+
+    def __copy__(self) -> Rational:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Rational:
+        return self
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
 
     def __eq__(self, other: Any) -> bool:
-        if isinstance(other, float):
-            return isclose(float(self), other)
+        if instrumentation.enabled:
+            count_call("__eq__")
 
-        a, b = self.comparable_with_self(other)
-        return a.numerator == b.numerator
+        if self is other:
+            return True
+
+        # Strings and other types that can be converted to rational numbers
+        # are not equal to them, since their hashes would differ.
+        if isinstance(other, (Rational, int, float, numbers.Rational)):
+            return self._compare(other) == 0
+
+        return NotImplemented
 
     def __float__(self) -> float:
         return self._numerator / self._denominator
 
     def __floordiv__(self, other: Any) -> Rational:
-        a, b = self.comparable_with_self(other)
-        true_result = a * b.reciprocal
-        return Rational(true_result.integral)
+        if instrumentation.enabled:
+            count_call("__floordiv__")
+
+            if not isinstance(other, Rational):
+                count_fallback("__floordiv__")
+
+        if not isinstance(other, Rational):
+            other = Rational.from_any(other)
+
+        return Rational(
+            (self._numerator * other._denominator)
+            // (self._denominator * other._numerator)
+        )
 
     def __ge__(self, other: Any) -> bool:
-        if isinstance(other, float):
-            return float(self) >= other
+        if instrumentation.enabled:
+            count_call("__ge__")
 
-        a, b = self.comparable_with_self(other)
-        return a.numerator >= b.numerator
+        return self._compare(other) >= 0
 
     def __gt__(self, other: Any) -> bool:
-        if isinstance(other, float):
-            return float(self) > other
+        if instrumentation.enabled:
+            count_call("__gt__")
 
-        a, b = self.comparable_with_self(other)
-        return a.numerator > b.numerator
+        return self._compare(other) > 0
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+
+        # Python's numeric hashing rule: n/d hashes as n multiplied by the
+        # inverse of d modulo a prime, so equal values of int, float,
+        # Fraction and Rational share a hash whether or not they are reduced.
+        numerator = self._numerator
+        denominator = self._denominator
+
+        if denominator == 1:
+            result = hash(numerator)
+        elif denominator % _HASH_MODULUS == 0:
+            reduced = self.reduced
+
+            if reduced is not self:
+                # The reduced denominator might not be a multiple of the
+                # modulus.
+                result = hash(reduced)
+            else:
+                result = -hash_info.inf if numerator < 0 else hash_info.inf
+        else:
+            inverse = pow(denominator, -1, _HASH_MODULUS)
+            result = hash(hash(abs(numerator)) * inverse)
+
+            if numerator < 0:
+                result = -result
+
+            if result == -1:
+                result = -2
+
+        _set(self, "_hash", result)
+        return result
 
     def __int__(self) -> int:
         return self.integral
 
     def __le__(self, other: Any) -> bool:
-        if isinstance(other, float):
-            return float(self) <= other
+        if instrumentation.enabled:
+            count_call("__le__")
 
-        a, b = self.comparable_with_self(other)
-        return a.numerator <= b.numerator
+        return self._compare(other) <= 0
 
     def __lt__(self, other: Any) -> bool:
-        if isinstance(other, float):
-            return float(self) < other
+        if instrumentation.enabled:
+            count_call("__lt__")
 
-        a, b = self.comparable_with_self(other)
-        return a.numerator < b.numerator
+        return self._compare(other) < 0
 
     def __mul__(self, other: Any) -> Rational:
-        if other == 0:
-            log.debug("__mul__ taking a shortcut to 0")
+        if instrumentation.enabled:
+            count_call("__mul__")
+
+        if isinstance(other, int) and other == 0:
+            if tracing.enabled:
+                log.debug("__mul__ taking a shortcut to 0")
+
+            if instrumentation.enabled:
+                count_shortcut("__mul__ 0")
+
             return ZERO
 
-        if other == 1:
-            log.debug("__mul__ taking a shortcut to self")
+        if isinstance(other, int) and other == 1:
+            if tracing.enabled:
+                log.debug("__mul__ taking a shortcut to self")
+
+            if instrumentation.enabled:
+                count_shortcut("__mul__ 1")
+
             return self
 
         if isinstance(other, int):
-            log.debug("__mul__ multiplying by integer %i", other)
-            return Rational(
-                self._numerator * other,
-                self._denominator,
-            )
+            if tracing.enabled:
+                log.debug("__mul__ multiplying by integer %i", other)
+
+            result = self._multiply(other, 1)
+
+            if instrumentation.enabled:
+                measure_sizes("__mul__", self, other, result)
+
+            return result
 
         if isinstance(other, Rational):
-            log.debug("__mul__ multiplying by Rational %s", other)
-            return Rational(
-                self._numerator * other._numerator,
-                self._denominator * other._denominator,
+            if tracing.enabled:
+                log.debug("__mul__ multiplying by Rational %s", other)
+
+            result = self._multiply(
+                other._numerator,
+                other._denominator,
+                other.known_reduced,
             )
 
+            if instrumentation.enabled:
+                measure_sizes("__mul__", self, other, result)
+
+            return result
+
+        if instrumentation.enabled:
+            count_fallback("__mul__")
+
         other = Rational.from_any(other)
         result = Rational(
             self.numerator * other.numerator,
             self.denominator * other.denominator,
         )
-        return result.reduced
+        result = result.reduced
+
+        if instrumentation.enabled:
+            measure_sizes("__mul__", self, other, result)
+
+        return result
+
+    def __neg__(self) -> Rational:
+        if instrumentation.enabled:
+            count_call("__neg__")
+
+        result = Rational(-self._numerator, self._denominator)
+
+        if self.known_reduced:
+            _set(result, "_reduced", None)
+
+        return result
 
     def __radd__(self, other: Any) -> Rational:
-        if other == 0:
-            log.debug("__radd__ taking a shortcut to self")
+        if instrumentation.enabled:
+            count_call("__radd__")
+
+        if isinstance(other, int) and other == 0:
+            if tracing.enabled:
+                log.debug("__radd__ taking a shortcut to self")
+
+            if instrumentation.enabled:
+                count_shortcut("__radd__ 0")
+
             return self
 
         if isinstance(other, int):
-            log.debug("__radd__ adding integer %i", other)
-            return Rational(
+            if tracing.enabled:
+                log.debug("__radd__ adding integer %i", other)
+
+            result = Rational(
                 self._numerator + (other * self._denominator),
                 self._denominator,
             )
 
+            if self.known_reduced:
+                _set(result, "_reduced", None)
+
+            if instrumentation.enabled:
+                measure_sizes("__radd__", self, other, result)
+
+            return result
+
+        if instrumentation.enabled:
+            count_fallback("__radd__")
+
         a, b = self.comparable_with_self(other)
         f = Rational(b.numerator + a.numerator, a.denominator)
-        return f.reduced
+        result = f.reduced
+
+        if instrumentation.enabled:
+            measure_sizes("__radd__", self, other, result)
+
+        return result
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__.from_bytes, (self.to_bytes(),)
 
     def __repr__(self) -> str:
         try:
@@ -180,71 +455,398 @@ class Rational:
             return result.getvalue()
 
     def __rfloordiv__(self, other: Any) -> Rational:
-        a, b = self.comparable_with_self(other)
-        true_result = b * a.reciprocal
-        return Rational(true_result.integral)
+        if instrumentation.enabled:
+            count_call("__rfloordiv__")
+
+            if not isinstance(other, Rational):
+                count_fallback("__rfloordiv__")
+
+        other = Rational.from_any(other)
+
+        return Rational(
+            (other._numerator * self._denominator)
+            // (other._denominator * self._numerator)
+        )
 
     def __rmul__(self, other: Any) -> Rational:
-        if other == 0:
-            log.debug("__rmul__ taking a shortcut to 0")
+        if instrumentation.enabled:
+            count_call("__rmul__")
+
+        if isinstance(other, int) and other == 0:
+            if tracing.enabled:
+                log.debug("__rmul__ taking a shortcut to 0")
+
+            if instrumentation.enabled:
+                count_shortcut("__rmul__ 0")
+
             return ZERO
 
-        if other == 1:
-            log.debug("__rmul__ taking a shortcut to self")
+        if isinstance(other, int) and other == 1:
+            if tracing.enabled:
+                log.debug("__rmul__ taking a shortcut to self")
+
+            if instrumentation.enabled:
+                count_shortcut("__rmul__ 1")
+
             return self
 
         if isinstance(other, int):
-            log.debug("__rmul__ multiplying by integer %i", other)
-            return Rational(
-                self._numerator * other,
-                self._denominator,
-            )
+            if tracing.enabled:
+                log.debug("__rmul__ multiplying by integer %i", other)
+
+            result = self._multiply(other, 1)
+
+            if instrumentation.enabled:
+                measure_sizes("__rmul__", self, other, result)
+
+            return result
+
+        if instrumentation.enabled:
+            count_fallback("__rmul__")
 
         other = Rational.from_any(other)
         result = Rational(
             other.numerator * self.numerator,
             other.denominator * self.denominator,
         )
-        return result.reduced
+        result = result.reduced
+
+        if instrumentation.enabled:
+            measure_sizes("__rmul__", self, other, result)
+
+        return result
 
     def __rsub__(self, left: Any) -> Rational:
+        if instrumentation.enabled:
+            count_call("__rsub__")
+
+            if not isinstance(left, Rational):
+                count_fallback("__rsub__")
+
         a, b = self.comparable_with_self(left)
         f = Rational(b.numerator - a.numerator, a.denominator)
-        return f.reduced
+        result = f.reduced
+
+        if instrumentation.enabled:
+            measure_sizes("__rsub__", self, left, result)
+
+        return result
 
     def __rtruediv__(self, other: Any) -> Rational:
-        a, b = self.comparable_with_self(other)
-        return b * a.reciprocal
+        if instrumentation.enabled:
+            count_call("__rtruediv__")
+
+        if isinstance(other, int):
+            if tracing.enabled:
+                log.debug("__rtruediv__ dividing integer %i", other)
+
+            numerator = self._numerator
+
+            if self._reduced is not None:
+                result = Rational(other * self._denominator, numerator)
+            else:
+                divisor = gcd(other, numerator)
+
+                if divisor > 1:
+                    other //= divisor
+                    numerator //= divisor
+
+                result = Rational(other * self._denominator, numerator)
+                _set(result, "_reduced", None)
+
+            if instrumentation.enabled:
+                measure_sizes("__rtruediv__", self, other, result)
+
+            return result
+
+        if instrumentation.enabled:
+            count_fallback("__rtruediv__")
+
+        other = Rational.from_any(other)
+        result = Rational(
+            other.numerator * self.denominator,
+            other.denominator * self.numerator,
+        )
+        result = result.reduced
+
+        if instrumentation.enabled:
+            measure_sizes("__rtruediv__", self, other, result)
+
+        return result
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
 
     def __sub__(self, right: Any) -> Rational:
-        if right == 0:
-            log.debug("__sub__ taking a shortcut to 0")
+        if instrumentation.enabled:
+            count_call("__sub__")
+
+        if isinstance(right, int) and right == 0:
+            if tracing.enabled:
+                log.debug("__sub__ taking a shortcut to 0")
+
+            if instrumentation.enabled:
+                count_shortcut("__sub__ 0")
+
             return self
 
         if isinstance(right, Rational):
-            log.debug("__sub__ subtracting Rational %s", right)
+            if tracing.enabled:
+                log.debug("__sub__ subtracting Rational %s", right)
 
-            if self._denominator == right._denominator:
-                return Rational(
-                    self._numerator - right._numerator,
-                    self._denominator,
-                )
+            result = self._add(
+                -right._numerator,
+                right._denominator,
+                right.known_reduced,
+            )
 
-            new_left_numerator = self._numerator * right._denominator
-            new_right_numerator = right._numerator * self._denominator
+            if instrumentation.enabled:
+                measure_sizes("__sub__", self, right, result)
 
-            return Rational(
-                new_left_numerator - new_right_numerator,
-                self._denominator * right._denominator,
-            )
+            return result
+
+        if instrumentation.enabled:
+            count_fallback("__sub__")
 
         a, b = self.comparable_with_self(right)
         f = Rational(a.numerator - b.numerator, a.denominator)
-        return f.reduced
+        result = f.reduced
+
+        if instrumentation.enabled:
+            measure_sizes("__sub__", self, right, result)
+
+        return result
 
     def __truediv__(self, other: Any) -> Rational:
-        a, b = self.comparable_with_self(other)
-        return a * b.reciprocal
+        if instrumentation.enabled:
+            count_call("__truediv__")
+
+        if isinstance(other, int):
+            if tracing.enabled:
+                log.debug("__truediv__ dividing by integer %i", other)
+
+            result = self._multiply(1, other)
+
+            if instrumentation.enabled:
+                measure_sizes("__truediv__", self, other, result)
+
+            return result
+
+        if isinstance(other, Rational):
+            if tracing.enabled:
+                log.debug("__truediv__ dividing by Rational %s", other)
+
+            result = self._multiply(
+                other._denominator,
+                other._numerator,
+                other.known_reduced,
+            )
+
+            if instrumentation.enabled:
+                measure_sizes("__truediv__", self, other, result)
+
+            return result
+
+        if instrumentation.enabled:
+            count_fallback("__truediv__")
+
+        other = Rational.from_any(other)
+        result = Rational(
+            self.numerator * other.denominator,
+            self.denominator * other.numerator,
+        )
+        result = result.reduced
+
+        if instrumentation.enabled:
+            measure_sizes("__truediv__", self, other, result)
+
+        return result
+
+    def _add(
+        self,
+        numerator: int,
+        denominator: int,
+        known_reduced: bool,
+    ) -> Rational:
+        """
+        Adds `numerator` / `denominator` to this rational number over the
+        least common multiple of the denominators, then normalises the result.
+
+        If both terms are known to be reduced then so is the result.
+        """
+
+        divisor = gcd(self._denominator, denominator)
+        reduced = known_reduced and self.known_reduced
+
+        if divisor == 1:
+            result = Rational(
+                self._numerator * denominator + numerator * self._denominator,
+                self._denominator * denominator,
+            )
+        else:
+            # Knuth, The Art of Computer Programming, volume 2, 4.5.1.
+            self_scale = self._denominator // divisor
+            numerator = (
+                self._numerator * (denominator // divisor)
+                + numerator * self_scale
+            )
+
+            if reduced:
+                divisor = gcd(numerator, divisor)
+                numerator //= divisor
+                denominator //= divisor
+
+            result = Rational(numerator, self_scale * denominator)
+
+        if reduced:
+            _set(result, "_reduced", None)
+            return result
+
+        max_bits = get_normalisation().max_bits
+
+        if (
+            max_bits is not None
+            and result._denominator.bit_length() > max_bits
+        ):
+            return result.reduced
+
+        return result
+
+    def _compare(self, other: Any) -> float:
+        """
+        Compares this rational number exactly with `other`.
+
+        Returns -1 if this is the lesser, 0 if they are equal or 1 if this is
+        the greater. Returns NaN if `other` is NaN, so that every comparison
+        of the result with 0 is false, as it is for floats.
+
+        Values whose floating-point approximations differ are ordered by their
+        approximations alone, since rounding never reverses an order. Only
+        values with equal approximations are compared exactly.
+        """
+
+        if isinstance(other, Rational):
+            a = _approximate(self)
+            b = _approximate(other)
+
+            if a != b:
+                return -1 if a < b else 1
+
+            return _compare(
+                self._numerator,
+                self._denominator,
+                other._numerator,
+                other._denominator,
+            )
+
+        if isinstance(other, int):
+            return _compare(self._numerator, self._denominator, other, 1)
+
+        if isinstance(other, float):
+            if isnan(other):
+                return nan
+
+            a = _approximate(self)
+
+            if a != other:
+                return -1 if a < other else 1
+
+            if isinf(other):
+                # This is finite but too large for a float.
+                return -1 if other > 0 else 1
+
+            n, d = other.as_integer_ratio()
+            return _compare(self._numerator, self._denominator, n, d)
+
+        if instrumentation.enabled:
+            count_fallback("compare")
+
+        other = Rational.from_any(other)
+
+        return _compare(
+            self._numerator,
+            self._denominator,
+            other._numerator,
+            other._denominator,
+        )
+
+    @staticmethod
+    def _from_scientific(numerator: int, exponent: int) -> Rational:
+        """
+        Creates the reduced rational number `numerator` * 10 ** `exponent`.
+
+        The only prime factors of a power of ten are 2 and 5, so a single
+        greatest common divisor with the power reduces the fraction.
+
+        Exponents come from parsed input, so their powers are calculated
+        rather than cached by `power_of_ten`.
+        """
+
+        if exponent >= 0:
+            return Rational(numerator * 10**exponent)
+
+        denominator = 10**-exponent
+        divisor = gcd(numerator, denominator)
+
+        result = Rational(numerator // divisor, denominator // divisor)
+        _set(result, "_reduced", None)
+        return result
+
+    def _multiply(
+        self,
+        numerator: int,
+        denominator: int,
+        known_reduced: bool = True,
+    ) -> Rational:
+        """
+        Multiplies this rational number by `numerator` / `denominator`.
+
+        If both factors are known to be reduced then each numerator's common
+        factors with the other denominator are divided out first, as
+        `fractions.Fraction` does, so the product is reduced too.
+        """
+
+        self_numerator = self._numerator
+        self_denominator = self._denominator
+
+        if not known_reduced or self._reduced is not None:
+            return Rational(
+                self_numerator * numerator,
+                self_denominator * denominator,
+            )
+
+        divisor = gcd(self_numerator, denominator)
+
+        if divisor > 1:
+            self_numerator //= divisor
+            denominator //= divisor
+
+        divisor = gcd(numerator, self_denominator)
+
+        if divisor > 1:
+            numerator //= divisor
+            self_denominator //= divisor
+
+        result = Rational(
+            self_numerator * numerator,
+            self_denominator * denominator,
+        )
+
+        _set(result, "_reduced", None)
+        return result
+
+    def _record_reduced(self, reduced: Rational) -> None:
+        """
+        Records that `reduced` is the reduced form of this rational number,
+        which may be this rational number itself.
+        """
+
+        if reduced is self:
+            _set(self, "_reduced", None)
+            return
+
+        _set(reduced, "_reduced", None)
+        _set(self, "_reduced", reduced)
 
     @staticmethod
     def comparable(a: Rational, b: Rational) -> tuple[Rational, Rational]:
@@ -303,65 +905,123 @@ class Rational:
         default, but you might prefer \u0305 ("Combining Overline").
         """
 
-        log.debug("Rendering %s to a decimal string", self)
+        max_dp = max(max_dp, 1)
 
-        result = StringIO()
+        if instrumentation.enabled:
+            count_call("decimal")
 
-        positive = self._numerator >= 0
+            with timing("decimal"):
+                return self._cached_decimal(
+                    max_dp,
+                    recursion,
+                    recurring_prefix,
+                )
 
-        integral = abs(self._numerator) // self._denominator
-        if not positive:
-            integral *= -1
+        return self._cached_decimal(max_dp, recursion, recurring_prefix)
 
-        result = StringIO()
+    def _cached_decimal(
+        self,
+        max_dp: int,
+        recursion: bool,
+        recurring_prefix: Optional[str],
+    ) -> str:
+        """
+        Gets a decimal string that describes this rational number from the
+        decimal cache, or renders it if it is not cached.
 
-        int_to_buffer(integral, result)
+        The arguments are described in `decimal`, except that `max_dp` must be
+        positive.
+        """
 
-        result.write(DECIMAL_POINT)
+        cache = rendering._cache  # pylint: disable=protected-access
 
-        recursion_track: Optional[List[int]] = [] if recursion else None
-        remainder = (abs(self._numerator) % self._denominator) * 10
+        if cache is None:
+            return self._decimal(max_dp, recursion, recurring_prefix).decimal
 
-        added_non_zero = False
-        decimal_places = 0
-        fractional = 0
-        leading_zeros = 0
-        recurring_count = 0
+        reduced = self.reduce()
 
-        while True:
-            i = remainder // self._denominator
-            remainder = (remainder % self._denominator) * 10
+        key = (
+            reduced._numerator,
+            reduced._denominator,
+            recursion,
+            recurring_prefix,
+        )
 
-            if recursion_track is not None and (remainder in recursion_track):
-                index_of = recursion_track.index(remainder)
-                recurring_count = len(recursion_track) - index_of
-                break
+        decimal = cache.get(key, max_dp)
 
-            fractional *= 10
-            fractional += i
+        if decimal is not None:
+            if tracing.enabled:
+                log.debug("Rendered %s from the decimal cache", self)
 
-            if i > 0:
-                added_non_zero = True
-            elif not added_non_zero:
-                leading_zeros += 1
+            return decimal
 
-            decimal_places += 1
+        entry = self._decimal(max_dp, recursion, recurring_prefix)
+        cache.put(key, entry)
+        return entry.decimal
 
-            if remainder == 0 or decimal_places >= max_dp:
-                break
+    def _decimal(
+        self,
+        max_dp: int,
+        recursion: bool,
+        recurring_prefix: Optional[str],
+    ) -> DecimalEntry:
+        """
+        Renders this rational number to a decimal string.
 
-            if recursion_track is not None:
-                recursion_track.append(remainder)
+        The arguments are described in `decimal`, except that `max_dp` must be
+        positive.
+        """
 
-        int_to_buffer(
-            fractional,
-            result,
-            leading_zeros=leading_zeros,
-            recurring_count=recurring_count,
-            recurring_prefix=recurring_prefix,
-        )
+        if tracing.enabled:
+            log.debug("Rendering %s to a decimal string", self)
 
-        return result.getvalue()
+        result = StringIO()
+
+        numerator = abs(self._numerator)
+        terminating = terminating_digits(numerator, self._denominator)
+
+        if terminating is not None:
+            if self._numerator < 0:
+                result.write("-")
+
+            int_to_buffer(numerator // self._denominator, result)
+            point = len(result.getvalue())
+            result.write(f"{DECIMAL_POINT}{terminating[:max_dp] or 0}")
+            return DecimalEntry(result.getvalue(), max_dp, point, None)
+
+        point = 0
+        fractional = 0
+        recurring = 0
+
+        for part, digits in self.iter_digits(max_dp, recursion):
+            if part is DecimalPart.SIGN:
+                result.write(digits)
+                point += len(digits)
+            elif part is DecimalPart.INTEGRAL:
+                result.write(digits)
+                result.write(DECIMAL_POINT)
+                point += len(digits)
+            elif part is DecimalPart.RECURRING:
+                if recurring_prefix is None:
+                    result.write(digits)
+                else:
+                    result.write(recurring_prefix)
+                    result.write(recurring_prefix.join(digits))
+
+                recurring += len(digits)
+            else:
+                result.write(digits)
+                fractional += len(digits)
+
+        if not fractional and not recurring:
+            result.write("0")
+
+        return DecimalEntry(
+            result.getvalue(),
+            max_dp,
+            point,
+            fractional + recurring if recurring else None,
+        )
 
     @property
     def denominator(self) -> int:
@@ -404,104 +1064,253 @@ class Rational:
         if isinstance(value, Rational):
             return value
 
+        if isinstance(value, numbers.Rational):
+            return Rational(int(value.numerator), int(value.denominator))
+
         raise TypeError(
             f"Cannot create a {cls.__name__} from {repr(value)} "
             f"({value.__class__.__name__})"
         )
 
     @classmethod
-    def from_float(cls, f: float) -> Rational:
-        log.debug("Parsing float %s", f)
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> Rational:
+        """
+        Decodes a rational number that was encoded by `to_bytes`.
 
-        positive = f >= 0
-        f = abs(f)
+        A `memoryview` is decoded without being copied.
 
-        fractional, i = modf(f)
+        Raises `ValueError` if `data` is truncated or has trailing bytes.
+        """
+
+        view = memoryview(data).cast("B")
+        numerator, denominator, end = read_pair(view)
 
-        result = Rational(int(i))
-        over = 10
+        if end != len(view):
+            raise ValueError(f"Expected {end} bytes but found {len(view)}")
 
-        while fractional != 0:
-            f *= 10
-            fractional, i = modf(f)
-            digit = int(i) % 10
-            result += Rational(digit, over)
-            over *= 10
+        return cls(numerator, denominator)
 
-        if not positive:
-            result *= -1
+    @classmethod
+    def from_float(cls, f: float, exact: bool = False) -> Rational:
+        """
+        Converts `f` to a reduced rational number.
 
+        By default, the number is the decimal that Python's shortest round-trip
+        `repr` describes: what the user most likely typed. For example, 0.1 is
+        converted to 1/10.
+
+        If `exact` is `True` then the number is the exact binary value of the
+        float. For example, 0.1 is converted to
+        3602879701896397/36028797018963968.
+
+        Raises `ValueError` if `f` is infinite or not a number.
+        """
+
+        if instrumentation.enabled:
+            count_call("from_float")
+
+        if tracing.enabled:
+            log.debug("Parsing float %s", f)
+
+        if not isfinite(f):
+            raise ValueError(f"Cannot create a {cls.__name__} from {f}")
+
+        if exact:
+            numerator, denominator = f.as_integer_ratio()
+        else:
+            mantissa, _, exponent = repr(f).partition("e")
+            integral, _, fractional = mantissa.partition(".")
+
+            return Rational._from_scientific(
+                int(integral + fractional),
+                int(exponent or 0) - len(fractional),
+            )
+
+        result = Rational(numerator, denominator)
+        _set(result, "_reduced", None)
         return result
 
     @classmethod
     def from_string(cls, string: str) -> Rational:
         """
         Parses `string` as either a decimal or fraction.
+
+        Decimals can have a sign, an exponent (for example, "1.5e-7") and
+        underscores between digits. Decimals are reduced; fractions are not.
         """
 
+        if instrumentation.enabled:
+            count_call("from_string")
+
         match = DECIMAL_PATTERN.match(string)
         if match is not None:
-            log.debug('Parsing "%s" as a decimal', string)
+            if tracing.enabled:
+                log.debug('Parsing "%s" as a decimal', string)
 
-            groups = match.groups(0)
+            sign, integral, fractional, exponent = match.groups("")
 
-            integral_str = cast(str, groups[0])
+            numerator = _digits_to_int(integral + fractional)
+            scale = fractional.count("_") - len(fractional)
 
-            if negative := string.startswith("-"):
-                integral_str = integral_str[1:]
+            if exponent:
+                scale += _exponent(exponent)
 
-            integral_int = string_to_int(integral_str)
-            integral = Rational(integral_int)
+            if sign == "-":
+                numerator = -numerator
 
-            decimal_group = groups[1]
+            return Rational._from_scientific(numerator, scale)
 
-            log.debug(
-                'The decimal group of "%s" is %s (%s)',
-                string,
-                decimal_group,
-                decimal_group.__class__.__name__,
-            )
+        match = FRACTION_PATTERN.match(string)
+        if match is not None:
+            if tracing.enabled:
+                log.debug('Parsing "%s" as a fraction', string)
 
-            if decimal_group == 0:
-                decimal = Rational.zero()
-            else:
-                d = cast(str, decimal_group)
-                decimal = Rational(string_to_int(d), 10 ** len(d))
+            sign, numerator_group, denominator_group = match.groups()
+            numerator = _digits_to_int(numerator_group)
 
-            absolute = integral + decimal
-            multiplier = -1 if negative else 1
+            if sign == "-":
+                numerator = -numerator
 
-            return (absolute * multiplier).reduced
+            return Rational(numerator, _digits_to_int(denominator_group))
 
-        match = FRACTION_PATTERN.match(string)
-        if match is not None:
-            log.debug('Parsing "%s" as a fraction', string)
+        raise ValueError(f'Cannot parse "{string}" as decimal or fraction')
+
+    def iter_digits(
+        self,
+        max_dp: int = 100,
+        recursion: bool = True,
+        chunk_digits: int | None = None,
+    ) -> Iterator[tuple[DecimalPart, str]]:
+        """
+        Yields the parts of a decimal string that describes this rational
+        number, without holding the whole string in memory.
 
-            groups = match.groups(0)
-            numerator_group = groups[0]
+        Each part is yielded as a `DecimalPart` and its string:
 
-            log.debug(
-                'The numerator group of "%s" is %s (%s)',
-                string,
-                numerator_group,
-                numerator_group.__class__.__name__,
-            )
+        - `SIGN` ("-") is yielded first if the number is negative.
+        - `INTEGRAL` digits are yielded next, even if only "0".
+        - `FRACTIONAL` digits are the non-recurring digits after the decimal
+          point.
+        - `RECURRING` digits are the recurring digits after the decimal point.
+          The first `RECURRING` part marks where recurrence starts.
 
-            denominator_group = groups[1]
+        Fractional and recurring digits are yielded in strings of up to
+        `chunk_digits` digits (capped at and defaulting to 1,024). A recurring
+        cycle is only described as `RECURRING` if it completes within `max_dp`
+        decimal places; otherwise `max_dp` `FRACTIONAL` digits are yielded.
+        Integers yield no fractional digits.
 
-            log.debug(
-                'The denominator group of "%s" is %s (%s)',
-                string,
-                denominator_group,
-                denominator_group.__class__.__name__,
-            )
+        `max_dp` and `recursion` are described in `decimal`.
+        """
 
-            return Rational(
-                string_to_int(cast(str, numerator_group)),
-                string_to_int(cast(str, denominator_group)),
-            )
+        if self._numerator < 0:
+            yield DecimalPart.SIGN, "-"
 
-        raise ValueError(f'Cannot parse "{string}" as decimal or fraction')
+        numerator = abs(self._numerator)
+
+        integral = StringIO()
+        int_to_buffer(numerator // self._denominator, integral)
+        yield DecimalPart.INTEGRAL, integral.getvalue()
+
+        remainder = numerator % self._denominator
+
+        if remainder == 0:
+            return
+
+        # At least one decimal place is always rendered.
+        max_dp = max(max_dp, 1)
+
+        # Recurring digits are only marked if a complete cycle fits before the
+        # final decimal place.
+        max_period = max_dp - 1 if recursion else 0
+
+        pre_period, period = _decimal_period(
+            remainder,
+            self._denominator,
+            max_period=max_period,
+        )
+
+        if period == 0:
+            digits = min(pre_period, max_dp)
+        elif period is not None and pre_period + period < max_dp:
+            digits = pre_period
+        else:
+            digits = max_dp
+            period = None
+
+        for chunk in fractional_digits(
+            remainder,
+            self._denominator,
+            digits,
+            chunk_digits,
+        ):
+            yield DecimalPart.FRACTIONAL, chunk
+
+        if not period:
+            return
+
+        remainder *= pow(10, pre_period, self._denominator)
+
+        for chunk in fractional_digits(
+            remainder,
+            self._denominator,
+            period,
+            chunk_digits,
+        ):
+            yield DecimalPart.RECURRING, chunk
+
+    @classmethod
+    def iter_parse(
+        cls,
+        source: (
+            str
+            | PathLike[str]
+            | IO[bytes]
+            | bytes
+            | bytearray
+            | memoryview
+            | mmap
+        ),
+        delimiter: bytes = b"\n",
+    ) -> Iterator[Rational]:
+        """
+        Yields the rational number described by each record in `source`.
+
+        `source` can be a file path, a binary file, an `mmap` or a bytes-like
+        buffer. Files are memory-mapped where possible, and records are matched
+        straight over the bytes without being decoded.
+
+        Records are separated by `delimiter` and can be decimals or fractions
+        as described in `from_string`. Empty records are skipped.
+
+        Raises `ValueError` if a record cannot be parsed.
+        """
+
+        if not delimiter:
+            raise ValueError("Delimiter is empty")
+
+        if isinstance(source, (str, PathLike)):
+            with open(source, "rb") as file:
+                yield from cls.iter_parse(file, delimiter)
+            return
+
+        if isinstance(source, (bytes, bytearray, memoryview, mmap)):
+            yield from _parse_records(source, delimiter)
+            return
+
+        mapped = _map(source)
+
+        if mapped is None:
+            if tracing.enabled:
+                log.debug(
+                    "Reading %s because it cannot be memory-mapped", source
+                )
+
+            yield from _parse_records(source.read(), delimiter)
+            return
+
+        with mapped:
+            yield from _parse_records(mapped, delimiter)
 
     @property
     def integral(self) -> int:
@@ -512,7 +1321,25 @@ class Rational:
         part is 1/2.
         """
 
-        return self._numerator // self._denominator
+        try:
+            return self._integral
+        except AttributeError:
+            integral = self._numerator // self._denominator
+            _set(self, "_integral", integral)
+            return integral
+
+    @property
+    def known_reduced(self) -> bool:
+        """
+        Whether or not this rational number is known to be in its reduced
+        form, so getting `reduced` will cost nothing.
+
+        Integers, and values derived from known reduced values by negation,
+        reciprocation, adding integers and multiplying by coprime factors, are
+        known to be reduced without calculating a greatest common divisor.
+        """
+
+        return self._reduced is None
 
     @property
     def numerator(self) -> int:
@@ -524,6 +1351,22 @@ class Rational:
 
         return self._numerator
 
+    @staticmethod
+    def pack(rationals: Iterable[Rational]) -> bytes:
+        """
+        Encodes a sequence of rational numbers to bytes.
+
+        The bytes are the concatenation of each number's `to_bytes`, and can be
+        decoded by `unpack`.
+        """
+
+        buffer = bytearray()
+
+        for rational in rationals:
+            write_pair(buffer, rational._numerator, rational._denominator)
+
+        return bytes(buffer)
+
     @property
     def reciprocal(self) -> Rational:
         """
@@ -532,7 +1375,16 @@ class Rational:
         For example, the reciprocal of 2/3 is 3/2.
         """
 
-        return Rational(self.denominator, self.numerator)
+        try:
+            return self._reciprocal
+        except AttributeError:
+            reciprocal = Rational(self._denominator, self._numerator)
+
+            if self.known_reduced:
+                _set(reciprocal, "_reduced", None)
+
+            _set(self, "_reciprocal", reciprocal)
+            return reciprocal
 
     def reduce(
         self,
@@ -543,22 +1395,51 @@ class Rational:
         returns itself.
 
         For example, 15/30 reduces to 1/2.
+
+        To spread the work of a large reduction over several calls instead,
+        see `Reduction`.
+
+        Returns immediately if the reduced form is already known.
         """
 
+        if instrumentation.enabled:
+            count_call("reduce")
+
+        reduced = self._reduced
+
+        if reduced is not _UNKNOWN:
+            if tracing.enabled:
+                log.debug("reduce taking a shortcut to the known reduced form")
+
+            if instrumentation.enabled:
+                count_shortcut("reduce known")
+
+            return self if reduced is None else reduced
+
+        if self._numerator == 0 and self._denominator > 1:
+            _set(self, "_reduced", ZERO)
+            return ZERO
+
         gcf = greatest_common_divisor(
             self._numerator,
             self._denominator,
             max_iterations=max_iterations,
         )
 
+        if gcf == 1 and max_iterations is None:
+            _set(self, "_reduced", None)
+
         if gcf in (0, 1):
             return self
 
-        return Rational(
+        reduced = Rational(
             self._numerator // gcf,
             self._denominator // gcf,
         )
 
+        self._record_reduced(reduced)
+        return reduced
+
     @property
     def reduced(self) -> Rational:
         """
@@ -569,6 +1450,48 @@ class Rational:
 
         return self.reduce()
 
+    @property
+    def sign(self) -> int:
+        """
+        -1 if this rational number is negative, 0 if it is zero or 1 if it is
+        positive.
+        """
+
+        return (self._numerator > 0) - (self._numerator < 0)
+
+    def to_bytes(self) -> bytes:
+        """
+        Encodes this rational number to bytes.
+
+        The numerator and denominator are each written as a varint byte length
+        then their little-endian bytes, so big values are encoded without
+        being converted to decimal strings.
+        """
+
+        buffer = bytearray()
+        write_pair(buffer, self._numerator, self._denominator)
+        return bytes(buffer)
+
+    @classmethod
+    def unpack(
+        cls,
+        data: bytes | bytearray | memoryview,
+    ) -> Iterator[Rational]:
+        """
+        Yields each rational number that was encoded by `pack`.
+
+        A `memoryview` is decoded without being copied.
+
+        Raises `ValueError` if `data` is truncated.
+        """
+
+        view = memoryview(data).cast("B")
+        offset = 0
+
+        while offset < len(view):
+            numerator, denominator, offset = read_pair(view, offset)
+            yield cls(numerator, denominator)
+
     @staticmethod
     def zero() -> Rational:
         """
@@ -578,6 +1501,275 @@ class Rational:
         return ZERO
 
 
+_set_denominator = Rational.__dict__["_denominator"].__set__
+"""
+Sets the denominator of an uninitialised `Rational`.
+"""
+
+_set_numerator = Rational.__dict__["_numerator"].__set__
+"""
+Sets the numerator of an uninitialised `Rational`.
+"""
+
+_set_reduced = Rational.__dict__["_reduced"].__set__
+"""
+Sets the reduced form of an uninitialised `Rational`.
+"""
+
+
+def _exponent(digits: str | bytes) -> int:
+    """
+    Parses the exponent of a decimal in scientific notation.
+
+    Raises `ValueError` if the magnitude of the exponent is greater than the
+    interpreter's limit on the number of digits in an integer string (see
+    `sys.set_int_max_str_digits`), since its power of ten would have more
+    digits than that.
+    """
+
+    exponent = int(digits)
+    limit = get_int_max_str_digits()
+
+    if limit and abs(exponent) > limit:
+        raise ValueError(
+            f"Exponent {exponent} exceeds the limit ({limit}) for integer "
+            "string conversion; use sys.set_int_max_str_digits() to increase "
+            "the limit"
+        )
+
+    return exponent
+
+
+def _intern_cached(
+    cache: InternCache,
+    numerator: int,
+    denominator: int,
+) -> Rational:
+    """
+    Gets the rational number interned in `cache` for a numerator and positive
+    denominator, creating and interning it if necessary.
+    """
+
+    key = (numerator, denominator)
+
+    rational: Rational | None = cache.get(key)
+
+    if rational is None:
+        rational = _new(Rational)
+
+        _set_numerator(rational, numerator)
+        _set_denominator(rational, denominator)
+        _set_reduced(rational, None if denominator == 1 else _UNKNOWN)
+
+        cache.put(key, rational)
+
+    return rational
+
+
+def _intern_small(numerator: int, denominator: int) -> Rational:
+    """
+    Gets the interned small rational number for a numerator and positive
+    denominator, creating and interning it if necessary.
+    """
+
+    key = (numerator, denominator)
+
+    try:
+        return _interned[key]
+    except KeyError:
+        pass
+
+    rational = _new(Rational)
+
+    _set_numerator(rational, numerator)
+    _set_denominator(rational, denominator)
+
+    # Small rational numbers are reduced as they are interned, so they are
+    # always known to be reduced or not.
+    divisor = gcd(numerator, denominator)
+
+    _set(
+        rational,
+        "_reduced",
+        (
+            None
+            if divisor == 1
+            else Rational(numerator // divisor, denominator // divisor)
+        ),
+    )
+
+    _interned[key] = rational
+    return rational
+
+
+def _approximate(rational: Rational) -> float:
+    """
+    Gets the floating-point approximation of `rational`.
+
+    The approximation is correctly rounded, and rounding never reverses an
+    order, so the approximations of two values (or the approximation of a
+    value and a float) that differ are ordered the same way as the values.
+    Values too large for a float are approximated to infinity.
+    """
+
+    numerator = rational._numerator  # pylint: disable=protected-access
+    denominator = rational._denominator  # pylint: disable=protected-access
+
+    try:
+        return numerator / denominator
+    except OverflowError:
+        return inf if numerator > 0 else -inf
+
+
+def _compare(n1: int, d1: int, n2: int, d2: int) -> int:
+    """
+    Compares n1/d1 with n2/d2, where both denominators are positive, without
+    creating any rational numbers.
+
+    Returns -1 if n1/d1 is the lesser, 0 if they are equal or 1 if n1/d1 is
+    the greater.
+    """
+
+    if d1 == d2:
+        return (n1 > n2) - (n1 < n2)
+
+    if n1 > 0:
+        if n2 <= 0:
+            return 1
+        sign = 1
+    elif n1 < 0:
+        if n2 >= 0:
+            return -1
+        sign = -1
+    else:
+        return (n2 < 0) - (n2 > 0)
+
+    # The values have the same sign. The product of an a-bit and a b-bit
+    # integer has a+b-1 or a+b bits, so cross products whose bit length bounds
+    # don't overlap can be compared without being calculated.
+    left = n1.bit_length() + d2.bit_length()
+    right = n2.bit_length() + d1.bit_length()
+
+    if left > right + 1:
+        return sign
+
+    if right > left + 1:
+        return -sign
+
+    left = n1 * d2
+    right = n2 * d1
+
+    return (left > right) - (left < right)
+
+
+def _digits_to_int(digits: str | bytes) -> int:
+    """
+    Converts digits that are optionally separated by underscores, and have
+    already been validated by a pattern, to an integer.
+    """
+
+    try:
+        return int(digits)
+    except ValueError:
+        # Raised if CVE-2020-10735
+        # https://github.com/python/cpython/issues/95778 is violated.
+
+        if isinstance(digits, bytes):
+            return string_to_int(digits.replace(b"_", b""))
+
+        return string_to_int(digits.replace("_", ""))
+
+
+@lru_cache(maxsize=8)
+def _record_pattern(delimiter: bytes) -> Pattern[bytes]:
+    """
+    Compiles a pattern that matches one record and its delimiter (or the end
+    of the buffer). A record is empty, a decimal, a fraction or, if the final
+    group is matched, invalid.
+    """
+
+    point = escape(DECIMAL_POINT.encode())
+    escaped = escape(delimiter)
+
+    return compile(
+        rb"(?:([+-]?)(" + BYTES_DIGITS + rb")"
+        rb"(?:/(" + BYTES_DIGITS + rb")"
+        rb"|(?:" + point + rb"(" + BYTES_DIGITS + rb"))?"
+        rb"(?:[eE]([+-]?" + BYTES_DIGITS + rb"))?)"
+        rb"|((?s:(?:(?!" + escaped + rb").)+))?)"
+        rb"(?:" + escaped + rb"|\Z)"
+    )
+
+
+def _map(file: IO[bytes]) -> mmap | None:
+    """
+    Memory-maps a regular, non-empty file, or returns `None` if the file
+    cannot be mapped. Pipes and sockets report a size of zero however much
+    they will yield, so are never mapped.
+    """
+
+    try:
+        fileno = file.fileno()
+    except (AttributeError, UnsupportedOperation):
+        return None
+
+    status = fstat(fileno)
+
+    if not S_ISREG(status.st_mode) or status.st_size == 0:
+        return None
+
+    try:
+        return mmap(fileno, 0, access=ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
+def _parse_records(
+    buffer: bytes | bytearray | memoryview | mmap,
+    delimiter: bytes,
+) -> Iterator[Rational]:
+    """
+    Yields the rational number described by each record in `buffer`.
+    """
+
+    for match in _record_pattern(delimiter).finditer(buffer):
+        (
+            sign,
+            integral,
+            denominator,
+            fractional,
+            exponent,
+            invalid,
+        ) = match.groups(b"")
+
+        if invalid:
+            raise ValueError(
+                f"Cannot parse the record at byte {match.start()}",
+            )
+
+        if not integral:
+            continue
+
+        numerator = _digits_to_int(integral + fractional)
+
+        if sign == b"-":
+            numerator = -numerator
+
+        if denominator:
+            yield Rational(numerator, _digits_to_int(denominator))
+            continue
+
+        scale = fractional.count(b"_") - len(fractional)
+
+        if exponent:
+            scale += _exponent(exponent)
+
+        yield Rational._from_scientific(  # pylint: disable=protected-access
+            numerator,
+            scale,
+        )
+
+
 ZERO = Rational(0)
 """
 Zero.
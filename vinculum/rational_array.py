@@ -0,0 +1,565 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator, overload
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as ex:  # pragma: no cover
+    raise ImportError(
+        "RationalArray requires NumPy: pip install vinculum[numpy]"
+    ) from ex
+
+from vinculum.rational import Rational
+
+Array = npt.NDArray[Any]
+"""
+A NumPy array of integers: int64, or object if any value is too large.
+"""
+
+_INT64_MAX = int(np.iinfo(np.int64).max)
+"""
+Largest magnitude held in an int64 array. The least int64 value is excluded
+so that every value can be negated without overflowing.
+"""
+
+
+class RationalArray:
+    """
+    A one-dimensional array of rational numbers, stored as parallel NumPy
+    arrays of numerators and denominators.
+
+    Values are normalised like `Rational`: a negative denominator is moved to
+    the numerator. Arithmetic is elementwise and, like `Rational`, does not
+    reduce its results; call `reduce` to do so.
+
+    Numerators and denominators are int64 arrays while every value fits.
+    Before each operation, the largest possible results are calculated from
+    the largest operands; if they could overflow then the arrays are promoted
+    to object arrays of Python integers.
+
+    Operands can be `RationalArray`s of the same length, `Rational`s or
+    integers. A `Rational` operand must be on the right, since `Rational`
+    operators do not defer to arrays.
+    """
+
+    __array_ufunc__ = None
+    """
+    Makes NumPy defer to `RationalArray` operators.
+    """
+
+    __slots__ = ("_denominators", "_numerators")
+
+    def __init__(
+        self,
+        numerators: Iterable[int] | Array,
+        denominators: Iterable[int] | Array | None = None,
+    ) -> None:
+        n = _integers(numerators)
+        d = (
+            np.ones_like(n)
+            if denominators is None
+            else _integers(denominators)
+        )
+
+        if n.ndim != 1 or n.shape != d.shape:
+            raise ValueError(
+                f"Numerators {n.shape} and denominators {d.shape} are not "
+                "one-dimensional arrays of the same length"
+            )
+
+        n, d = _common(n, d)
+        self._numerators, self._denominators = _normalised(n, d)
+
+    def __add__(self, other: Any) -> RationalArray:
+        operand = _operand(other)
+
+        if operand is None:
+            return NotImplemented
+
+        return self._add(operand[0], operand[1])
+
+    def __eq__(self, other: Any) -> Array:  # type: ignore[override]
+        operand = _operand(other)
+
+        if operand is None:
+            return NotImplemented
+
+        return self._compare(operand[0], operand[1], np.equal)
+
+    def __ge__(self, other: Any) -> Array:
+        operand = _operand(other)
+
+        if operand is None:
+            return NotImplemented
+
+        return self._compare(operand[0], operand[1], np.greater_equal)
+
+    @overload
+    def __getitem__(self, index: int) -> Rational:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> RationalArray:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Rational | RationalArray:
+        if isinstance(index, slice):
+            return RationalArray._from_arrays(
+                self._numerators[index],
+                self._denominators[index],
+            )
+
+        return Rational(
+            int(self._numerators[index]),
+            int(self._denominators[index]),
+        )
+
+    def __gt__(self, other: Any) -> Array:
+        operand = _operand(other)
+
+        if operand is None:
+            return NotImplemented
+
+        return self._compare(operand[0], operand[1], np.greater)
+
+    def __iter__(self) -> Iterator[Rational]:
+        for n, d in zip(
+            self._numerators.tolist(),
+            self._denominators.tolist(),
+        ):
+            yield Rational(n, d)
+
+    def __le__(self, other: Any) -> Array:
+        operand = _operand(other)
+
+        if operand is None:
+            return NotImplemented
+
+        return self._compare(operand[0], operand[1], np.less_equal)
+
+    def __len__(self) -> int:
+        return len(self._numerators)
+
+    def __lt__(self, other: Any) -> Array:
+        operand = _operand(other)
+
+        if operand is None:
+            return NotImplemented
+
+        return self._compare(operand[0], operand[1], np.less)
+
+    def __mul__(self, other: Any) -> RationalArray:
+        operand = _operand(other)
+
+        if operand is None:
+            return NotImplemented
+
+        return self._multiply(operand[0], operand[1])
+
+    def __ne__(self, other: Any) -> Array:  # type: ignore[override]
+        operand = _operand(other)
+
+        if operand is None:
+            return NotImplemented
+
+        return self._compare(operand[0], operand[1], np.not_equal)
+
+    def __neg__(self) -> RationalArray:
+        return RationalArray._from_arrays(
+            -self._numerators,
+            self._denominators,
+        )
+
+    def __radd__(self, other: Any) -> RationalArray:
+        return self.__add__(other)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.to_list()!r})"
+
+    def __rmul__(self, other: Any) -> RationalArray:
+        return self.__mul__(other)
+
+    def __rsub__(self, other: Any) -> RationalArray:
+        operand = _operand(other)
+
+        if operand is None:
+            return NotImplemented
+
+        return (-self)._add(operand[0], operand[1])
+
+    def __rtruediv__(self, other: Any) -> RationalArray:
+        operand = _operand(other)
+
+        if operand is None:
+            return NotImplemented
+
+        return self.reciprocal._multiply(operand[0], operand[1])
+
+    def __sub__(self, other: Any) -> RationalArray:
+        operand = _operand(other)
+
+        if operand is None:
+            return NotImplemented
+
+        return self._add(-operand[0], operand[1])
+
+    def __truediv__(self, other: Any) -> RationalArray:
+        operand = _operand(other)
+
+        if operand is None:
+            return NotImplemented
+
+        n, d = _normalised(operand[1], operand[0])
+        return self._multiply(n, d)
+
+    def _add(self, numerators: Array, denominators: Array) -> RationalArray:
+        """
+        Adds `numerators` / `denominators` elementwise over the least common
+        multiples of the denominators.
+        """
+
+        n1, d1, n2, d2 = _common(
+            self._numerators,
+            self._denominators,
+            numerators,
+            denominators,
+        )
+
+        # Knuth, The Art of Computer Programming, volume 2, 4.5.1.
+        divisor = np.gcd(d1, d2)
+        divisor = np.where(divisor == 0, 1, divisor)
+        s1 = d1 // divisor
+        s2 = d2 // divisor
+
+        n1, s1, n2, s2, d2 = _widened(
+            max(
+                _magnitude(n1) * _magnitude(s2)
+                + _magnitude(n2) * _magnitude(s1),
+                _magnitude(s1) * _magnitude(d2),
+            ),
+            n1,
+            s1,
+            n2,
+            s2,
+            d2,
+        )
+
+        return RationalArray._from_arrays(n1 * s2 + n2 * s1, s1 * d2)
+
+    def _compare(
+        self,
+        numerators: Array,
+        denominators: Array,
+        comparison: Callable[[Array, Array], Array],
+    ) -> Array:
+        """
+        Compares each rational number with `numerators` / `denominators` by
+        cross-multiplying.
+        """
+
+        n1, d1, n2, d2 = _common(
+            self._numerators,
+            self._denominators,
+            numerators,
+            denominators,
+        )
+
+        n1, d1, n2, d2 = _widened(
+            max(
+                _magnitude(n1) * _magnitude(d2),
+                _magnitude(n2) * _magnitude(d1),
+            ),
+            n1,
+            d1,
+            n2,
+            d2,
+        )
+
+        return np.asarray(comparison(n1 * d2, n2 * d1), dtype=bool)
+
+    @classmethod
+    def _from_arrays(
+        cls,
+        numerators: Array,
+        denominators: Array,
+    ) -> RationalArray:
+        """
+        Creates an array from normalised numerators and denominators without
+        copying them.
+        """
+
+        array = object.__new__(cls)
+        array._numerators = numerators
+        array._denominators = denominators
+        return array
+
+    def _multiply(
+        self,
+        numerators: Array,
+        denominators: Array,
+    ) -> RationalArray:
+        """
+        Multiplies by `numerators` / `denominators` elementwise.
+        """
+
+        n1, d1, n2, d2 = _common(
+            self._numerators,
+            self._denominators,
+            numerators,
+            denominators,
+        )
+
+        n1, d1, n2, d2 = _widened(
+            max(
+                _magnitude(n1) * _magnitude(n2),
+                _magnitude(d1) * _magnitude(d2),
+            ),
+            n1,
+            d1,
+            n2,
+            d2,
+        )
+
+        return RationalArray._from_arrays(n1 * n2, d1 * d2)
+
+    @property
+    def denominators(self) -> Array:
+        """
+        Denominators. Do not modify.
+        """
+
+        return self._denominators
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """
+        Data type of the numerators and denominators: int64, or object if
+        any value is too large.
+        """
+
+        return self._numerators.dtype
+
+    @classmethod
+    def from_rationals(cls, values: Iterable[Rational | int]) -> RationalArray:
+        """
+        Creates an array from rational numbers and integers.
+        """
+
+        values = list(values)
+
+        return cls(
+            [value.numerator for value in values],
+            [value.denominator for value in values],
+        )
+
+    @property
+    def numerators(self) -> Array:
+        """
+        Numerators. Do not modify.
+        """
+
+        return self._numerators
+
+    def prod(self) -> Rational:
+        """
+        Gets the product of every rational number, or 1 if the array is
+        empty.
+
+        Values are multiplied in pairs, and each level of the tree is
+        reduced, so the operands of each level are about the same size.
+        """
+
+        return _tree(self, RationalArray.__mul__, Rational(1))
+
+    @property
+    def reciprocal(self) -> RationalArray:
+        """
+        Gets the reciprocal of each rational number.
+        """
+
+        n, d = _normalised(self._denominators, self._numerators)
+        return RationalArray._from_arrays(n, d)
+
+    def reduce(self) -> RationalArray:
+        """
+        Reduces each rational number by the greatest common divisor of its
+        numerator and denominator.
+
+        Object arrays are demoted to int64 if every reduced value fits.
+        """
+
+        divisor = np.gcd(self._numerators, self._denominators)
+        divisor = np.where(divisor == 0, 1, divisor)
+
+        return RationalArray._from_arrays(
+            *_common(
+                _compacted(self._numerators // divisor),
+                _compacted(self._denominators // divisor),
+            )
+        )
+
+    def sum(self) -> Rational:
+        """
+        Gets the sum of every rational number, or 0 if the array is empty.
+
+        Values are added in pairs, and each level of the tree is reduced, so
+        the operands of each level are about the same size.
+        """
+
+        return _tree(self, RationalArray.__add__, Rational(0))
+
+    def to_list(self) -> list[Rational]:
+        """
+        Gets a list of the rational numbers.
+        """
+
+        return list(self)
+
+
+def _common(*arrays: Array) -> tuple[Array, ...]:
+    """
+    Promotes every array to object if any array is object.
+    """
+
+    if all(array.dtype != object for array in arrays):
+        return arrays
+
+    return tuple(array.astype(object) for array in arrays)
+
+
+def _compacted(array: Array) -> Array:
+    """
+    Demotes an object array to int64 if every value fits.
+    """
+
+    if array.dtype == object and _magnitude(array) <= _INT64_MAX:
+        return array.astype(np.int64)
+
+    return array
+
+
+def _integers(values: Iterable[int] | Array) -> Array:
+    """
+    Copies integers into an int64 array, or an object array of Python
+    integers if any value is too large.
+    """
+
+    array = np.array(values)
+
+    if array.size == 0:
+        return array.astype(np.int64)
+
+    if array.dtype.kind == "i" and array.min() >= -_INT64_MAX:
+        return array.astype(np.int64)
+
+    if array.dtype.kind == "u" and array.max() <= _INT64_MAX:
+        return array.astype(np.int64)
+
+    if array.dtype.kind in "iu":
+        return array.astype(object)
+
+    if array.dtype == object:
+        if not all(isinstance(value, int) for value in array.flat):
+            raise TypeError("Values are not all integers")
+
+        return _compacted(array)
+
+    raise TypeError(f"{array.dtype} values are not integers")
+
+
+def _magnitude(array: Array) -> int:
+    """
+    Gets the largest absolute value in an array.
+    """
+
+    if array.size == 0:
+        return 0
+
+    return int(np.abs(array).max())
+
+
+def _normalised(numerators: Array, denominators: Array) -> tuple[Array, Array]:
+    """
+    Moves the signs of negative denominators to their numerators.
+    """
+
+    negative = denominators < 0
+
+    if not negative.any():
+        return numerators, denominators
+
+    return (
+        np.where(negative, -numerators, numerators),
+        np.where(negative, -denominators, denominators),
+    )
+
+
+def _operand(value: Any) -> tuple[Array, Array] | None:
+    """
+    Gets the numerators and denominators of an operand, or `None` if the
+    operand is not supported.
+    """
+
+    if isinstance(value, RationalArray):
+        return value._numerators, value._denominators
+
+    if isinstance(value, (int, Rational)):
+        return _scalar(value.numerator), _scalar(value.denominator)
+
+    if isinstance(value, np.integer):
+        return _scalar(int(value)), _scalar(1)
+
+    return None
+
+
+def _scalar(value: int) -> Array:
+    """
+    Gets an integer as a one-element array, which broadcasts to any length.
+    """
+
+    if -_INT64_MAX <= value <= _INT64_MAX:
+        return np.array([value], dtype=np.int64)
+
+    return np.array([value], dtype=object)
+
+
+def _tree(
+    array: RationalArray,
+    operation: Callable[[RationalArray, RationalArray], RationalArray],
+    empty: Rational,
+) -> Rational:
+    """
+    Reduces an array to a single rational number by applying `operation` to
+    pairs of values, level by level.
+    """
+
+    if len(array) == 0:
+        return empty
+
+    while len(array) > 1:
+        end = len(array) // 2 * 2
+        pairs = operation(array[:end:2], array[1:end:2]).reduce()
+
+        if end < len(array):
+            n, d = _common(
+                np.concatenate((pairs.numerators, array.numerators[end:])),
+                np.concatenate((pairs.denominators, array.denominators[end:])),
+            )
+            pairs = RationalArray._from_arrays(n, d)
+
+        array = pairs
+
+    return array[0].reduced
+
+
+def _widened(bound: int, *arrays: Array) -> tuple[Array, ...]:
+    """
+    Promotes int64 arrays to object arrays of Python integers if a result
+    could be as large as `bound`.
+    """
+
+    if bound <= _INT64_MAX or arrays[0].dtype == object:
+        return arrays
+
+    return tuple(array.astype(object) for array in arrays)
@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from struct import Struct
+from sys import byteorder
+from types import TracebackType
+from typing import Iterable, Iterator, Literal
+
+from vinculum.codec import read_pair, write_pair
+from vinculum.rational import Rational
+
+_BYTE_ORDER = 0 if byteorder == "little" else 1
+"""
+Byte order of the integer arrays: 0 for little-endian or 1 for big-endian.
+"""
+
+_HEADER = Struct("<4sB3xqqq")
+"""
+File header: magic bytes, byte order, number of rows, number of overflowed
+rows and the size of the overflow heap. The header is 32 bytes long, so the
+arrays that follow it are aligned.
+"""
+
+_MAGIC = b"VNCL"
+
+_MARKER = -(2**63)
+"""
+Numerator of a row whose numerator and denominator are in the overflow heap.
+"""
+
+_INT64_MAX = 2**63 - 1
+
+
+class RationalColumn:
+    """
+    A column of rational numbers with struct-of-arrays storage.
+
+    Numerators and denominators that fit in 64 bits are stored in two
+    `array("q")` arrays, so each row takes 16 bytes. Rows with larger
+    integers are written to an overflow heap instead, and are found by
+    bisecting the overflowed row indexes.
+
+    `Rational` objects are created only when rows are read.
+
+    A column can be saved to a file then reopened with `open`, which maps the
+    file into memory rather than reading it. A mapped column is read-only and
+    should be closed when it is no longer needed.
+    """
+
+    __slots__ = (
+        "_denominators",
+        "_heap",
+        "_mmap",
+        "_numerators",
+        "_overflow_offsets",
+        "_overflow_rows",
+    )
+
+    def __init__(self, rationals: Iterable[Rational | int] = ()) -> None:
+        self._denominators: array[int] | memoryview = array("q")
+        self._heap: bytearray | memoryview = bytearray()
+        self._mmap: mmap | None = None
+        self._numerators: array[int] | memoryview = array("q")
+        self._overflow_offsets: array[int] | memoryview = array("q")
+        self._overflow_rows: array[int] | memoryview = array("q")
+
+        self.extend(rationals)
+
+    def __enter__(self) -> RationalColumn:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __getitem__(self, index: int) -> Rational:
+        numerator = self._numerators[index]
+
+        if numerator != _MARKER:
+            return Rational(numerator, self._denominators[index])
+
+        if index < 0:
+            index += len(self._numerators)
+
+        position = bisect_left(self._overflow_rows, index)
+        offset = self._overflow_offsets[position]
+        numerator, denominator, _ = read_pair(self._heap, offset)
+        return Rational(numerator, denominator)
+
+    def __iter__(self) -> Iterator[Rational]:
+        heap = self._heap
+        offsets = iter(self._overflow_offsets)
+
+        for numerator, denominator in zip(
+            self._numerators,
+            self._denominators,
+        ):
+            if numerator == _MARKER:
+                numerator, denominator, _ = read_pair(heap, next(offsets))
+
+            yield Rational(numerator, denominator)
+
+    def __len__(self) -> int:
+        return len(self._numerators)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(rows={len(self._numerators)}, "
+            f"overflows={len(self._overflow_rows)}, "
+            f"mapped={self._mmap is not None})"
+        )
+
+    @classmethod
+    def _from_view(cls, view: memoryview) -> RationalColumn:
+        """
+        Creates a column of views into the bytes written by `save`.
+        """
+
+        if len(view) < _HEADER.size:
+            raise ValueError(f"Unexpected end of data at byte {len(view)}")
+
+        magic, order, count, overflows, heap_size = _HEADER.unpack_from(view)
+
+        if magic != _MAGIC:
+            raise ValueError("Data is not a Vinculum column")
+
+        if order != _BYTE_ORDER:
+            raise ValueError("Column was written with a different byte order")
+
+        expected = _HEADER.size + 16 * (count + overflows) + heap_size
+
+        if len(view) != expected:
+            raise ValueError(
+                f"Expected {expected} bytes of column data but found "
+                f"{len(view)}"
+            )
+
+        column = cls()
+        offset = _HEADER.size
+
+        column._numerators, offset = _cast(view, offset, count, "q")
+        column._denominators, offset = _cast(view, offset, count, "q")
+        column._overflow_rows, offset = _cast(view, offset, overflows, "q")
+        column._overflow_offsets, offset = _cast(view, offset, overflows, "q")
+        column._heap, _ = _cast(view, offset, heap_size, "B")
+
+        return column
+
+    def _writable(
+        self,
+    ) -> tuple[array[int], array[int], array[int], array[int], bytearray]:
+        """
+        Gets the numerators, denominators, overflowed row indexes, overflow
+        offsets and overflow heap.
+
+        Raises `ValueError` if the column is mapped.
+        """
+
+        numerators = self._numerators
+        denominators = self._denominators
+        rows = self._overflow_rows
+        offsets = self._overflow_offsets
+        heap = self._heap
+
+        if (
+            isinstance(numerators, array)
+            and isinstance(denominators, array)
+            and isinstance(rows, array)
+            and isinstance(offsets, array)
+            and isinstance(heap, bytearray)
+        ):
+            return numerators, denominators, rows, offsets, heap
+
+        raise ValueError("A mapped column is read-only")
+
+    def append(self, rational: Rational | int) -> None:
+        """
+        Appends a rational number or integer.
+        """
+
+        self.extend((rational,))
+
+    def close(self) -> None:
+        """
+        Unmaps the file of a mapped column. The column is empty afterwards.
+
+        Does nothing if the column is not mapped.
+        """
+
+        if self._mmap is None:
+            return
+
+        for view in (
+            self._numerators,
+            self._denominators,
+            self._overflow_rows,
+            self._overflow_offsets,
+            self._heap,
+        ):
+            if isinstance(view, memoryview):
+                view.release()
+
+        self._mmap.close()
+        self._mmap = None
+
+        self._denominators = array("q")
+        self._heap = bytearray()
+        self._numerators = array("q")
+        self._overflow_offsets = array("q")
+        self._overflow_rows = array("q")
+
+    def extend(self, rationals: Iterable[Rational | int]) -> None:
+        """
+        Appends rational numbers and integers.
+        """
+
+        numerators, denominators, rows, offsets, heap = self._writable()
+
+        for rational in rationals:
+            numerator = rational.numerator
+            denominator = rational.denominator
+
+            if _MARKER < numerator <= _INT64_MAX and denominator <= _INT64_MAX:
+                numerators.append(numerator)
+                denominators.append(denominator)
+                continue
+
+            rows.append(len(numerators))
+            offsets.append(len(heap))
+            write_pair(heap, numerator, denominator)
+
+            numerators.append(_MARKER)
+            denominators.append(0)
+
+    @property
+    def mapped(self) -> bool:
+        """
+        Whether or not the column is mapped from a file.
+        """
+
+        return self._mmap is not None
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Number of bytes held by the arrays and overflow heap.
+        """
+
+        return sum(
+            memoryview(part).nbytes
+            for part in (
+                self._numerators,
+                self._denominators,
+                self._overflow_rows,
+                self._overflow_offsets,
+                self._heap,
+            )
+        )
+
+    @classmethod
+    def open(cls, path: str | Path) -> RationalColumn:
+        """
+        Maps a column that was written by `save`. The file is not read, so
+        opening a column takes the same time regardless of its size.
+
+        Raises `ValueError` if the file is not a column, was written on a
+        machine with a different byte order or is truncated.
+        """
+
+        with open(path, "rb") as f:
+            mapped = mmap(f.fileno(), 0, access=ACCESS_READ)
+
+        view = memoryview(mapped)
+
+        try:
+            column = cls._from_view(view)
+        except ValueError:
+            view.release()
+            mapped.close()
+            raise
+
+        view.release()
+        column._mmap = mapped
+        return column
+
+    @property
+    def overflows(self) -> int:
+        """
+        Number of rows stored in the overflow heap.
+        """
+
+        return len(self._overflow_rows)
+
+    def save(self, path: str | Path) -> None:
+        """
+        Writes the column to a file that can be mapped by `open`.
+        """
+
+        with open(path, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    _BYTE_ORDER,
+                    len(self._numerators),
+                    len(self._overflow_rows),
+                    len(self._heap),
+                )
+            )
+
+            f.write(self._numerators)
+            f.write(self._denominators)
+            f.write(self._overflow_rows)
+            f.write(self._overflow_offsets)
+            f.write(self._heap)
+
+
+def _cast(
+    view: memoryview,
+    offset: int,
+    count: int,
+    item_format: Literal["B", "q"],
+) -> tuple[memoryview, int]:
+    """
+    Gets a view of `count` items of `item_format` starting at byte `offset`
+    of `view`, and the offset of the first byte after them.
+    """
+
+    end = offset + count * (8 if item_format == "q" else 1)
+    return view[offset:end].cast(item_format), end
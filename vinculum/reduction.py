@@ -0,0 +1,110 @@
+from math import gcd
+
+from vinculum import tracing
+from vinculum.log import log
+from vinculum.math import euclid_steps
+from vinculum.rational import Rational
+
+
+class Reduction:
+    """
+    A resumable reduction of a rational number.
+
+    Euclid's algorithm is advanced a few steps at a time by `advance`, so the
+    cost of reducing a rational number with huge operands can be spread over
+    many calls rather than paid in one stall.
+    """
+
+    def __init__(self, rational: Rational) -> None:
+        self._rational = rational
+
+        a = abs(rational.numerator)
+        b = rational.denominator
+
+        self._a = max(a, b)
+        self._b = min(a, b)
+        self._steps = 0
+
+    def __repr__(self) -> str:
+        state = "complete" if self.complete else "incomplete"
+        return f"Reduction({self._rational!r}, {self._steps} steps, {state})"
+
+    def advance(self, max_steps: int) -> bool:
+        """
+        Performs up to `max_steps` more steps of Euclid's algorithm.
+
+        Returns `True` if the reduction is complete.
+        """
+
+        if self._b == 0:
+            return True
+
+        self._a, self._b, steps = euclid_steps(self._a, self._b, max_steps)
+        self._steps += steps
+
+        if tracing.enabled:
+            log.debug(
+                "Advanced the reduction of %s by %i steps (%i in total)",
+                self._rational,
+                steps,
+                self._steps,
+            )
+
+        return self._b == 0
+
+    @property
+    def complete(self) -> bool:
+        """
+        Whether or not the greatest common divisor has been found.
+        """
+
+        return self._b == 0
+
+    @property
+    def rational(self) -> Rational:
+        """
+        The rational number being reduced.
+        """
+
+        return self._rational
+
+    def result(self) -> Rational:
+        """
+        Gets the reduced rational number.
+
+        If the reduction is incomplete then the remaining work is finished in
+        a single call. The result is remembered by the rational number, so
+        reducing it again is free.
+        """
+
+        if self._b != 0:
+            if tracing.enabled:
+                log.debug("Finishing the reduction of %s", self._rational)
+
+            self._a = gcd(self._a, self._b)
+            self._b = 0
+
+        divisor = self._a
+        rational = self._rational
+
+        if divisor == 0:
+            return rational
+
+        if divisor == 1:
+            result = rational
+        else:
+            result = Rational(
+                rational.numerator // divisor,
+                rational.denominator // divisor,
+            )
+
+        rational._record_reduced(result)  # pylint: disable=protected-access
+        return result
+
+    @property
+    def steps(self) -> int:
+        """
+        The number of steps of Euclid's algorithm performed so far.
+        """
+
+        return self._steps
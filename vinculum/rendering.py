@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from sys import getsizeof
+from typing import Optional
+
+DecimalKey = tuple[int, int, bool, Optional[str]]
+"""
+The reduced numerator and denominator of a rational number, and whether
+recursion was tracked and the recurring prefix it was rendered with.
+"""
+
+
+class DecimalEntry:
+    """
+    A cached decimal string.
+    """
+
+    __slots__ = ("complete", "cycle_end", "decimal", "max_dp", "point", "size")
+
+    def __init__(
+        self,
+        decimal: str,
+        max_dp: int,
+        point: int,
+        cycle_end: int | None,
+    ) -> None:
+        self.cycle_end = cycle_end
+        """
+        Number of fractional digits before the end of the first recurring
+        cycle, or `None` if no recurring digits are marked.
+        """
+
+        self.decimal = decimal
+
+        self.max_dp = max_dp
+        """
+        Maximum number of decimal places that the decimal was rendered with.
+        """
+
+        self.point = point
+        """
+        Index of the decimal point.
+        """
+
+        self.complete = (
+            cycle_end is not None or len(decimal) - point - 1 < max_dp
+        )
+        """
+        Whether or not the decimal describes the rational number without
+        truncation, so is the same for any greater `max_dp`.
+        """
+
+        self.size = getsizeof(decimal)
+
+    def truncate(
+        self, max_dp: int, recurring_prefix: str | None
+    ) -> str | None:
+        """
+        Gets the decimal string with at most `max_dp` decimal places, or `None`
+        if it cannot be derived from this entry.
+        """
+
+        if max_dp == self.max_dp:
+            return self.decimal
+
+        if max_dp > self.max_dp:
+            return self.decimal if self.complete else None
+
+        if self.cycle_end is None:
+            # Unmarked digits are the same for any fewer decimal places.
+            return self.decimal[: self.point + 1 + max_dp]
+
+        if max_dp > self.cycle_end:
+            # The same recurring cycle is marked.
+            return self.decimal
+
+        if recurring_prefix and any(c.isdigit() for c in recurring_prefix):
+            return None
+
+        # Fewer decimal places than the cycle renders its digits unmarked.
+        start = self.point + 1
+        digits = self.decimal[start:]
+
+        if recurring_prefix:
+            digits = digits.replace(recurring_prefix, "")
+
+        return self.decimal[:start] + digits[:max_dp]
+
+
+class DecimalCache:
+    """
+    A bounded cache of decimal strings rendered by `Rational.decimal`.
+
+    Decimals are keyed on the reduced rational number, `recursion` and
+    `recurring_prefix`. A decimal cached with more decimal places is
+    truncated to answer requests for fewer.
+
+    When the cache holds more than `max_entries` decimals or `max_bytes` bytes,
+    the least recently used decimals are evicted.
+    """
+
+    __slots__ = (
+        "_bytes",
+        "_entries",
+        "_hits",
+        "_max_bytes",
+        "_max_entries",
+        "_misses",
+    )
+
+    def __init__(
+        self,
+        max_entries: int = 1_024,
+        max_bytes: int | None = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"Maximum entries {max_entries} is less than 1")
+
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(f"Maximum bytes {max_bytes} is less than 1")
+
+        self._bytes = 0
+        self._entries: OrderedDict[DecimalKey, DecimalEntry] = OrderedDict()
+        self._hits = 0
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_entries={self._max_entries}, "
+            f"max_bytes={self._max_bytes}, size={len(self._entries)}, "
+            f"bytes={self._bytes}, hits={self._hits}, misses={self._misses})"
+        )
+
+    @property
+    def bytes(self) -> int:
+        """
+        Approximate number of bytes held by the cached decimals.
+        """
+
+        return self._bytes
+
+    def clear(self) -> None:
+        """
+        Evicts every decimal and resets the statistics.
+        """
+
+        self._bytes = 0
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: DecimalKey, max_dp: int) -> str | None:
+        """
+        Gets the decimal string cached for `key` with at most `max_dp` decimal
+        places, or `None` if there is no such decimal.
+        """
+
+        entry = self._entries.get(key)
+        decimal = None if entry is None else entry.truncate(max_dp, key[3])
+
+        if decimal is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return decimal
+
+    @property
+    def hits(self) -> int:
+        """
+        Number of decimals found in the cache.
+        """
+
+        return self._hits
+
+    @property
+    def max_bytes(self) -> int | None:
+        """
+        Maximum number of bytes to hold, or `None` if there is no maximum.
+        """
+
+        return self._max_bytes
+
+    @property
+    def max_entries(self) -> int:
+        """
+        Maximum number of decimals to hold.
+        """
+
+        return self._max_entries
+
+    @property
+    def misses(self) -> int:
+        """
+        Number of decimals not found in the cache.
+        """
+
+        return self._misses
+
+    def put(self, key: DecimalKey, entry: DecimalEntry) -> None:
+        """
+        Caches a decimal, evicting the least recently used decimals if the
+        cache is full.
+
+        Decimals larger than `max_bytes` are not cached.
+        """
+
+        if self._max_bytes is not None and entry.size > self._max_bytes:
+            return
+
+        entries = self._entries
+        previous = entries.pop(key, None)
+
+        if previous is not None:
+            self._bytes -= previous.size
+
+        entries[key] = entry
+        self._bytes += entry.size
+
+        while len(entries) > self._max_entries or (
+            self._max_bytes is not None and self._bytes > self._max_bytes
+        ):
+            _, evicted = entries.popitem(last=False)
+            self._bytes -= evicted.size
+
+
+_cache: DecimalCache | None = None
+
+
+def get_decimal_cache() -> DecimalCache | None:
+    """
+    Gets the decimal cache in effect, or `None` if decimals are not cached.
+    """
+
+    return _cache
+
+
+def set_decimal_cache(cache: DecimalCache | None) -> None:
+    """
+    Sets the cache of decimal strings rendered by `Rational.decimal`. Set
+    `None` to stop caching.
+
+    For example:
+
+        set_decimal_cache(DecimalCache(max_entries=256, max_bytes=1_000_000))
+    """
+
+    global _cache  # pylint: disable=global-statement
+    _cache = cache
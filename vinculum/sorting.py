@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable, Iterator
+
+from vinculum.rational import Rational, _approximate
+
+
+def sort_key(rational: Rational) -> tuple[float, Rational]:
+    """
+    Gets a key that sorts rational numbers exactly.
+
+    The key pairs the nearest floating-point approximation with the rational
+    number itself. Rounding to a float never reverses an order, so keys with
+    different approximations are ordered by comparing the floats alone. The
+    rational numbers are compared exactly only when the approximations are
+    equal, including when both are infinite.
+
+    For example:
+
+        sorted(rationals, key=sort_key)
+    """
+
+    return _approximate(rational), rational
+
+
+class SortedRationals:
+    """
+    A collection of rational numbers kept in ascending order.
+
+    Values are stored with their sort keys, so inserting, bisecting and
+    querying ranges compare floating-point approximations and fall back to
+    exact comparisons only when they collide.
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self, rationals: Iterable[Rational] = ()) -> None:
+        self._keys = sorted(map(sort_key, rationals))
+
+    def __contains__(self, rational: Rational) -> bool:
+        key = sort_key(rational)
+        index = bisect_left(self._keys, key)
+        return index < len(self._keys) and self._keys[index] == key
+
+    def __getitem__(self, index: int) -> Rational:
+        return self._keys[index][1]
+
+    def __iter__(self) -> Iterator[Rational]:
+        for _, rational in self._keys:
+            yield rational
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def add(self, rational: Rational) -> None:
+        """
+        Inserts `rational` after any equal values.
+        """
+
+        insort(self._keys, sort_key(rational))
+
+    def bisect_left(self, rational: Rational) -> int:
+        """
+        Gets the index at which `rational` would be inserted before any equal
+        values.
+        """
+
+        return bisect_left(self._keys, sort_key(rational))
+
+    def bisect_right(self, rational: Rational) -> int:
+        """
+        Gets the index at which `rational` would be inserted after any equal
+        values.
+        """
+
+        return bisect_right(self._keys, sort_key(rational))
+
+    def irange(
+        self,
+        minimum: Rational | None = None,
+        maximum: Rational | None = None,
+    ) -> Iterator[Rational]:
+        """
+        Iterates over the values between `minimum` and `maximum` inclusive.
+
+        If `minimum` or `maximum` is `None` then the range is unbounded in that
+        direction.
+        """
+
+        start = 0 if minimum is None else self.bisect_left(minimum)
+        stop = (
+            len(self._keys) if maximum is None else self.bisect_right(maximum)
+        )
+
+        for index in range(start, stop):
+            yield self._keys[index][1]
+
+    def remove(self, rational: Rational) -> None:
+        """
+        Removes one value equal to `rational`.
+
+        Raises `ValueError` if there is no such value.
+        """
+
+        key = sort_key(rational)
+        index = bisect_left(self._keys, key)
+
+        if index == len(self._keys) or self._keys[index] != key:
+            raise ValueError(f"{rational} is not in the collection")
+
+        del self._keys[index]
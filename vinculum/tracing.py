@@ -0,0 +1,36 @@
+from os import environ
+
+enabled = environ.get("VINCULUM_TRACING", "") not in ("", "0")
+"""
+Whether or not Vinculum logs debug messages describing its work.
+
+Tracing is disabled unless the `VINCULUM_TRACING` environment variable is set
+to anything other than "0" when Vinculum is imported. When tracing is
+disabled, arithmetic and parsing make no logging calls at all.
+"""
+
+
+def disable_tracing() -> None:
+    """
+    Stops logging debug messages.
+    """
+
+    global enabled  # pylint: disable=global-statement
+    enabled = False
+
+
+def enable_tracing() -> None:
+    """
+    Starts logging debug messages to the "vinculum" logger.
+    """
+
+    global enabled  # pylint: disable=global-statement
+    enabled = True
+
+
+def tracing_enabled() -> bool:
+    """
+    Gets whether or not debug messages are logged.
+    """
+
+    return enabled